@@ -20,6 +20,9 @@ from pms_app.devices import DeviceFactory
 from pms_app.automation import OperationManager
 from pms_app.utils.logger import setup_logger
 
+# 제어 레지스터에 없는 주소를 찾을 때 추가로 검색할 메모리 맵 섹션 (순서대로 검색)
+_FALLBACK_REGISTER_SECTIONS = ('parameter_registers', 'data_registers', 'metering_registers')
+
 
 def load_config() -> Dict[str, Any]:
     """설정 파일 로드"""
@@ -82,9 +85,13 @@ async def handle_control_command(device_handler_map: Dict[str, Any], mqtt_client
         action = command_data.get('action')
         logger.info(f"🎬 액션 실행: {action}")
         
-        if action == 'write_register':
-            logger.info(f"📝 레지스터 쓰기 명령 실행 중...")
-            success = await execute_write_register(device_handler, command_data, logger)
+        if action in ('write_register', 'write_registers'):
+            if action == 'write_register':
+                logger.info(f"📝 레지스터 쓰기 명령 실행 중...")
+                success = await execute_write_register(device_handler, command_data, logger)
+            else:
+                logger.info(f"📝 레지스터 일괄 쓰기 명령 실행 중...")
+                success = await execute_write_registers(device_handler, command_data, logger)
             
             logger.info(f"📊 명령 실행 결과: {'성공' if success else '실패'}")
             
@@ -166,6 +173,37 @@ async def execute_write_register(device_handler, command_data: Dict[str, Any], l
         return False
 
 
+async def execute_write_registers(device_handler, command_data: Dict[str, Any], logger) -> bool:
+    """레지스터 일괄 쓰기 명령 실행 (writes 순서대로 실행, stop_on_error가 False가 아니면 실패 시 중단)"""
+    writes = command_data.get('writes')
+    if not isinstance(writes, list) or not writes:
+        logger.error(f"❌ 일괄 쓰기 목록 누락: writes={writes}")
+        return False
+    
+    description = command_data.get('description', '레지스터 일괄 쓰기')
+    stop_on_error = command_data.get('stop_on_error', True)
+    total = len(writes)
+    all_success = True
+    for index, write in enumerate(writes, 1):
+        if not isinstance(write, dict):
+            logger.error(f"❌ 잘못된 쓰기 항목 형식 [{index}/{total}]: {write}")
+            return False
+        
+        single_command = {
+            'address': write.get('address'),
+            'value': write.get('value'),
+            'description': f"{write.get('description', description)} [{index}/{total}]"
+        }
+        if not await execute_write_register(device_handler, single_command, logger):
+            if stop_on_error:
+                logger.error(f"❌ 일괄 쓰기 중단: {index}/{total}번째 쓰기 실패")
+                return False
+            logger.error(f"❌ 일괄 쓰기 {index}/{total}번째 실패 - 나머지 계속 실행")
+            all_success = False
+    
+    return all_success
+
+
 def find_register_name_by_address(device_handler, address: int) -> Optional[str]:
     """주소로부터 레지스터 이름 찾기"""
     logger = logging.getLogger("PMS_Control")
@@ -187,8 +225,7 @@ def find_register_name_by_address(device_handler, address: int) -> Optional[str]
                 return register_name
         
         # 다른 섹션에서도 검색 (파라미터 등)
-        sections = ['parameter_registers', 'data_registers', 'metering_registers']
-        for section in sections:
+        for section in _FALLBACK_REGISTER_SECTIONS:
             section_data = memory_map.get(section, {})
             logger.info(f"📂 {section} 검색: {len(section_data)}개 레지스터")
             
@@ -337,6 +374,7 @@ async def main():
     mqtt_client = None
     scheduler = None
     operation_manager = None
+    device_handlers = []
     
     try:
         # 설정 로드
@@ -501,6 +539,14 @@ async def main():
             except Exception as e:
                 logger.error(f"스케줄러 종료 중 오류: {e}")
         
+        # 대기 중인 PCS 전력 설정점 병합 태스크 정리
+        for handler in device_handlers:
+            if hasattr(handler, 'cancel_power_reference'):
+                try:
+                    await handler.cancel_power_reference()
+                except Exception as e:
+                    logger.error(f"PCS 전력 설정점 태스크 정리 중 오류: {e}")
+        
         if mqtt_client is not None:
             try:
                 await mqtt_client.disconnect()
@@ -23,6 +23,9 @@ import json
 from datetime import datetime
 from typing import Optional, Dict, Any
 
+# 제어 레지스터에 없는 주소를 찾을 때 추가로 검색할 메모리 맵 섹션 (순서대로 검색)
+_FALLBACK_REGISTER_SECTIONS = ('parameter_registers', 'data_registers', 'metering_registers')
+
 
 class IntegratedPMSApp:
     """GUI + 서버 통합 PMS 애플리케이션"""
@@ -370,9 +373,13 @@ class IntegratedPMSApp:
             action = command_data.get('action')
             self.logger.info(f"🎬 액션 실행: {action}")
             
-            if action == 'write_register':
-                self.logger.info(f"📝 레지스터 쓰기 명령 실행 중...")
-                success = await self.execute_write_register(device_handler, command_data)
+            if action in ('write_register', 'write_registers'):
+                if action == 'write_register':
+                    self.logger.info(f"📝 레지스터 쓰기 명령 실행 중...")
+                    success = await self.execute_write_register(device_handler, command_data)
+                else:
+                    self.logger.info(f"📝 레지스터 일괄 쓰기 명령 실행 중...")
+                    success = await self.execute_write_registers(device_handler, command_data)
                 
                 self.logger.info(f"📊 명령 실행 결과: {'성공' if success else '실패'}")
                 
@@ -483,6 +490,40 @@ class IntegratedPMSApp:
             self.logger.error(f"❌ 스택 트레이스:\n{traceback.format_exc()}")
             return False
     
+    async def execute_write_registers(self, device_handler, command_data: Dict[str, Any]) -> bool:
+        """레지스터 일괄 쓰기 명령 실행 (writes 순서대로 실행, stop_on_error가 False가 아니면 실패 시 중단)"""
+        writes = command_data.get('writes')
+        if not isinstance(writes, list) or not writes:
+            if self.logger:
+                self.logger.error(f"❌ 일괄 쓰기 목록 누락: writes={writes}")
+            return False
+        
+        description = command_data.get('description', '레지스터 일괄 쓰기')
+        stop_on_error = command_data.get('stop_on_error', True)
+        total = len(writes)
+        all_success = True
+        for index, write in enumerate(writes, 1):
+            if not isinstance(write, dict):
+                if self.logger:
+                    self.logger.error(f"❌ 잘못된 쓰기 항목 형식 [{index}/{total}]: {write}")
+                return False
+            
+            single_command = {
+                'address': write.get('address'),
+                'value': write.get('value'),
+                'description': f"{write.get('description', description)} [{index}/{total}]"
+            }
+            if not await self.execute_write_register(device_handler, single_command):
+                if stop_on_error:
+                    if self.logger:
+                        self.logger.error(f"❌ 일괄 쓰기 중단: {index}/{total}번째 쓰기 실패")
+                    return False
+                if self.logger:
+                    self.logger.error(f"❌ 일괄 쓰기 {index}/{total}번째 실패 - 나머지 계속 실행")
+                all_success = False
+        
+        return all_success
+    
     def find_register_name_by_address(self, device_handler, address: int) -> Optional[str]:
         """주소로부터 레지스터 이름 찾기"""
         try:
@@ -502,8 +543,7 @@ class IntegratedPMSApp:
                     return register_name
             
             # 다른 섹션에서도 검색 (파라미터 등)
-            sections = ['parameter_registers', 'data_registers', 'metering_registers']
-            for section in sections:
+            for section in _FALLBACK_REGISTER_SECTIONS:
                 section_data = memory_map.get(section, {})
                 self.logger.info(f"📂 {section} 검색: {len(section_data)}개 레지스터")
                 
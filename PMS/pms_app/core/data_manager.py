@@ -77,6 +77,7 @@ class SharedDataManager:
         with self.data_lock:
             self.device_data[device_name] = {
                 'timestamp': datetime.now(),
+                'mono_ts': time.monotonic(),  # 신선도 계산용 (시스템 시계 변경 영향 없음)
                 'data': data
             }
             self.system_status['last_update'] = datetime.now()
@@ -114,6 +115,11 @@ class SharedDataManager:
             self.system_status.update(kwargs)
             self.system_status['last_update'] = datetime.now()
     
+    def get_last_update(self) -> Optional[datetime]:
+        """마지막 데이터/상태 갱신 시각 조회 (변경 감지용, 복사 없음)"""
+        with self.data_lock:
+            return self.system_status['last_update']
+    
     def get_system_status(self) -> Dict[str, Any]:
         """시스템 상태 조회"""
         with self.data_lock:
@@ -132,8 +138,7 @@ class SharedDataManager:
             if not device_data:
                 return False
             
-            timestamp = device_data['timestamp']
-            age = (datetime.now() - timestamp).total_seconds()
+            age = time.monotonic() - device_data['mono_ts']
             return age <= max_age_seconds
     
     def get_device_handler(self, device_name: str):
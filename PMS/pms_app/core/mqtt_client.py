@@ -6,23 +6,38 @@ MQTT 클라이언트 모듈
 import asyncio
 import json
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 import paho.mqtt.client as mqtt
 import time
 import uuid
 from datetime import datetime
 import threading
 import inspect  # 추가: 함수 타입 검사용
+import traceback
 from queue import Queue, Empty
 import concurrent.futures
 from dataclasses import dataclass
 
+# 수신 JSON 파싱 / 발행 페이로드 직렬화 (orjson이 설치되어 있으면 사용, bytes 직접 입출력)
+try:
+    import orjson
+    _loads = orjson.loads
+    
+    def _dumps(obj: Any) -> bytes:
+        # datetime은 기존 json.dumps(default=str)와 같은 문자열 형식 유지
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME, default=str)
+except ImportError:
+    _loads = json.loads
+    
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, default=str).encode('utf-8')
+
 
 @dataclass
 class MQTTMessage:
     """MQTT 메시지 데이터 클래스"""
     topic: str
-    payload: Dict[str, Any]
+    payload: Union[Dict[str, Any], bytes]  # bytes는 이미 직렬화된 JSON
     qos: int = 0
     retain: bool = False
     timestamp: Optional[float] = None
@@ -165,10 +180,12 @@ class MQTTPublisher:
                 self.logger.debug(f"📋 MQTT 연결 끊어짐 - 메시지 버림: {message.topic}")
                 return False
             
-            # JSON 직렬화
-            json_payload = json.dumps(message.payload, ensure_ascii=False, default=str)
-            # UTF-8 기준 실제 전송 바이트(한글 3바이트/문자) 측정
-            payload_size = len(json_payload.encode('utf-8'))
+            # JSON 직렬화 (이미 직렬화된 bytes는 그대로 전송, UTF-8 bytes이므로 길이가 곧 전송 크기)
+            if isinstance(message.payload, (bytes, bytearray)):
+                json_payload = message.payload
+            else:
+                json_payload = _dumps(message.payload)
+            payload_size = len(json_payload)
             
             # 실제 발행
             result = self.mqtt_client.client.publish(
@@ -221,7 +238,7 @@ class MQTTPublisher:
         
         self.publish_stats['avg_publish_time'] = sum(self.publish_times) / len(self.publish_times)
     
-    def queue_message(self, topic: str, payload: Dict[str, Any], qos: int = 0, retain: bool = False) -> bool:
+    def queue_message(self, topic: str, payload: Union[Dict[str, Any], bytes], qos: int = 0, retain: bool = False) -> bool:
         """메시지를 발행 큐에 추가"""
         try:
             message = MQTTMessage(topic, payload, qos, retain)
@@ -320,6 +337,20 @@ class MQTTClient:
         
         # 사용자 정의 메시지 콜백
         self.message_callback = None
+        # 코루틴 콜백을 실행할 이벤트 루프 (connect()를 호출한 루프, 메시지마다 새 루프 생성 방지)
+        self.callback_loop = None
+        # 수신 콜백 실행용 공용 스레드 풀 (메시지마다 스레드를 새로 만들지 않고 재사용)
+        max_callback_workers = config.get('max_callback_workers', 4)
+        self.callback_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_callback_workers,
+            thread_name_prefix="MQTTCallback"
+        )
+        # 실행 대기 중인 콜백 수 상한 (브로커 폭주 시 스레드 풀 대기열이 무한히 쌓이지 않도록)
+        self.max_pending_callbacks = config.get('max_pending_callbacks', 100)
+        self.callback_slots = threading.BoundedSemaphore(self.max_pending_callbacks)
+        self.dropped_callbacks = 0
+        # 코루틴 콜백 완료 대기 시간(초) - 초과 시 취소하고 스레드 풀 슬롯 반환
+        self.callback_timeout = config.get('callback_timeout', 30)
         
         # 개선된 재연결 설정
         self.client.reconnect_delay_set(min_delay=1, max_delay=30)
@@ -488,8 +519,6 @@ class MQTTClient:
     
     def _threaded_reconnect(self):
         """스레드 기반 재연결 (이벤트 루프가 없는 경우)"""
-        import time
-        
         if self.is_reconnecting:
             return
             
@@ -608,15 +637,21 @@ class MQTTClient:
         """메시지 수신 콜백"""
         try:
             topic = msg.topic
-            payload = msg.payload.decode('utf-8')
             self.logger.info(f"📨 [MQTT 메시지 수신] 토픽: {topic}")
             
             if self.message_callback:
+                # 콜백 대기열이 가득 차면 파싱 전에 버림 (실행 중/대기 중 콜백이 끝나면 다시 수용)
+                if not self.callback_slots.acquire(blocking=False):
+                    self.dropped_callbacks += 1
+                    self.logger.warning(f"⚠️ 콜백 대기열 포화 ({self.max_pending_callbacks}개) - 메시지 무시: {topic} (누적 {self.dropped_callbacks}개)")
+                    return
+                
                 # JSON 파싱 시도
                 try:
-                    json_payload = json.loads(payload)
+                    json_payload = _loads(msg.payload)
                     self.logger.debug(f"📄 [수신 내용] {json_payload}")
-                except json.JSONDecodeError:
+                except ValueError:  # json.JSONDecodeError / orjson.JSONDecodeError
+                    payload = msg.payload.decode('utf-8', errors='replace')
                     json_payload = {"raw_message": payload}
                     self.logger.warning(f"⚠️ JSON 파싱 실패, 원본 텍스트로 처리: {payload}")
                 
@@ -631,16 +666,26 @@ class MQTTClient:
                             if inspect.iscoroutinefunction(self.message_callback):
                                 self.logger.info("🔄 코루틴 콜백 감지 - 비동기 실행")
                                 
-                                # 새로운 이벤트 루프에서 코루틴 실행
+                                # connect()를 호출한 실행 중인 루프에 위임 (없으면 임시 루프에서 실행)
                                 try:
-                                    loop = asyncio.new_event_loop()
-                                    asyncio.set_event_loop(loop)
-                                    loop.run_until_complete(self.message_callback(topic, json_payload))
-                                    loop.close()
-                                    self.logger.info("✅ 코루틴 콜백 실행 완료")
+                                    loop = self.callback_loop
+                                    if loop is not None and loop.is_running():
+                                        future = asyncio.run_coroutine_threadsafe(
+                                            self.message_callback(topic, json_payload), loop
+                                        )
+                                        try:
+                                            future.result(timeout=self.callback_timeout)
+                                            self.logger.info("✅ 코루틴 콜백 실행 완료")
+                                        except concurrent.futures.TimeoutError:
+                                            future.cancel()
+                                            self.logger.warning(
+                                                f"⏱️ 코루틴 콜백 시간 초과 ({self.callback_timeout}초) - 취소: {topic}"
+                                            )
+                                    else:
+                                        asyncio.run(self.message_callback(topic, json_payload))
+                                        self.logger.info("✅ 코루틴 콜백 실행 완료")
                                 except Exception as coro_error:
                                     self.logger.error(f"❌ 코루틴 콜백 실행 중 오류: {coro_error}")
-                                    import traceback
                                     self.logger.error(f"❌ 코루틴 스택 트레이스:\n{traceback.format_exc()}")
                                     
                             else:
@@ -653,19 +698,23 @@ class MQTTClient:
                             
                     except Exception as callback_error:
                         self.logger.error(f"❌ 콜백 실행 중 오류: {callback_error}")
-                        import traceback
                         self.logger.error(f"❌ 콜백 스택 트레이스:\n{traceback.format_exc()}")
+                    finally:
+                        self.callback_slots.release()
                 
-                # 별도 스레드에서 안전하게 실행
-                thread = threading.Thread(target=run_callback_safe, daemon=True)
-                thread.start()
-                self.logger.info(f"🧵 콜백 스레드 시작: {thread.name}")
+                # 공용 콜백 스레드 풀에서 안전하게 실행 (MQTT 네트워크 스레드 블로킹 방지)
+                try:
+                    self.callback_executor.submit(run_callback_safe)
+                except RuntimeError:
+                    # 종료된 스레드 풀 (shutdown 이후 수신된 메시지)
+                    self.callback_slots.release()
+                    raise
+                self.logger.debug(f"🧵 콜백 작업 제출: {topic}")
             else:
                 self.logger.warning(f"⚠️ 메시지 콜백이 설정되지 않음 - 토픽: {topic}")
                 self.logger.warning(f"⚠️ message_callback 상태: {self.message_callback}")
         except Exception as e:
             self.logger.error(f"❌ 메시지 처리 중 오류: {e}")
-            import traceback
             self.logger.error(f"❌ 스택 트레이스:\n{traceback.format_exc()}")
     
     async def connect(self):
@@ -675,8 +724,9 @@ class MQTTClient:
             
             self._ensure_async_components()
             
-            # 비동기 연결을 위한 루프
+            # 비동기 연결을 위한 루프 (코루틴 수신 콜백도 이 루프에서 실행)
             loop = asyncio.get_event_loop()
+            self.callback_loop = loop
             await loop.run_in_executor(
                 None, 
                 self.client.connect, 
@@ -751,14 +801,17 @@ class MQTTClient:
         
         # 🚀 발행 워커 완전 종료
         self.publisher.stop_workers()
+        
+        # 수신 콜백 스레드 풀 종료 (실행 중인 콜백은 기다리지 않음)
+        self.callback_executor.shutdown(wait=False)
     
-    def publish(self, topic: str, payload: Dict[str, Any], qos: int = 0, retain: bool = False, retry_count: Optional[int] = None):
+    def publish(self, topic: str, payload: Union[Dict[str, Any], bytes], qos: int = 0, retain: bool = False, retry_count: Optional[int] = None):
         """
         🚀 개선된 논블로킹 메시지 발행 - 독립적인 워커에서 처리
         
         Args:
             topic: MQTT 토픽
-            payload: 발행할 데이터 (딕셔너리)
+            payload: 발행할 데이터 (딕셔너리 또는 직렬화된 JSON bytes)
             qos: QoS 레벨 (0, 1, 2)
             retain: Retain 플래그
             retry_count: 재시도 횟수 (미사용 - 호환성 유지)
@@ -852,6 +905,7 @@ class MQTTClient:
             'is_reconnecting': self.is_reconnecting,
             'base_topic': self.base_topic,
             'max_reconnect_attempts': self.max_reconnect_attempts,
+            'dropped_callbacks': self.dropped_callbacks,
             'publisher_stats': publisher_stats
         }
     
@@ -6,6 +6,8 @@
 import json
 import logging
 import asyncio
+import threading
+import time
 from abc import ABC, abstractmethod
 from datetime import datetime
 from pathlib import Path
@@ -56,8 +58,6 @@ class DeviceInterface(ABC):
         현재 이벤트 루프에서 완전히 독립적인 connection lock을 생성
         이벤트 루프 충돌 문제를 방지하기 위해 절대로 Lock을 저장하지 않음
         """
-        import time
-        import threading
         
         try:
             # 현재 스레드와 이벤트 루프 정보
@@ -93,7 +93,6 @@ class DeviceInterface(ABC):
     
     def _create_thread_local_lock(self) -> asyncio.Lock:
         """스레드 로컬 Lock 생성 (최후의 수단)"""
-        import threading
         if not hasattr(self, '_thread_local'):
             self._thread_local = threading.local()
         
@@ -1114,17 +1114,26 @@ class BMSHandler(DeviceInterface):
         # 특별한 레지스터에 대한 추가 처리
         additional_status = self._process_special_registers(register_info, raw_value, bit_status)
         
+        # GUI 표시용 요약 문자열 (예: "1000 (활성비트:3) [Bit 3, Bit 5, Bit 6]")
+        total_active = len(active_bits)
+        if total_active > 0:
+            bit_names = ', '.join(bit.split(':')[0] for bit in active_bits[:3])
+            display = f"{raw_value} (활성비트:{total_active}) [{bit_names}{'...' if total_active > 3 else ''}]"
+        else:
+            display = f"{raw_value} (정상)"
+        
         return {
             'value': raw_value,
             'unit': '',
             'description': description,
             'raw_value': raw_value,
             'type': 'bitmask',
+            'display': display,
             'active_bits': active_bits,
             'bit_status': bit_status,
             'status_values': status_values,
             'additional_status': additional_status,
-            'total_active': len(active_bits),
+            'total_active': total_active,
             'bit_flags': bin(raw_value)[2:].zfill(16),
             'decimal_value': raw_value,  # Decimal 값 명시적 표시
             'hex_value': f"0x{raw_value:04X}",  # HEX 값도 참고용으로 표시
@@ -216,6 +216,20 @@ class PCSHandler(DeviceInterface):
             'last_batch_size': 0
         }
         
+        # MQTT 제어 명령 디스패치 테이블 (command -> 처리 메소드)
+        self._command_handlers = {
+            "operation_mode": self._cmd_operation_mode,
+            "reset_faults": self._cmd_reset_faults,
+            "bms_contactor": self._cmd_bms_contactor,
+            "generator_control": self._cmd_generator_control,
+            "power_reference": self._cmd_power_reference,  # 레거시 명령 (현재 사용 불가)
+        }
+        
+        # 전력 설정점 병합 (짧은 시간 내 연속 명령은 마지막 값만 적용)
+        self._power_ref_coalesce_window = 0.05  # 50ms
+        self._pending_power_kw: Optional[float] = None
+        self._power_ref_task: Optional[asyncio.Task] = None
+        
         # Queue Worker는 첫 연결 시에 시작
     
     async def _initialize_connections(self):
@@ -1389,6 +1403,7 @@ class PCSHandler(DeviceInterface):
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """비동기 컨텍스트 매니저 종료"""
+        await self.cancel_power_reference()
         await self._disconnect_modbus()
 
     async def write_register(self, register_name: str, value: int) -> bool:
@@ -1561,6 +1576,13 @@ class PCSHandler(DeviceInterface):
         Returns:
             성공 여부
         """
+        return self._set_power_reference_sync(power_kw)
+    
+    def _set_power_reference_sync(self, power_kw: float) -> bool:
+        """
+        PCS 출력 전력 설정점 설정 (동기 구현)
+        I/O가 없으므로 제어 메시지 경로에서 코루틴 없이 직접 호출합니다.
+        """
         self.logger.warning("현재 PCS 맵 파일에 전력 설정점 레지스터가 정의되지 않았습니다.")
         return False
     
@@ -1575,52 +1597,92 @@ class PCSHandler(DeviceInterface):
           - cv_charge_start : { "command": "cv_charge_start" }
           - generator_control : { "command": "generator_control", "enable": true/false }
         """
+        if not isinstance(payload, dict) or not isinstance(payload.get("command"), str):
+            self.logger.debug("잘못된 PCS 제어 메시지 형식: %s", payload)
+            return
+        
+        handler = self._command_handlers.get(payload["command"])
+        if handler is None:
+            self.logger.warning("알 수 없는 PCS 제어 명령: %s", payload)
+            return
+        
         try:
-            command = payload.get("command")
-            
-            if command == "operation_mode":
-                mode = payload.get("mode")
-                if mode:
-                    result = await self.set_operation_mode(mode)
-                    self.logger.info(f"PCS 운전 모드 설정 {'성공' if result else '실패'}: {mode}")
-                else:
-                    self.logger.warning("운전 모드가 지정되지 않았습니다")
-            
-            elif command == "reset_faults":
-                result = await self.reset_faults()
-                self.logger.info(f"PCS 고장 리셋 {'성공' if result else '실패'}")
-            
-            elif command == "bms_contactor":
-                enable = bool(payload.get("enable", True))
-                result = await self.bms_contactor_control(enable)
-                status = "ON" if enable else "OFF"
-                self.logger.info(f"BMS 접촉기 {status} 명령 {'성공' if result else '실패'}")
-            
-            # elif command == "bms_reset":
-            #     result = await self.bms_reset()
-            #     self.logger.info(f"BMS 리셋 {'성공' if result else '실패'}")
-            
-            # elif command == "cv_charge_start":
-            #     result = await self.cv_charge_start()
-            #     self.logger.info(f"CV 충전 시작 {'성공' if result else '실패'}")
-            
-            elif command == "generator_control":
-                enable = bool(payload.get("enable", True))
-                result = await self.generator_control(enable)
-                status = "ON" if enable else "OFF"
-                self.logger.info(f"발전기 {status} 명령 {'성공' if result else '실패'}")
-            
-            # 레거시 명령 (현재 사용 불가)
-            elif command == "power_reference":
-                power_kw = payload.get("power_kw")
-                if power_kw is not None:
-                    result = await self.set_power_reference(float(power_kw))
-                    self.logger.info(f"PCS 출력 전력 설정 {'성공' if result else '실패'}: {power_kw}kW")
-                else:
-                    self.logger.warning("출력 전력값이 지정되지 않았습니다")
-            
-            else:
-                self.logger.warning(f"알 수 없는 PCS 제어 명령: {payload}")
-                
+            await handler(payload)
         except Exception as e:
-            self.logger.error(f"PCS 제어 메시지 처리 중 오류: {e}") 
+            self.logger.error("PCS 제어 메시지 처리 중 오류: %s", e)
+    
+    async def _cmd_operation_mode(self, payload: Dict[str, Any]):
+        """operation_mode 명령 처리"""
+        mode = payload.get("mode")
+        if mode:
+            result = await self.set_operation_mode(mode)
+            self.logger.info("PCS 운전 모드 설정 %s: %s", "성공" if result else "실패", mode)
+        else:
+            self.logger.warning("운전 모드가 지정되지 않았습니다")
+    
+    async def _cmd_reset_faults(self, payload: Dict[str, Any]):
+        """reset_faults 명령 처리"""
+        result = await self.reset_faults()
+        self.logger.info("PCS 고장 리셋 %s", "성공" if result else "실패")
+    
+    async def _cmd_bms_contactor(self, payload: Dict[str, Any]):
+        """bms_contactor 명령 처리"""
+        enable = bool(payload.get("enable", True))
+        result = await self.bms_contactor_control(enable)
+        self.logger.info("BMS 접촉기 %s 명령 %s", "ON" if enable else "OFF", "성공" if result else "실패")
+    
+    async def _cmd_generator_control(self, payload: Dict[str, Any]):
+        """generator_control 명령 처리"""
+        enable = bool(payload.get("enable", True))
+        result = await self.generator_control(enable)
+        self.logger.info("발전기 %s 명령 %s", "ON" if enable else "OFF", "성공" if result else "실패")
+    
+    async def _cmd_power_reference(self, payload: Dict[str, Any]):
+        """power_reference 명령 처리 (레거시 명령 - 현재 사용 불가)"""
+        power_kw = payload.get("power_kw")
+        if power_kw is None:
+            self.logger.warning("출력 전력값이 지정되지 않았습니다")
+            return
+        
+        # JSON 숫자는 그대로 사용, 문자열 등만 변환 (bool은 제외)
+        if not isinstance(power_kw, (int, float)) or isinstance(power_kw, bool):
+            try:
+                power_kw = float(power_kw)
+            except (TypeError, ValueError):
+                self.logger.warning("잘못된 출력 전력값입니다: %s", power_kw)
+                return
+        
+        # 병합 대기 태스크는 수명이 긴 MQTT 콜백 루프에서만 사용
+        # (asyncio.run 임시 루프는 콜백 반환 시 남은 태스크를 취소하므로 설정점이 유실됨)
+        if asyncio.get_running_loop() is not getattr(self.mqtt_client, 'callback_loop', None):
+            result = self._set_power_reference_sync(power_kw)
+            self.logger.info("PCS 출력 전력 설정 %s: %skW", "성공" if result else "실패", power_kw)
+            return
+        
+        self._pending_power_kw = power_kw
+        if self._power_ref_task is None or self._power_ref_task.done():
+            self._power_ref_task = asyncio.create_task(self._flush_power_reference())
+    
+    async def _flush_power_reference(self):
+        """병합 구간 동안 들어온 전력 설정점 중 마지막 값만 적용"""
+        await asyncio.sleep(self._power_ref_coalesce_window)
+        power_kw, self._pending_power_kw = self._pending_power_kw, None
+        if power_kw is None:
+            return
+        
+        result = self._set_power_reference_sync(power_kw)
+        self.logger.info("PCS 출력 전력 설정 %s: %skW", "성공" if result else "실패", power_kw)
+    
+    async def cancel_power_reference(self):
+        """대기 중인 전력 설정점 병합 태스크 취소 (핸들러 종료 시)"""
+        task, self._power_ref_task = self._power_ref_task, None
+        self._pending_power_kw = None
+        if task is None or task.done():
+            return
+        
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        self.logger.debug("PCS 전력 설정점 병합 태스크 취소됨")
@@ -3,6 +3,12 @@ PMS GUI 패키지
 실시간 데이터 모니터링 및 장비 제어 GUI
 """
 
-from .main_window import PMSMainWindow
+__all__ = ['PMSMainWindow']
 
-__all__ = ['PMSMainWindow'] 
\ No newline at end of file
+
+def __getattr__(name):
+    """PMSMainWindow는 실제로 사용될 때 로드합니다 (tkinter 지연 로딩)"""
+    if name == 'PMSMainWindow':
+        from .main_window import PMSMainWindow
+        return PMSMainWindow
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}") 
\ No newline at end of file
@@ -1,51 +1,109 @@
-"""
-PMS GUI 모드 실행 스크립트
-GUI 인터페이스로 PMS 시스템을 실행합니다.
-"""
-
-import yaml
-import sys
-from pathlib import Path
-
-from pms_app.gui import PMSMainWindow
-from pms_app.utils.logger import setup_logger
-
-
-def load_config():
-    """설정 파일을 로드합니다."""
-    config_path = Path(__file__).parent / "config" / "config.yml"
-    try:
-        with open(config_path, 'r', encoding='utf-8') as file:
-            return yaml.safe_load(file)
-    except FileNotFoundError:
-        print(f"설정 파일을 찾을 수 없습니다: {config_path}")
-        sys.exit(1)
-    except yaml.YAMLError as e:
-        print(f"설정 파일 파싱 오류: {e}")
-        sys.exit(1)
-
-
-def main():
-    """GUI 모드 메인 함수"""
-    print("PMS GUI 모드 시작...")
-    
-    try:
-        # 로거 설정
-        logger = setup_logger("PMS_GUI")
-        logger.info("PMS GUI 애플리케이션 시작")
-        
-        # 설정 로드
-        config = load_config()
-        logger.info("설정 파일 로드 완료")
-        
-        # GUI 애플리케이션 생성 및 실행
-        app = PMSMainWindow(config)
-        app.run()
-        
-    except Exception as e:
-        print(f"GUI 실행 중 오류 발생: {e}")
-        sys.exit(1)
-
-
-if __name__ == "__main__":
+"""
+PMS GUI 모드 실행 스크립트
+GUI 인터페이스로 PMS 시스템을 실행합니다.
+"""
+
+import yaml
+import sys
+from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping, Dict, Any, Tuple
+
+# libyaml 바인딩이 있으면 C 로더 사용
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+
+# 설정 파일 경로 (모듈 로드 시 1회 계산)
+_CONFIG_PATH = (Path(__file__).parent / "config" / "config.yml").resolve()
+
+# GUI 실행에 반드시 필요한 최상위 설정 키
+_REQUIRED_KEYS = ('mqtt', 'devices')
+
+# 프로세스 단위 설정 캐시 (절대 경로 + mtime 기준)
+_CONFIG_CACHE: Dict[Tuple[str, int], Mapping[str, Any]] = {}
+
+
+def _freeze(value: Any) -> Any:
+    """중첩 매핑은 읽기 전용 매핑으로, 리스트는 튜플로 재귀 변환합니다."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _freeze_config(config: Any) -> Mapping[str, Any]:
+    """로드한 설정을 검증하고 하위 섹션까지 읽기 전용으로 변환합니다."""
+    if not isinstance(config, dict):
+        raise ValueError("설정 파일의 최상위 항목이 매핑 형식이 아닙니다")
+    
+    missing = [key for key in _REQUIRED_KEYS if key not in config]
+    if missing:
+        raise ValueError(f"필수 설정 항목이 없습니다: {', '.join(missing)}")
+    
+    return _freeze(config)
+
+
+def load_config():
+    """
+    설정 파일을 로드합니다. 파일이 변경되지 않았으면 캐시된 설정을 반환합니다.
+    
+    반환값은 로드 시점에 검증된 읽기 전용 매핑이며 (mqtt, devices 등 하위 섹션 포함),
+    캐시된 객체를 그대로 공유합니다.
+    """
+    config_path = _CONFIG_PATH
+    try:
+        cache_key = (str(config_path), config_path.stat().st_mtime_ns)
+        cached = _CONFIG_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        # 바이너리 스트림을 그대로 전달 (디코딩은 YAML 로더가 청크 단위로 처리)
+        with open(config_path, 'rb') as file:
+            config = _freeze_config(yaml.load(file, Loader=_SafeLoader))
+        
+        _CONFIG_CACHE.clear()
+        _CONFIG_CACHE[cache_key] = config
+        return config
+    except FileNotFoundError:
+        print(f"설정 파일을 찾을 수 없습니다: {config_path}")
+        sys.exit(1)
+    except yaml.YAMLError as e:
+        print(f"설정 파일 파싱 오류: {e}")
+        sys.exit(1)
+    except ValueError as e:
+        print(f"설정 파일 검증 오류: {e}")
+        sys.exit(1)
+
+
+def main():
+    """GUI 모드 메인 함수"""
+    print("PMS GUI 모드 시작...")
+    
+    # GUI/로거 모듈은 실제 실행 시점에만 로드
+    from pms_app.gui import PMSMainWindow
+    from pms_app.utils.logger import setup_logger
+    
+    try:
+        # 로거 설정
+        logger = setup_logger("PMS_GUI")
+        logger.info("PMS GUI 애플리케이션 시작")
+        
+        # 설정 로드
+        config = load_config()
+        logger.info("설정 파일 로드 완료")
+        
+        # GUI 애플리케이션 생성 및 실행
+        app = PMSMainWindow(config)
+        app.run()
+        
+    except Exception as e:
+        print(f"GUI 실행 중 오류 발생: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -10,7 +10,12 @@ import threading
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 import json
+import logging
 import os
+import re
+import socket
+import struct
+import sys
 import time
 
 # PMS 모듈 임포트
@@ -43,9 +48,219 @@ except ImportError:
 from ..core.mqtt_client import MQTTClient
 from ..devices import DeviceFactory
 
+# MQTT 페이로드 직렬화 / 메모리 맵 파싱 (orjson이 설치되어 있으면 사용)
+try:
+    import orjson
+    
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS, default=str)
+    
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, default=str).encode('utf-8')
+    
+    _loads = json.loads
+
+def _is_numeric(text: str) -> bool:
+    """Entry 키 입력 검증: 빈 값, 입력 중인 부호/소수점, 숫자만 허용"""
+    if text in ("", "-", ".", "-."):
+        return True
+    try:
+        float(text)
+        return True
+    except ValueError:
+        return False
+
+def _win32_set_clipboard(text: str) -> bool:
+    """Win32 API로 클립보드에 유니코드 텍스트 설정 (Tk 클립보드 실패 시 대체 경로)"""
+    if sys.platform != "win32":
+        return False
+    
+    import ctypes
+    from ctypes import wintypes
+    
+    CF_UNICODETEXT = 13
+    GMEM_MOVEABLE = 0x0002
+    
+    user32 = ctypes.windll.user32
+    kernel32 = ctypes.windll.kernel32
+    kernel32.GlobalAlloc.argtypes = [wintypes.UINT, ctypes.c_size_t]
+    kernel32.GlobalAlloc.restype = wintypes.HGLOBAL
+    kernel32.GlobalLock.argtypes = [wintypes.HGLOBAL]
+    kernel32.GlobalLock.restype = wintypes.LPVOID
+    kernel32.GlobalUnlock.argtypes = [wintypes.HGLOBAL]
+    kernel32.GlobalFree.argtypes = [wintypes.HGLOBAL]
+    user32.SetClipboardData.argtypes = [wintypes.UINT, wintypes.HANDLE]
+    user32.SetClipboardData.restype = wintypes.HANDLE
+    
+    data = ctypes.create_unicode_buffer(text)
+    size = ctypes.sizeof(data)  # 종료 NUL 포함 (UTF-16)
+    
+    if not user32.OpenClipboard(None):
+        return False
+    try:
+        user32.EmptyClipboard()
+        handle = kernel32.GlobalAlloc(GMEM_MOVEABLE, size)
+        if not handle:
+            return False
+        ptr = kernel32.GlobalLock(handle)
+        if not ptr:
+            kernel32.GlobalFree(handle)
+            return False
+        ctypes.memmove(ptr, data, size)
+        kernel32.GlobalUnlock(handle)
+        if not user32.SetClipboardData(CF_UNICODETEXT, handle):
+            kernel32.GlobalFree(handle)  # 실패 시에만 직접 해제 (성공 시 소유권은 시스템으로 이전)
+            return False
+        return True
+    finally:
+        user32.CloseClipboard()
+
+# 장비 데이터 트리뷰 컬럼 정의: (컬럼 ID, 제목, 기본 너비)
+_DATA_COLUMNS = (
+    ('address', '주소', 80),
+    ('parameter', '파라미터', 200),
+    ('value', '값', 150),
+    ('unit', '단위', 80),
+    ('description', '설명', 400),
+)
+_DATA_COLUMN_IDS = tuple(cid for cid, _, _ in _DATA_COLUMNS)
+
+# 독립 모드 상태 정보 행 템플릿: (get_status() 키, 파라미터명, 단위, 설명) - 값 컬럼만 채워서 사용
+_STATUS_ROW_TEMPLATES = (
+    ('name', 'device_name', '', '장비 이름'),
+    ('type', 'device_type', '', '장비 타입'),
+    ('ip', 'ip_address', '', 'IP 주소'),
+    ('port', 'port', '', 'Modbus 포트'),
+    ('connected', 'connected', '', '연결 상태'),
+    ('last_successful_read', 'last_read', '', '마지막 읽기 시간'),
+    ('poll_interval', 'poll_interval', 's', '폴링 주기'),
+)
+
+def _iso_from_ns(ns: int) -> str:
+    """time.time_ns() 값을 로컬 시각 ISO 문자열로 변환 (datetime.now().isoformat()과 동일 형식)"""
+    return datetime.fromtimestamp(ns // 1_000_000_000).replace(microsecond=(ns // 1000) % 1_000_000).isoformat()
+
+# 메모리 맵 등 설정 파일 디렉토리 (import 시 1회 계산)
+_CONFIG_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'config'))
+
+# 메모리 맵 JSON 캐시: 파일 경로 -> ((수정 시각 ns, 크기), 파싱된 맵, 파생 인덱스)
+_MEMORY_MAP_CACHE: Dict[str, tuple] = {}
+
+def _memory_map_entry(filename: str) -> tuple:
+    """메모리 맵 캐시 항목 조회
+    
+    파일이 바뀌었으면 다시 파싱하되, 내용이 바뀐 섹션을 포함하지 않는
+    파생 인덱스는 그대로 재사용한다 (변경된 섹션 관련 인덱스만 재생성).
+    
+    Raises:
+        FileNotFoundError: 맵 파일이 없는 경우
+    """
+    path = os.path.join(_CONFIG_DIR, filename)
+    stat = os.stat(path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _MEMORY_MAP_CACHE.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached
+    
+    with open(path, 'rb') as f:
+        memory_map = _loads(f.read())
+    
+    indexes = {}
+    if cached is not None:
+        old_map, old_indexes = cached[1], cached[2]
+        changed = {section for section in old_map.keys() | memory_map.keys()
+                   if old_map.get(section) != memory_map.get(section)}
+        indexes = {key: index for key, index in old_indexes.items() if changed.isdisjoint(key[1])}
+    
+    cached = _MEMORY_MAP_CACHE[path] = (signature, memory_map, indexes)
+    return cached
+
+def _load_memory_map(filename: str) -> Dict[str, Any]:
+    """config 디렉토리의 메모리 맵 JSON 로드 (파일이 바뀌지 않았으면 캐시 반환)"""
+    return _memory_map_entry(filename)[1]
+
+def _memory_map_address_index(filename: str, sections: tuple) -> Dict[int, str]:
+    """주소 -> 레지스터 이름 인덱스 (섹션 순서상 먼저 나온 레지스터 우선, 맵 변경 전까지 재사용)"""
+    _, memory_map, indexes = _memory_map_entry(filename)
+    key = ('address', sections)
+    index = indexes.get(key)
+    if index is None:
+        index = {}
+        for section in sections:
+            for register_name, register_info in memory_map.get(section, {}).items():
+                index.setdefault(register_info.get('address'), register_name)
+        indexes[key] = index
+    return index
+
+def _memory_map_key_index(filename: str, sections: tuple) -> Dict[str, Dict[str, Any]]:
+    """데이터 키 -> 레지스터 정보(+addr_display) 인덱스 (섹션 순서상 먼저 나온 키 우선, 맵 변경 전까지 재사용)"""
+    _, memory_map, indexes = _memory_map_entry(filename)
+    key = ('key', sections)
+    index = indexes.get(key)
+    if index is None:
+        index = {}
+        for section in sections:
+            for data_key, register_info in memory_map.get(section, {}).items():
+                if data_key not in index:
+                    # 16진수 주소 표시 문자열도 함께 준비 (예: 0x0000)
+                    address = register_info.get('address', '-')
+                    addr_display = f"0x{address:04X}" if isinstance(address, int) else str(address)
+                    index[data_key] = {**register_info, 'addr_display': addr_display}
+        indexes[key] = index
+    return index
+
+# 제어 명령 MQTT 토픽
+TOPIC_MODE = "pms/control/operation_mode"
+TOPIC_AUTO_START = "pms/control/auto_mode/start"
+TOPIC_AUTO_STOP = "pms/control/auto_mode/stop"
+TOPIC_THRESHOLD = "pms/control/threshold_config"
+
+# 트리뷰 값 문자열 파싱: "123", "123 (정상)", "1000 (활성비트:3) [Bit 3, ...]"
+_VALUE_RE = re.compile(r'^(?P<num>\d+)(?:(?: \(정상\))?$| \(활성비트:(?P<active>\d+)\))')
+
+# 커스텀 ttk 스타일 정의 (스타일 이름 -> configure 옵션)
+_STYLES = {
+    'Header.TLabel': {'font': ('Arial', 12, 'bold')},
+    'Status.TLabel': {'font': ('Arial', 10)},
+    'Connected.TLabel': {'foreground': 'green'},
+    'Disconnected.TLabel': {'foreground': 'red'},
+    'Control.TButton': {'font': ('Arial', 10, 'bold')},
+    'AutoMode.TButton': {'font': ('Arial', 11, 'bold'), 'foreground': 'white'},
+    'ManualMode.TButton': {'font': ('Arial', 11, 'bold'), 'foreground': 'white'},
+}
+
+# 운전 모드 버튼 색상 설정 (스타일 이름 -> map 옵션)
+_STYLE_MAPS = {
+    'AutoMode.TButton': {'background': [('active', '#4CAF50'), ('!active', '#45a049')]},
+    'ManualMode.TButton': {'background': [('active', '#2196F3'), ('!active', '#1976d2')]},
+}
+
 class PMSMainWindow:
     """PMS 메인 GUI 윈도우 클래스"""
     
+    _styled_root = None  # ttk 스타일을 등록한 Tk 루트 (스타일은 Tk 인터프리터 단위로 유지됨)
+    _TAB_CLS: Dict[str, type] = {}  # 장비 타입 -> 탭 클래스 (탭 클래스 정의 후 모듈 하단에서 채움)
+    
+    # 임계값 검증 규칙: (조건, 실패 메시지 템플릿) - 메시지는 실패 시에만 포맷
+    _VALIDATORS = (
+        (lambda c: 0 <= c['soc_high_threshold'] <= 100,
+         "soc_high_threshold는 0-100 범위여야 합니다. (현재값: {soc_high_threshold})"),
+        (lambda c: 0 <= c['soc_low_threshold'] <= 100,
+         "soc_low_threshold는 0-100 범위여야 합니다. (현재값: {soc_low_threshold})"),
+        (lambda c: 0 <= c['soc_charge_stop_threshold'] <= 100,
+         "soc_charge_stop_threshold는 0-100 범위여야 합니다. (현재값: {soc_charge_stop_threshold})"),
+        (lambda c: c['soc_low_threshold'] < c['soc_high_threshold'],
+         "SOC 하한 임계값은 상한 임계값보다 작아야 합니다."),
+        (lambda c: c['soc_charge_stop_threshold'] <= c['soc_high_threshold'],
+         "충전 정지 임계값은 상한 임계값보다 작거나 같아야 합니다."),
+        (lambda c: c['dcdc_standby_time'] > 0,
+         "DCDC 대기 시간은 양수여야 합니다."),
+        (lambda c: c['charging_power'] > 0,
+         "충전 전력은 양수여야 합니다."),
+    )
+    
     def __init__(self, config: Dict[str, Any]):
         """
         GUI 초기화
@@ -61,12 +276,32 @@ class PMSMainWindow:
         # 스타일 설정
         self.setup_styles()
         
+        # 숫자 입력 검증 명령 (임계값 Entry 공용)
+        self._numeric_vcmd = (self.root.register(_is_numeric), '%P')
+        
         # 변수 초기화
         self.mqtt_client = None
+        self._mqtt_lock = asyncio.Lock()  # 공용 MQTT 연결/재연결 직렬화
         self.device_handlers = []
         self.device_tabs = {}
         self.running = False
-        self.update_thread = None
+        self._updatable_tabs = []  # update_data를 가진 장비 탭 (탭 생성 시 1회 계산)
+        self._ui_interval_ms = 1000  # 장비 탭 갱신 주기 (데이터 변경 빈도에 따라 조정)
+        self._tick_after_id = None
+        self._last_change_ts = 0.0  # 마지막으로 데이터 변경을 감지한 시각 (monotonic)
+        self._last_data_update = None
+        self._status_cache = None  # data_manager.get_system_status() 스냅샷 (짧은 TTL 캐시)
+        self._status_cache_ts = 0.0
+        
+        # 제어 메시지에 포함할 설치 위치 (config에서 1회만 조회)
+        self._device_location = self.config.get('database', {}).get('device_location', 'Unknown')
+        
+        # 제어 메시지 공통 필드 템플릿 (전송 시 명령별 필드와 timestamp만 덮어씀)
+        self._msg_template = {
+            "location": self._device_location,
+            "source": "gui_control_panel",
+            "timestamp": None
+        }
         
         # DB 설정 로더 초기화
         self.db_config_loader = None
@@ -97,9 +332,26 @@ class PMSMainWindow:
         self.dcdc_standby_time = tk.IntVar(value=5)
         self.charging_power = tk.DoubleVar(value=30.0)
         
+        # DB 설정 캐시 (TTL 내 재조회 시 DB 왕복 생략)
+        self._db_config_cache = None
+        self._db_config_cache_ts = 0.0
+        
+        # 임계값 변수 (설정 수집용)
+        self._threshold_vars = {
+            'soc_high_threshold': self.soc_high_threshold,
+            'soc_low_threshold': self.soc_low_threshold,
+            'soc_charge_stop_threshold': self.soc_charge_stop_threshold,
+            'dcdc_standby_time': self.dcdc_standby_time,
+            'charging_power': self.charging_power
+        }
+        
         # 통합 애플리케이션 모드 확인 (백그라운드 서버가 실행 중인지)
         self.integrated_mode = True  # 통합 애플리케이션으로 실행됨
         
+        # 비동기 이벤트 루프 설정 (GUI 수명 동안 하나의 루프를 재사용)
+        self.loop = None
+        self.setup_async_loop()
+        
         # GUI 구성 요소 생성
         self.create_widgets()
         
@@ -108,38 +360,27 @@ class PMSMainWindow:
         
         # 통합 모드에서는 바로 장비 탭 생성 (백그라운드 서버 사용)
         if self.integrated_mode:
-            # 통합 모드에서도 loop 초기화 (오류 방지)
-            self.loop = None
-            # 통합 모드에서는 MQTT 클라이언트를 미리 연결하지 않음 (필요시에만 임시 연결)
-            self.mqtt_client = None
-            self.create_device_tabs_integrated()
+            # 제어 명령용 MQTT 클라이언트를 미리 연결 (GUI 세션 동안 재사용)
+            self.run_async(self._ensure_mqtt_connected())
+            self.create_device_tabs(integrated=True)
             self.running = True
             self.update_ui_status()
-            self.start_update_thread()
-        else:
-            # 비동기 이벤트 루프 설정 (독립 실행 모드에서만)
-            self.loop = None
-            self.setup_async_loop()
+            self.start_ui_refresh()
     
     def setup_styles(self):
         """GUI 스타일 설정"""
+        if PMSMainWindow._styled_root is self.root:
+            return
+        
         style = ttk.Style()
         style.theme_use('clam')
         
-        # 커스텀 스타일 정의
-        style.configure('Header.TLabel', font=('Arial', 12, 'bold'))
-        style.configure('Status.TLabel', font=('Arial', 10))
-        style.configure('Connected.TLabel', foreground='green')
-        style.configure('Disconnected.TLabel', foreground='red')
-        style.configure('Control.TButton', font=('Arial', 10, 'bold'))
-        style.configure('AutoMode.TButton', font=('Arial', 11, 'bold'), foreground='white')
-        style.configure('ManualMode.TButton', font=('Arial', 11, 'bold'), foreground='white')
-        
-        # 운전 모드 버튼 색상 설정
-        style.map('AutoMode.TButton', 
-                  background=[('active', '#4CAF50'), ('!active', '#45a049')])
-        style.map('ManualMode.TButton', 
-                  background=[('active', '#2196F3'), ('!active', '#1976d2')])
+        for name, options in _STYLES.items():
+            style.configure(name, **options)
+        for name, options in _STYLE_MAPS.items():
+            style.map(name, **options)
+        
+        PMSMainWindow._styled_root = self.root
     
     def create_widgets(self):
         """GUI 구성 요소 생성"""
@@ -156,6 +397,7 @@ class PMSMainWindow:
         
         self.notebook = ttk.Notebook(content_frame)
         self.notebook.pack(fill=tk.BOTH, expand=True)
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
         
         # 창 크기 조정 설정
         self.root.columnconfigure(0, weight=1)
@@ -196,6 +438,26 @@ class PMSMainWindow:
         
         self.mqtt_status_label = ttk.Label(control_frame, text="연결안됨", style='Disconnected.TLabel')
         self.mqtt_status_label.grid(row=0, column=mqtt_col+1)
+        
+        # 제어 명령 결과 표시 (모달 대화상자 대신 사용, 일정 시간 후 자동 삭제)
+        self.status_text = tk.StringVar()
+        self._status_clear_id = None
+        self.status_text_label = ttk.Label(control_frame, textvariable=self.status_text, style='Status.TLabel')
+        self.status_text_label.grid(row=0, column=mqtt_col+2, padx=(20, 0))
+    
+    def _show_status(self, message: str, error: bool = False, duration_ms: int = 3000):
+        """상태 표시줄에 메시지 표시 (GUI 스레드에서 호출)"""
+        self.status_text.set(message)
+        self.status_text_label.config(foreground='red' if error else 'green')
+        
+        if self._status_clear_id is not None:
+            self.root.after_cancel(self._status_clear_id)
+        self._status_clear_id = self.root.after(duration_ms, self._clear_status)
+    
+    def _clear_status(self):
+        """상태 표시줄 메시지 삭제"""
+        self._status_clear_id = None
+        self.status_text.set("")
     
     def create_operation_control_panel(self, parent):
         """우측 운전 모드 제어 패널 생성"""
@@ -303,40 +565,47 @@ class PMSMainWindow:
         label = ttk.Label(frame, text=label_text, width=18, anchor='w')
         label.grid(row=0, column=0, sticky="w")
         
-        # 입력 필드
-        entry = ttk.Entry(frame, textvariable=variable, width=10, justify='center')
+        # 입력 필드 (키 입력은 validatecommand로만 검사, 변수에는 확정 시에만 반영)
+        entry = ttk.Entry(frame, width=10, justify='center', validate='key', validatecommand=self._numeric_vcmd)
+        entry.insert(0, str(variable.get()))
         entry.grid(row=0, column=1, padx=(5, 5))
         
+        def commit(event=None):
+            try:
+                value = float(entry.get())
+                if isinstance(variable, tk.IntVar):
+                    value = int(value)
+            except ValueError:
+                # 확정할 수 없는 값이면 현재 변수 값으로 되돌림
+                refresh()
+                return
+            if value != variable.get():
+                variable.set(value)
+        
+        def refresh(*args):
+            entry.delete(0, tk.END)
+            entry.insert(0, str(variable.get()))
+        
+        entry.bind("<Return>", commit)
+        entry.bind("<FocusOut>", commit)
+        # DB 불러오기 등 외부에서 변수가 바뀌면 표시 갱신
+        variable.trace_add("write", refresh)
+        
         # 단위
         unit_label = ttk.Label(frame, text=unit, width=4, anchor='w')
         unit_label.grid(row=0, column=2, sticky="w")
     
     def load_initial_config(self):
-        """초기 설정 로드 (DB에서)"""
-        if self.db_config_loader:
+        """초기 설정 로드 (DB에서, 창 표시를 막지 않도록 백그라운드에서 조회)"""
+        if not self.db_config_loader:
+            return
+        
+        # 조회 완료 후 GUI 스레드에서 변수 반영
+        def on_loaded(future):
             try:
-                # 비동기 함수를 동기적으로 실행
-                import asyncio
-                try:
-                    loop = asyncio.get_event_loop()
-                except RuntimeError:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                
-                config = loop.run_until_complete(self.db_config_loader.load_auto_mode_config())
+                config = future.result()
                 if config:
-                    self.soc_high_threshold.set(config.get('soc_high_threshold', 85.0))
-                    self.soc_low_threshold.set(config.get('soc_low_threshold', 50.0))
-                    self.soc_charge_stop_threshold.set(config.get('soc_charge_stop_threshold', 80.0))
-                    self.dcdc_standby_time.set(config.get('dcdc_standby_time', 5))
-                    self.charging_power.set(config.get('charging_power', 30.0))
-                    
-                    # 🔧 현재 운전 모드도 DB에서 로드하여 반영
-                    auto_mode_enabled = config.get('auto_mode_enabled', False)
-                    if auto_mode_enabled:
-                        self.current_operation_mode.set("auto")
-                    else:
-                        self.current_operation_mode.set("manual")
+                    auto_mode_enabled = self._apply_config_to_vars(config)
                     
                     print("✅ DB에서 초기 설정 로드 완료")
                     print(f"   📊 로드된 운전 모드: {'자동' if auto_mode_enabled else '수동'}")
@@ -344,6 +613,11 @@ class PMSMainWindow:
                     print("⚠️ DB에서 설정을 찾을 수 없음, 기본값 사용")
             except Exception as e:
                 print(f"❌ 초기 설정 로드 중 오류: {e}")
+        
+        try:
+            self.run_async(self._fetch_db_config(force=True), on_loaded)
+        except Exception as e:
+            print(f"❌ 초기 설정 로드 중 오류: {e}")
     
     def load_config_from_db(self):
         """DB에서 설정 불러오기"""
@@ -351,43 +625,55 @@ class PMSMainWindow:
             messagebox.showwarning("경고", "DB 연결이 설정되지 않았습니다.")
             return
         
-        try:
-            def load_async():
-                import asyncio
-                try:
-                    loop = asyncio.get_event_loop()
-                except RuntimeError:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                
-                if self.db_config_loader is not None:
-                    config = loop.run_until_complete(self.db_config_loader.load_auto_mode_config())
-                else:
-                    config = None
-                return config
-            
-            config = load_async()
-            if config:
-                self.soc_high_threshold.set(config.get('soc_high_threshold', 85.0))
-                self.soc_low_threshold.set(config.get('soc_low_threshold', 50.0))
-                self.soc_charge_stop_threshold.set(config.get('soc_charge_stop_threshold', 80.0))
-                self.dcdc_standby_time.set(config.get('dcdc_standby_time', 5))
-                self.charging_power.set(config.get('charging_power', 30.0))
-                
-                # 🔧 현재 운전 모드도 반영
-                auto_mode_enabled = config.get('auto_mode_enabled', False)
-                if auto_mode_enabled:
-                    self.current_operation_mode.set("auto")
+        def on_loaded(future):
+            try:
+                config = future.result()
+                if config:
+                    auto_mode_enabled = self._apply_config_to_vars(config)
+                    
+                    self._show_status(f"DB에서 설정을 불러왔습니다 (운전 모드: {'자동' if auto_mode_enabled else '수동'})")
                 else:
-                    self.current_operation_mode.set("manual")
-                
-                messagebox.showinfo("성공", f"DB에서 설정을 성공적으로 불러왔습니다.\n운전 모드: {'자동' if auto_mode_enabled else '수동'}")
-            else:
-                messagebox.showwarning("경고", "DB에서 설정을 찾을 수 없습니다.")
-                
+                    self._show_status("DB에서 설정을 찾을 수 없습니다", error=True)
+                    
+            except Exception as e:
+                self._show_status(f"DB에서 설정 불러오기 실패: {e}", error=True)
+        
+        try:
+            self.run_async(self._fetch_db_config(), on_loaded)
         except Exception as e:
             messagebox.showerror("오류", f"DB에서 설정 불러오기 실패: {e}")
     
+    async def _fetch_db_config(self, force: bool = False) -> Optional[Dict[str, Any]]:
+        """DB 자동 운전 설정 조회 (force가 아니면 30초 이내 조회 결과를 재사용)"""
+        if (not force and self._db_config_cache is not None
+                and time.monotonic() - self._db_config_cache_ts < 30):
+            return self._db_config_cache
+        
+        config = await self.db_config_loader.load_auto_mode_config()
+        if config:
+            self._db_config_cache = config
+            self._db_config_cache_ts = time.monotonic()
+        return config
+    
+    def _apply_config_to_vars(self, config: Dict[str, Any]) -> bool:
+        """DB 설정값을 GUI 변수에 반영 (자동 운전 활성화 여부 반환)"""
+        self.soc_high_threshold.set(config.get('soc_high_threshold', 85.0))
+        self.soc_low_threshold.set(config.get('soc_low_threshold', 50.0))
+        self.soc_charge_stop_threshold.set(config.get('soc_charge_stop_threshold', 80.0))
+        self.dcdc_standby_time.set(config.get('dcdc_standby_time', 5))
+        self.charging_power.set(config.get('charging_power', 30.0))
+        
+        # 🔧 현재 운전 모드도 반영
+        auto_mode_enabled = config.get('auto_mode_enabled', False)
+        self.current_operation_mode.set("auto" if auto_mode_enabled else "manual")
+        return auto_mode_enabled
+    
+    def _update_db_config_cache(self, config_data: Dict[str, Any]):
+        """저장에 성공한 값으로 DB 설정 캐시 갱신"""
+        if self._db_config_cache is not None:
+            self._db_config_cache = {**self._db_config_cache, **config_data}
+            self._db_config_cache_ts = time.monotonic()
+    
     def save_config_to_db(self):
         """DB에 설정 저장 및 MQTT로 전송"""
         if not self.db_config_loader:
@@ -396,332 +682,180 @@ class PMSMainWindow:
         
         try:
             # 현재 GUI 값들 수집
-            config_data = {
-                'soc_high_threshold': self.soc_high_threshold.get(),
-                'soc_low_threshold': self.soc_low_threshold.get(),
-                'soc_charge_stop_threshold': self.soc_charge_stop_threshold.get(),
-                'dcdc_standby_time': self.dcdc_standby_time.get(),
-                'charging_power': self.charging_power.get()
-            }
+            config_data = self._collect_config_values()
             
             # 입력값 검증
             if not self.validate_config_values(config_data):
                 return
             
-            # DB에 저장
-            def save_async():
-                import asyncio
+            # DB 저장 완료 후 GUI 스레드에서 호출
+            def on_saved(future):
                 try:
-                    loop = asyncio.get_event_loop()
-                except RuntimeError:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                
-                if self.db_config_loader is not None:
-                    return loop.run_until_complete(self.db_config_loader.save_auto_mode_config(config_data))
-                else:
-                    return False
-            
-            success = save_async()
+                    if future.result():
+                        self._update_db_config_cache(config_data)
+                        # MQTT로 임계값 설정 전송
+                        self.send_threshold_config_mqtt(config_data)
+                        self._show_status("설정이 DB에 저장되고 시스템에 적용되었습니다")
+                    else:
+                        self._show_status("DB 저장에 실패했습니다", error=True)
+                except Exception as e:
+                    self._show_status(f"설정 저장 중 오류: {e}", error=True)
             
-            if success:
-                # MQTT로 임계값 설정 전송
-                self.send_threshold_config_mqtt(config_data)
-                messagebox.showinfo("성공", "설정이 DB에 저장되고 시스템에 적용되었습니다.")
-            else:
-                messagebox.showerror("오류", "DB 저장에 실패했습니다.")
+            # DB에 저장
+            self.run_async(self.db_config_loader.save_auto_mode_config(config_data), on_saved)
                 
         except Exception as e:
             messagebox.showerror("오류", f"설정 저장 중 오류: {e}")
     
-    def validate_config_values(self, config_data):
-        """설정값 검증"""
+    def _collect_config_values(self) -> Dict[str, Any]:
+        """현재 GUI 임계값 수집"""
+        return {key: var.get() for key, var in self._threshold_vars.items()}
+    
+    def validate_config_values(self, config_data, show_errors: bool = True):
+        """설정값 검증 (show_errors=False이면 오류를 대화상자 대신 로그로 출력)"""
+        def fail(title, message):
+            if show_errors:
+                messagebox.showerror(title, message)
+            else:
+                print(f"⚠️ {message}")
+            return False
+        
         try:
-            # SOC 값들이 0-100 범위인지 확인
-            for key in ['soc_high_threshold', 'soc_low_threshold', 'soc_charge_stop_threshold']:
-                value = config_data[key]
-                if not (0 <= value <= 100):
-                    messagebox.showerror("입력 오류", f"{key}는 0-100 범위여야 합니다. (현재값: {value})")
-                    return False
-            
-            # SOC 임계값 논리 확인
-            if config_data['soc_low_threshold'] >= config_data['soc_high_threshold']:
-                messagebox.showerror("입력 오류", "SOC 하한 임계값은 상한 임계값보다 작아야 합니다.")
-                return False
-            
-            if config_data['soc_charge_stop_threshold'] > config_data['soc_high_threshold']:
-                messagebox.showerror("입력 오류", "충전 정지 임계값은 상한 임계값보다 작거나 같아야 합니다.")
-                return False
-            
-            # DCDC 대기 시간이 양수인지 확인
-            if config_data['dcdc_standby_time'] <= 0:
-                messagebox.showerror("입력 오류", "DCDC 대기 시간은 양수여야 합니다.")
-                return False
-            
-            # 충전 전력이 양수인지 확인
-            if config_data['charging_power'] <= 0:
-                messagebox.showerror("입력 오류", "충전 전력은 양수여야 합니다.")
-                return False
+            for predicate, message in self._VALIDATORS:
+                if not predicate(config_data):
+                    return fail("입력 오류", message.format(**config_data))
             
             return True
             
         except Exception as e:
-            messagebox.showerror("검증 오류", f"설정값 검증 중 오류: {e}")
-            return False
+            return fail("검증 오류", f"설정값 검증 중 오류: {e}")
     
-    def send_threshold_config_mqtt(self, config_data):
-        """MQTT로 임계값 설정 전송"""
-        try:
-            # MQTT 메시지 구성 (LOCATION 정보 포함)
-            device_location = self.config.get('database', {}).get('device_location', 'Unknown')
-            mqtt_message = {
-                "command": "threshold_config",
-                "location": device_location,
-                "timestamp": datetime.now().isoformat(),
-                "config": config_data,
-                "source": "gui_control_panel"
-            }
-            
-            # 임계값 설정 토픽
-            threshold_topic = "pms/control/threshold_config"
-            
-            # 비동기 MQTT 전송
-            def send_mqtt():
-                import asyncio
-                try:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    if hasattr(self, 'send_mqtt_control_command_temp'):
-                        success = loop.run_until_complete(
-                            self.send_mqtt_control_command_temp(threshold_topic, mqtt_message)
-                        )
-                    else:
-                        success = False
-                    loop.close()
+    def _publish_control(self, topic: str, payload: dict, success_msg: Optional[str] = None,
+                         failure_msg: Optional[str] = None, title: str = "제어 명령", on_success=None):
+        """
+        공통 제어 메시지 MQTT 전송
+        
+        Args:
+            topic: MQTT 토픽
+            payload: 명령별 필드 (_msg_template의 공통 필드와 timestamp는 자동 추가)
+            success_msg: 전송 성공 시 상태 표시줄에 표시할 메시지 (None이면 표시하지 않음)
+            failure_msg: 전송 실패 시 상태 표시줄에 표시할 메시지 (None이면 로그만 출력)
+            title: 상태 메시지 앞에 붙일 구분
+            on_success: 전송 성공 시 GUI 스레드에서 호출할 함수
+        """
+        # MQTT 메시지 구성 (LOCATION 정보 포함)
+        message = {**self._msg_template, **payload, "timestamp": datetime.now().isoformat()}
+        
+        def on_sent(future):
+            try:
+                if future.result():
+                    if on_success is not None:
+                        on_success()
+                    if success_msg:
+                        self._show_status(f"[{title}] {success_msg}")
+                elif failure_msg:
+                    self._show_status(f"[{title}] {failure_msg}", error=True)
+                else:
+                    print(f"❌ MQTT 전송 실패: {topic}")
                     
-                    if success:
-                        print(f"✅ 임계값 설정 MQTT 전송 완료: {threshold_topic}")
-                    else:
-                        print(f"❌ 임계값 설정 MQTT 전송 실패")
-                        
-                except Exception as e:
+            except Exception as e:
+                if failure_msg:
+                    self._show_status(f"[{title}] {failure_msg} ({e})", error=True)
+                else:
                     print(f"❌ MQTT 전송 중 오류: {e}")
-            
-            # 별도 스레드에서 실행
-            import threading
-            thread = threading.Thread(target=send_mqtt, daemon=True)
-            thread.start()
-            
+        
+        try:
+            # 공용 이벤트 루프에서 비동기 MQTT 전송
+            self.run_async(self.send_mqtt_control_command(topic, message), on_sent)
         except Exception as e:
-            print(f"❌ MQTT 메시지 구성 중 오류: {e}")
+            print(f"❌ MQTT 메시지 전송 요청 실패: {e}")
+    
+    def _show_operation_mode(self, mode: str):
+        """현재 운전 모드 표시 갱신"""
+        self.current_operation_mode.set(mode)
+        if hasattr(self, 'current_mode_label'):
+            if mode == "auto":
+                self.current_mode_label.config(text="자동 모드", foreground='green')
+            else:
+                self.current_mode_label.config(text="수동 모드", foreground='blue')
+    
+    def send_threshold_config_mqtt(self, config_data):
+        """MQTT로 임계값 설정 전송"""
+        self._publish_control(TOPIC_THRESHOLD,
+                              {"command": "threshold_config", "config": config_data})
     
     def set_manual_mode(self):
         """수동 운전 모드 설정"""
-        try:
-            # MQTT 메시지 구성 (LOCATION 정보 포함)
-            device_location = self.config.get('database', {}).get('device_location', 'Unknown')
-            message = {
-                "mode": "basic",
-                "location": device_location,
-                "timestamp": datetime.now().isoformat(),
-                "source": "gui_control_panel"
-            }
-            
-            # 운전 모드 변경 토픽
-            mode_topic = "pms/control/operation_mode"
-            
-            # 비동기 MQTT 전송
-            def send_mode_change():
-                import asyncio
-                try:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    if hasattr(self, 'send_mqtt_control_command_temp'):
-                        success = loop.run_until_complete(
-                            self.send_mqtt_control_command_temp(mode_topic, message)
-                        )
-                    else:
-                        success = False
-                    loop.close()
-                    
-                    if success:
-                        self.current_operation_mode.set("manual")
-                        self.current_mode_label.config(text="수동 모드", foreground='blue')
-                        messagebox.showinfo("모드 변경", "수동 운전 모드로 변경되었습니다.")
-                    else:
-                        messagebox.showerror("오류", "수동 모드 설정 MQTT 전송에 실패했습니다.")
-                        
-                except Exception as e:
-                    messagebox.showerror("오류", f"수동 모드 설정 중 오류: {e}")
-            
-            # 별도 스레드에서 실행
-            import threading
-            thread = threading.Thread(target=send_mode_change, daemon=True)
-            thread.start()
-            
-        except Exception as e:
-            messagebox.showerror("오류", f"수동 모드 설정 실패: {e}")
+        self._publish_control(TOPIC_MODE, {"mode": "basic"},
+                              success_msg="수동 운전 모드로 변경되었습니다.",
+                              failure_msg="수동 모드 설정 MQTT 전송에 실패했습니다.",
+                              title="모드 변경",
+                              on_success=lambda: self._show_operation_mode("manual"))
     
     def set_auto_mode(self):
         """자동 운전 모드 설정"""
-        try:
-            # MQTT 메시지 구성 (LOCATION 정보 포함)
-            device_location = self.config.get('database', {}).get('device_location', 'Unknown')
-            message = {
-                "mode": "auto",
-                "location": device_location,
-                "timestamp": datetime.now().isoformat(),
-                "source": "gui_control_panel"
-            }
-            
-            # 운전 모드 변경 토픽
-            mode_topic = "pms/control/operation_mode"
-            
-            # 비동기 MQTT 전송
-            def send_mode_change():
-                import asyncio
-                try:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    if hasattr(self, 'send_mqtt_control_command_temp'):
-                        success = loop.run_until_complete(
-                            self.send_mqtt_control_command_temp(mode_topic, message)
-                        )
-                    else:
-                        success = False
-                    loop.close()
-                    
-                    if success:
-                        self.current_operation_mode.set("auto")
-                        self.current_mode_label.config(text="자동 모드", foreground='green')
-                        messagebox.showinfo("모드 변경", "자동 운전 모드로 변경되었습니다.")
-                    else:
-                        messagebox.showerror("오류", "자동 모드 설정 MQTT 전송에 실패했습니다.")
-                        
-                except Exception as e:
-                    messagebox.showerror("오류", f"자동 모드 설정 중 오류: {e}")
-            
-            # 별도 스레드에서 실행
-            import threading
-            thread = threading.Thread(target=send_mode_change, daemon=True)
-            thread.start()
-            
-        except Exception as e:
-            messagebox.showerror("오류", f"자동 모드 설정 실패: {e}")
+        self._publish_control(TOPIC_MODE, {"mode": "auto"},
+                              success_msg="자동 운전 모드로 변경되었습니다.",
+                              failure_msg="자동 모드 설정 MQTT 전송에 실패했습니다.",
+                              title="모드 변경",
+                              on_success=lambda: self._show_operation_mode("auto"))
     
     def start_auto_mode(self):
         """자동 모드 시작"""
-        try:
-            # MQTT 메시지 구성 (LOCATION 정보 포함)
-            device_location = self.config.get('database', {}).get('device_location', 'Unknown')
-            message = {
-                "command": "auto_start",
-                "location": device_location,
-                "timestamp": datetime.now().isoformat(),
-                "source": "gui_control_panel"
-            }
-            
-            # 자동 모드 시작 토픽
-            start_topic = "pms/control/auto_mode/start"
-            
-            # 비동기 MQTT 전송
-            def send_auto_start():
-                import asyncio
-                try:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    if hasattr(self, 'send_mqtt_control_command_temp'):
-                        success = loop.run_until_complete(
-                            self.send_mqtt_control_command_temp(start_topic, message)
-                        )
-                    else:
-                        success = False
-                    loop.close()
-                    
-                    if success:
-                        messagebox.showinfo("자동 모드", "자동 모드 시작 명령을 전송했습니다.")
-                    else:
-                        messagebox.showerror("오류", "자동 모드 시작 MQTT 전송에 실패했습니다.")
-                        
-                except Exception as e:
-                    messagebox.showerror("오류", f"자동 모드 시작 중 오류: {e}")
-            
-            # 별도 스레드에서 실행
-            import threading
-            thread = threading.Thread(target=send_auto_start, daemon=True)
-            thread.start()
-            
-        except Exception as e:
-            messagebox.showerror("오류", f"자동 모드 시작 실패: {e}")
+        self._publish_control(TOPIC_AUTO_START, {"command": "auto_start"},
+                              success_msg="자동 모드 시작 명령을 전송했습니다.",
+                              failure_msg="자동 모드 시작 MQTT 전송에 실패했습니다.",
+                              title="자동 모드")
     
     def stop_auto_mode(self):
         """자동 모드 정지"""
-        try:
-            # MQTT 메시지 구성 (LOCATION 정보 포함)
-            device_location = self.config.get('database', {}).get('device_location', 'Unknown')
-            message = {
-                "command": "auto_stop",
-                "location": device_location,
-                "timestamp": datetime.now().isoformat(),
-                "source": "gui_control_panel"
-            }
+        self._publish_control(TOPIC_AUTO_STOP, {"command": "auto_stop"},
+                              success_msg="자동 모드 정지 명령을 전송했습니다.",
+                              failure_msg="자동 모드 정지 MQTT 전송에 실패했습니다.",
+                              title="자동 모드")
+    
+    async def _ensure_mqtt_connected(self, max_attempts: int = 3) -> bool:
+        """공용 MQTT 클라이언트 연결 확인 (끊어진 경우 지수 백오프로 재연결)"""
+        if MQTTClient is None:
+            print("Warning: MQTTClient를 import할 수 없습니다.")
+            return False
+        
+        async with self._mqtt_lock:
+            if self.mqtt_client is None:
+                self.mqtt_client = MQTTClient(self.config['mqtt'])
             
-            # 자동 모드 정지 토픽
-            stop_topic = "pms/control/auto_mode/stop"
+            if self.mqtt_client.is_connected():
+                return True
             
-            # 비동기 MQTT 전송
-            def send_auto_stop():
-                import asyncio
+            for attempt in range(max_attempts):
                 try:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    if hasattr(self, 'send_mqtt_control_command_temp'):
-                        success = loop.run_until_complete(
-                            self.send_mqtt_control_command_temp(stop_topic, message)
-                        )
-                    else:
-                        success = False
-                    loop.close()
-                    
-                    if success:
-                        messagebox.showinfo("자동 모드", "자동 모드 정지 명령을 전송했습니다.")
-                    else:
-                        messagebox.showerror("오류", "자동 모드 정지 MQTT 전송에 실패했습니다.")
-                        
+                    await self.mqtt_client.connect()
+                    if self.mqtt_client.is_connected():
+                        print("✅ GUI 제어용 MQTT 연결 완료")
+                        return True
                 except Exception as e:
-                    messagebox.showerror("오류", f"자동 모드 정지 중 오류: {e}")
-            
-            # 별도 스레드에서 실행
-            import threading
-            thread = threading.Thread(target=send_auto_stop, daemon=True)
-            thread.start()
+                    print(f"❌ GUI 제어용 MQTT 연결 실패 ({attempt + 1}/{max_attempts}): {e}")
+                
+                if attempt < max_attempts - 1:
+                    await asyncio.sleep(0.5 * (2 ** attempt))
             
-        except Exception as e:
-            messagebox.showerror("오류", f"자동 모드 정지 실패: {e}")
+            return False
     
-    async def send_mqtt_control_command_temp(self, topic: str, payload: dict) -> bool:
-        """임시 MQTT 연결을 통한 제어 명령 전송"""
-        temp_mqtt_client = None
+    async def send_mqtt_control_command(self, topic: str, payload: dict) -> bool:
+        """공용 MQTT 연결을 통한 제어 명령 전송"""
+        # 다른 이벤트 루프에서 호출된 경우 공용 루프로 위임 (연결 상태는 공용 루프에서만 관리)
+        if asyncio.get_running_loop() is not self.loop:
+            return await asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(self.send_mqtt_control_command(topic, payload), self.loop)
+            )
+        
         try:
-            if MQTTClient is None:
-                print("Warning: MQTTClient를 import할 수 없습니다.")
+            if not await self._ensure_mqtt_connected():
+                print("❌ MQTT 연결 실패")
                 return False
             
-            # 임시 MQTT 클라이언트를 위한 설정 생성 (유니크한 client_id 사용)
-            import time
-            temp_config = self.config['mqtt'].copy()
-            temp_config['client_id'] = f"pms_gui_temp_{int(time.time() * 1000)}"
-            
-            # 임시 MQTT 클라이언트 생성 및 연결
-            temp_mqtt_client = MQTTClient(temp_config)
-            await temp_mqtt_client.connect()
-            
-            if not temp_mqtt_client.is_connected():
-                print("❌ 임시 MQTT 연결 실패")
-                return False
-            
-            # 제어 명령 전송
-            success = temp_mqtt_client.publish(topic, payload)
+            # 제어 명령 전송 (미리 직렬화한 bytes 전달)
+            success = self.mqtt_client.publish(topic, _dumps(payload))
             if success:
                 print(f"✅ 제어 명령 전송 성공: {topic}")
                 return True
@@ -730,72 +864,76 @@ class PMSMainWindow:
                 return False
                 
         except Exception as e:
-            print(f"❌ 임시 MQTT 제어 명령 전송 오류: {e}")
+            print(f"❌ MQTT 제어 명령 전송 오류: {e}")
             return False
-        finally:
-            # 임시 연결 해제
-            if temp_mqtt_client:
-                try:
-                    await temp_mqtt_client.disconnect()
-                    print("🔌 임시 MQTT 연결 해제 완료")
-                except:
-                    pass
     
     def setup_async_loop(self):
-        """비동기 이벤트 루프 설정"""
+        """비동기 이벤트 루프 설정 (백그라운드 데몬 스레드에서 계속 실행)"""
+        # 루프는 호출 스레드에서 생성하여 반환 직후부터 바로 사용할 수 있게 함
+        self.loop = asyncio.new_event_loop()
+        
         def run_async_loop():
-            self.loop = asyncio.new_event_loop()
             asyncio.set_event_loop(self.loop)
             self.loop.run_forever()
         
         self.async_thread = threading.Thread(target=run_async_loop, daemon=True)
         self.async_thread.start()
     
-    def create_device_tabs(self):
-        """장비별 탭 생성"""
-        for device_config in self.config['devices']:
-            device_type = device_config['type']
-            device_name = device_config['name']
-            
-            # 탭 프레임 생성
-            tab_frame = ttk.Frame(self.notebook)
-            self.notebook.add(tab_frame, text=f"{device_type} - {device_name}")
-            
-            # 장비별 탭 클래스 생성
-            if device_type == 'BMS':
-                device_tab = BMSTab(tab_frame, device_config, self.device_handlers, self)
-            elif device_type == 'DCDC':
-                device_tab = DCDCTab(tab_frame, device_config, self.device_handlers, self)
-            elif device_type == 'PCS':
-                device_tab = PCSTab(tab_frame, device_config, self.device_handlers, self)
-            else:
-                continue
+    def run_async(self, coro, callback=None):
+        """
+        코루틴을 공용 이벤트 루프에서 실행
+        
+        Args:
+            coro: 실행할 코루틴
+            callback: 완료 시 GUI 스레드에서 호출할 함수 (future를 인자로 받음)
             
-            self.device_tabs[device_name] = device_tab
+        Returns:
+            concurrent.futures.Future
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        if callback is not None:
+            future.add_done_callback(lambda f: self.root.after(0, callback, f))
+        return future
     
-    def create_device_tabs_integrated(self):
-        """통합 모드용 장비별 탭 생성 (백그라운드 서버 사용)"""
+    def create_device_tabs(self, integrated: bool = False):
+        """장비별 탭 생성
+        
+        Args:
+            integrated: 통합 모드 여부 (백그라운드 서버 사용, 빈 핸들러 리스트로 모니터링 전용 탭 생성)
+        """
+        handlers = [] if integrated else self.device_handlers
         for device_config in self.config['devices']:
             device_type = device_config['type']
-            device_name = device_config['name']
+            tab_cls = self._TAB_CLS.get(device_type)
+            if tab_cls is None:
+                continue
             
             # 탭 프레임 생성
             tab_frame = ttk.Frame(self.notebook)
-            self.notebook.add(tab_frame, text=f"{device_type} - {device_name}")
-            
-            # 장비별 탭 클래스 생성 (모니터링 전용)
-            if device_type == 'BMS':
-                device_tab = BMSTab(tab_frame, device_config, [], self)  # 빈 핸들러 리스트
-            elif device_type == 'DCDC':
-                device_tab = DCDCTab(tab_frame, device_config, [], self)
-            elif device_type == 'PCS':
-                device_tab = PCSTab(tab_frame, device_config, [], self)
-            else:
-                continue
-            
-            # 통합 모드 플래그 설정
-            device_tab.integrated_mode = True
-            self.device_tabs[device_name] = device_tab
+            self.notebook.add(tab_frame, text=f"{device_type} - {device_config['name']}")
+            
+            device_tab = tab_cls(tab_frame, device_config, handlers, self)
+            device_tab.integrated_mode = integrated
+            self.device_tabs[device_config['name']] = device_tab
+        
+        self._refresh_updatable_tabs()
+        self._on_tab_changed()
+    
+    def _on_tab_changed(self, event=None):
+        """선택된 장비 탭만 표시 갱신 대상으로 지정 (새로 보이게 된 탭은 즉시 갱신)"""
+        selected = self.notebook.select()
+        for tab in self.device_tabs.values():
+            was_visible = tab.visible
+            tab.visible = str(tab.parent) == selected
+            if tab.visible and not was_visible:
+                try:
+                    tab.update_data()
+                except Exception as e:
+                    print(f"탭 {tab.__class__.__name__} 업데이트 오류: {e}")
+    
+    def _refresh_updatable_tabs(self):
+        """주기적으로 갱신할 장비 탭 목록 재계산"""
+        self._updatable_tabs = [tab for tab in self.device_tabs.values() if hasattr(tab, 'update_data')]
     
     def start_system(self):
         """시스템 시작"""
@@ -824,8 +962,9 @@ class PMSMainWindow:
             if MQTTClient is None:
                 raise ImportError("MQTTClient를 import할 수 없습니다.")
                 
-            self.mqtt_client = MQTTClient(self.config['mqtt'])
-            await self.mqtt_client.connect()
+            # 공용 클라이언트로 생성/연결 (제어 명령 전송과 같은 연결 경로 사용)
+            if not await self._ensure_mqtt_connected():
+                raise ConnectionError("MQTT 브로커에 연결할 수 없습니다.")
             
             # 시스템 설정 생성
             system_config = {
@@ -848,8 +987,8 @@ class PMSMainWindow:
             self.running = True
             self.root.after(0, self.update_ui_status)
             
-            # 데이터 업데이트 스레드 시작
-            self.start_update_thread()
+            # 주기적 데이터 갱신 시작 (GUI 스레드에서 예약)
+            self.root.after(0, self.start_ui_refresh)
             
         except Exception as e:
             raise e
@@ -861,9 +1000,10 @@ class PMSMainWindow:
         
         self.running = False
         
-        # 업데이트 스레드 정지
-        if self.update_thread and self.update_thread.is_alive():
-            self.update_thread.join(timeout=2)
+        # 주기적 데이터 갱신 중지
+        if self._tick_after_id is not None:
+            self.root.after_cancel(self._tick_after_id)
+            self._tick_after_id = None
         
         # MQTT 연결 해제
         if self.mqtt_client and self.loop is not None:
@@ -881,7 +1021,7 @@ class PMSMainWindow:
         try:
             # 데이터 매니저가 있는 경우에만 시스템 상태 가져오기
             if data_manager is not None:
-                system_status = data_manager.get_system_status()
+                system_status = self._status()
                 
                 # 시스템 상태 라벨 업데이트
                 if system_status.get('running', False):
@@ -903,41 +1043,64 @@ class PMSMainWindow:
                 self.mqtt_status_label.config(text="MQTT: 독립모드", style='Status.TLabel')
                 
             # 각 장비 탭의 데이터 업데이트
-            if hasattr(self, 'device_tabs'):
-                for tab in self.device_tabs:
-                    if hasattr(tab, 'update_data'):
-                        try:
-                            tab.update_data()
-                        except Exception as e:
-                            print(f"탭 {tab.__class__.__name__} 업데이트 오류: {e}")
+            self._update_all_tabs()
                 
         except Exception as e:
             print(f"UI 상태 업데이트 오류: {e}")
             self.status_label.config(text="시스템 상태: 오류", style='Disconnected.TLabel')
             self.mqtt_status_label.config(text="MQTT: 오류", style='Disconnected.TLabel')
     
-    def start_update_thread(self):
-        """데이터 업데이트 스레드 시작"""
-        print(f"🔄 데이터 업데이트 스레드 시작 (통합모드: {self.integrated_mode})")
+    def _status(self) -> Dict[str, Any]:
+        """시스템 상태 스냅샷 조회 (250ms 이내 재호출은 캐시 반환, 탭 갱신과 공유)"""
+        now = time.monotonic()
+        if self._status_cache is None or now - self._status_cache_ts >= 0.25:
+            self._status_cache = data_manager.get_system_status()
+            self._status_cache_ts = now
+        return self._status_cache
+    
+    def start_ui_refresh(self):
+        """주기적 데이터 갱신 시작 (별도 스레드 없이 Tk after로 GUI 스레드에서 실행)"""
+        print(f"🔄 데이터 갱신 시작 (통합모드: {self.integrated_mode})")
         print(f"   📊 data_manager 상태: {'연결됨' if data_manager is not None else 'None'}")
         print(f"   📱 장비 탭 수: {len(self.device_tabs) if hasattr(self, 'device_tabs') else 0}")
         
-        def update_loop():
-            while self.running:
-                try:
-                    # 각 탭의 데이터 업데이트
-                    for tab in self.device_tabs.values():
-                        if hasattr(tab, 'update_data'):
-                            self.root.after(0, tab.update_data)
-                    
-                    # 1초마다 업데이트
-                    threading.Event().wait(1)
-                    
-                except Exception as e:
-                    print(f"업데이트 오류: {e}")
+        if self._tick_after_id is None:
+            self._tick_after_id = self.root.after(500, self._tick)
+    
+    def _tick(self):
+        """각 장비 탭 데이터 갱신 후 다음 갱신 예약"""
+        self._tick_after_id = None
+        if not self.running:
+            return
         
-        self.update_thread = threading.Thread(target=update_loop, daemon=True)
-        self.update_thread.start()
+        self._update_all_tabs()
+        
+        self._ui_interval_ms = self._next_ui_interval()
+        self._tick_after_id = self.root.after(self._ui_interval_ms, self._tick)
+    
+    def _update_all_tabs(self):
+        """갱신 대상 장비 탭 전체를 한 번의 콜백에서 순차 갱신"""
+        for tab in self._updatable_tabs:
+            try:
+                tab.update_data()
+            except Exception as e:
+                print(f"탭 {tab.__class__.__name__} 업데이트 오류: {e}")
+    
+    def _next_ui_interval(self) -> int:
+        """최근 데이터 변경 여부에 따라 다음 갱신 주기(ms) 결정"""
+        now = time.monotonic()
+        if data_manager is not None:
+            last_update = data_manager.get_last_update()
+            if last_update != self._last_data_update:
+                self._last_data_update = last_update
+                self._last_change_ts = now
+        
+        idle = now - self._last_change_ts
+        if idle < 1.0:
+            return 200   # 데이터 수신 중: 빠르게 반영
+        if idle < 10.0:
+            return 1000
+        return 2000      # 장시간 변경 없음: 갱신 빈도 낮춤
     
     def run(self):
         """GUI 실행"""
@@ -957,6 +1120,13 @@ class PMSMainWindow:
     
     def cleanup(self):
         """리소스 정리"""
+        # 공용 MQTT 연결 해제 (stop_system에서 이미 해제된 경우 생략)
+        if self.mqtt_client and self.mqtt_client.is_connected() and self.loop and self.loop.is_running():
+            try:
+                self.run_async(self.mqtt_client.disconnect()).result(timeout=5)
+            except Exception:
+                pass
+        
         if self.loop:
             self.loop.call_soon_threadsafe(self.loop.stop)
 
@@ -964,6 +1134,9 @@ class PMSMainWindow:
 class DeviceTab:
     """장비 탭 기본 클래스"""
     
+    _RERENDER_INTERVAL = 30.0  # 데이터 변화가 없어도 트리뷰를 다시 그리는 최대 간격 (초)
+    _WRITE_COALESCE_MS = 50  # 연속 레지스터 쓰기를 하나의 제어 메시지로 묶는 대기 시간 (ms)
+    
     def __init__(self, parent, device_config: Dict[str, Any], handlers: List, main_window=None):
         self.parent = parent
         self.device_config = device_config
@@ -972,6 +1145,16 @@ class DeviceTab:
         self.device_type = device_config['type']
         self.integrated_mode = False  # 통합 모드 플래그 추가
         self.main_window = main_window  # 메인 윈도우 참조 저장
+        self._control_topic = f"pms/control/{self.device_name}/command"  # 제어 명령 토픽 (1회 생성)
+        self._row_keys = []  # 데이터 트리뷰에 표시 중인 행의 파라미터명 순서
+        self._row_iids = []  # 위 행들의 트리뷰 아이템 ID
+        self._row_values = []  # 위 행들에 마지막으로 반영한 값 튜플
+        self._ts_cache = (None, None)  # 직전 타임스탬프 (원본 문자열, 파싱된 datetime)
+        self._last_rendered_ts = None  # 마지막으로 트리뷰에 표시한 장비 데이터 타임스탬프
+        self._last_render_time = 0.0  # 마지막 트리뷰 갱신 시각 (monotonic)
+        self.visible = True  # 노트북에서 선택된 탭 여부 (숨겨진 탭은 트리뷰 갱신 생략)
+        self._pending_writes = []  # 전송 대기 중인 레지스터 쓰기 (주소, 값, 설명)
+        self._write_flush_id = None  # 대기 중인 일괄 전송 after() ID
         
         # 핸들러 찾기
         self.device_handler = None
@@ -979,7 +1162,10 @@ class DeviceTab:
             if handler.name == self.device_name:
                 self.device_handler = handler
                 break
+        self._handler_has_connected = hasattr(self.device_handler, 'connected')  # 핸들러 속성 확인 (1회)
         
+        self.connection_label = None  # 하위 클래스 create_widgets에서 생성
+        self.status_var = tk.StringVar()  # 제어 명령 결과 상태 줄
         self.create_widgets()
     
     def create_widgets(self):
@@ -990,10 +1176,222 @@ class DeviceTab:
         """데이터 업데이트 (하위 클래스에서 구현)"""
         pass
     
+    def show_command_status(self, text: str):
+        """제어 명령 성공 결과를 상태 줄에 표시
+        
+        연속 제어 시 모달 대화상자가 쌓이지 않도록 성공 알림은 메시지 박스 대신
+        이 상태 줄을 사용하고, 메시지 박스는 오류에만 사용한다.
+        """
+        self.status_var.set(f"{text} ({datetime.now():%H:%M:%S})")
+    
     def update_data_display(self, device_data):
         """데이터 표시 영역 업데이트 (하위 클래스에서 구현)"""
         pass
     
+    def update_real_data(self):
+        """실제 장비 데이터 업데이트 (독립 모드: 핸들러 상태 정보 표시)"""
+        if not self.device_handler:
+            return
+        
+        # 표시할 행 수집 후 한 번에 반영
+        rows = []
+        
+        try:
+            # 장비 핸들러의 상태 정보 표시 (행 템플릿에 값만 채움)
+            status_info = self.device_handler.get_status()
+            
+            for status_key, param, unit, description in _STATUS_ROW_TEMPLATES:
+                value = status_info[status_key]
+                if status_key == 'connected':
+                    value = '예' if value else '아니오'
+                elif status_key == 'last_successful_read' and not value:
+                    continue  # 아직 읽기 성공 기록이 없으면 행 생략
+                rows.append(('-', param, str(value), unit, description))
+            
+        except Exception as e:
+            rows.append((
+                '-', 'error', str(e), '', '데이터 읽기 오류'
+            ))
+        
+        self.render_rows(rows)
+    
+    def _needs_render(self, device_data) -> bool:
+        """장비 데이터 타임스탬프가 바뀐 경우에만 트리뷰 갱신
+        
+        타임스탬프가 그대로여도 _RERENDER_INTERVAL마다 한 번은 다시 그려
+        데이터 신선도(5분 초과) 표시가 늦지 않도록 한다.
+        """
+        ts = device_data.get('timestamp') if device_data else None
+        now = time.monotonic()
+        if ts is not None and ts == self._last_rendered_ts and now - self._last_render_time < self._RERENDER_INTERVAL:
+            return False
+        self._last_rendered_ts = ts
+        self._last_render_time = now
+        return True
+    
+    def _parse_timestamp(self, raw):
+        """ISO 형식 타임스탬프 문자열 파싱 (직전과 같은 문자열이면 파싱 생략)"""
+        if raw == self._ts_cache[0]:
+            return self._ts_cache[1]
+        parsed = datetime.fromisoformat(raw.replace('Z', '+00:00'))
+        self._ts_cache = (raw, parsed)
+        return parsed
+    
+    def _data_age_seconds(self, device_data, timestamp):
+        """장비 데이터 경과 시간 (초)
+        
+        데이터 매니저가 저장 시 기록한 monotonic 시각(mono_ts)이 있으면 숫자 뺄셈만 하고,
+        mono_ts가 없는 데이터만 datetime 연산으로 계산한다.
+        """
+        mono_ts = device_data.get('mono_ts')
+        if mono_ts is not None:
+            return time.monotonic() - mono_ts
+        return (datetime.now() - timestamp).total_seconds()
+    
+    def queue_modbus_write(self, address, value, description):
+        """레지스터 쓰기를 전송 대기열에 추가 (_WRITE_COALESCE_MS 이내의 쓰기는 한 번에 전송)"""
+        self._pending_writes.append((address, value, description))
+        if self._write_flush_id is None:
+            self._write_flush_id = self.parent.after(self._WRITE_COALESCE_MS, self.flush_modbus_writes)
+    
+    def flush_modbus_writes(self):
+        """대기 중인 레지스터 쓰기 전송
+        
+        1건이면 기존 write_register 메시지로, 여러 건이면 write_registers 메시지 하나로 보낸다.
+        서로 독립적인 조작이 묶인 것이므로 앞선 쓰기가 실패해도 나머지는 계속 실행한다 (stop_on_error=False).
+        """
+        if self._write_flush_id is not None:
+            self.parent.after_cancel(self._write_flush_id)
+            self._write_flush_id = None
+        
+        writes, self._pending_writes = self._pending_writes, []
+        if not writes:
+            return
+        
+        try:
+            if len(writes) == 1:
+                address, value, description = writes[0]
+                # 제어 명령 페이로드 생성 (요청 ID는 monotonic 카운터로 생성)
+                command_data = {
+                    "action": "write_register",
+                    "address": address,
+                    "value": value,
+                    "description": description,
+                    "timestamp": _iso_from_ns(time.time_ns()),
+                    "gui_request_id": f"{self.device_name}_{address}_{time.monotonic_ns()}"
+                }
+                status_text = f"{description} 명령 전송 완료 (주소: {address}, 값: 0x{value:04X})"
+            else:
+                description = ", ".join(description for _, _, description in writes)
+                command_data = {
+                    "action": "write_registers",
+                    "writes": [
+                        {"address": address, "value": value, "description": desc}
+                        for address, value, desc in writes
+                    ],
+                    "stop_on_error": False,
+                    "description": description,
+                    "timestamp": _iso_from_ns(time.time_ns()),
+                    "gui_request_id": f"{self.device_name}_batch_{time.monotonic_ns()}"
+                }
+                status_text = f"{description} 명령 전송 완료 ({len(writes)}건)"
+            
+            self._send_control_command(command_data, status_text)
+        except Exception as e:
+            messagebox.showerror("오류", f"제어 명령 전송 중 오류: {e}")
+    
+    def _send_control_command(self, command_data, status_text):
+        """공용 이벤트 루프에서 제어 메시지 전송 후 GUI 스레드에서 결과 표시"""
+        def on_sent(future):
+            try:
+                if future.result():
+                    self.show_command_status(status_text)
+                else:
+                    messagebox.showerror("오류", "MQTT 제어 명령 전송에 실패했습니다.")
+            except Exception as e:
+                messagebox.showerror("오류", f"제어 명령 전송 중 오류: {e}")
+        
+        # 메인 윈도우의 공용 이벤트 루프에서 전송 (GUI 블로킹 방지)
+        self.main_window.run_async(
+            self.main_window.send_mqtt_control_command(self._control_topic, command_data), on_sent
+        )
+    
+    def write_modbus_registers(self, writes, description):
+        """여러 Modbus 레지스터를 하나의 제어 메시지로 일괄 쓰기
+        
+        Args:
+            writes: (주소, 값) 목록 - 백그라운드 서버에서 순서대로 실행
+            description: 일괄 명령 설명
+        """
+        if not (self.integrated_mode and self.main_window):
+            # 독립 모드에서는 개별 쓰기로 처리
+            for address, value in writes:
+                self.write_modbus_register(address, value, description)
+            return
+        
+        # 먼저 요청된 개별 쓰기가 일괄 명령보다 늦게 실행되지 않도록 대기열부터 전송
+        self.flush_modbus_writes()
+        
+        try:
+            command_data = {
+                "action": "write_registers",
+                "writes": [{"address": address, "value": value} for address, value in writes],
+                "description": description,
+                "timestamp": _iso_from_ns(time.time_ns()),
+                "gui_request_id": f"{self.device_name}_batch_{time.monotonic_ns()}"
+            }
+            
+            detail = ", ".join(f"{address}=0x{value:04X}" for address, value in writes)
+            self._send_control_command(command_data, f"{description} 명령 전송 완료 ({detail})")
+        except Exception as e:
+            messagebox.showerror("오류", f"{description} 실행 중 오류: {e}")
+    
+    def render_rows(self, rows):
+        """데이터 트리뷰에 행 목록 반영
+        
+        파라미터명 순서가 이전과 같으면 값이 바뀐 아이템만 갱신하고
+        (수백 개 행이어도 Tk 호출은 변경된 행 수만큼만 발생),
+        순서가 달라진 경우에는 기존 아이템을 위치 순서대로 재사용하고
+        남는 아이템만 한 번에 삭제, 모자란 행만 새로 삽입한다.
+        """
+        if rows == self._row_values:
+            return  # 직전과 완전히 같은 내용 (예: 독립 모드 상태 정보 미변경) - 행별 비교/Tk 호출 생략
+        
+        tree = self.data_tree
+        keys = [values[1] for values in rows]
+        if keys == self._row_keys:
+            tree_item = tree.item
+            for iid, old, values in zip(self._row_iids, self._row_values, rows):
+                if values != old:
+                    tree_item(iid, values=values)
+            self._row_values = rows
+            return
+        
+        # 기존 아이템 재사용 (삭제/재삽입 없이 값만 교체)
+        iids = list(tree.get_children())
+        reused = min(len(iids), len(rows))
+        tree_item = tree.item
+        for iid, values in zip(iids, rows):
+            tree_item(iid, values=values)
+        
+        if len(iids) > reused:
+            tree.delete(*iids[reused:])
+            del iids[reused:]
+        elif len(rows) > reused:
+            tree_insert, END = tree.insert, tk.END
+            iids.extend(tree_insert('', END, values=values) for values in rows[reused:])
+        
+        self._row_iids = iids
+        self._row_keys = keys
+        self._row_values = rows
+    
+    def setup_data_columns(self, tree, widths=None):
+        """데이터 트리뷰 컬럼 제목/너비 설정 (설명 컬럼만 창 너비에 맞춰 늘어남)"""
+        widths = widths or {}
+        for cid, title, width in _DATA_COLUMNS:
+            tree.heading(cid, text=title)
+            tree.column(cid, width=widths.get(cid, width), stretch=(cid == 'description'))
+    
     def create_scrollable_treeview(self, parent, columns):
         """스크롤 가능한 트리뷰 생성 (공통 메소드)"""
         # 트리뷰 프레임
@@ -1002,6 +1400,7 @@ class DeviceTab:
         
         # 트리뷰 생성
         tree = ttk.Treeview(tree_frame, columns=columns, show='headings')
+        tree._col_index = {c: i for i, c in enumerate(columns)}  # 컬럼명 -> 인덱스 (복사 시 재탐색 방지)
         
         # 수직 스크롤바
         v_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=tree.yview)
@@ -1062,8 +1461,11 @@ class DeviceTab:
             # Shift 키 또는 그냥 휠로 수평 스크롤
             canvas.xview_scroll(int(-1 * (event.delta / 120)), "units")
         
-        canvas.bind("<MouseWheel>", on_mousewheel)
-        scrollable_frame.bind("<MouseWheel>", on_mousewheel)
+        # 캔버스와 내부 프레임이 공유하는 바인딩 태그 하나에만 등록
+        scroll_tag = f"scroll_{id(canvas)}"
+        canvas.bind_class(scroll_tag, "<MouseWheel>", on_mousewheel)
+        for widget in (canvas, scrollable_frame):
+            widget.bindtags(widget.bindtags() + (scroll_tag,))
         
         # 그리드 배치
         canvas.grid(row=0, column=0, sticky="ew")
@@ -1104,29 +1506,14 @@ class DeviceTab:
             # tkinter 클립보드 방법 1
             widget.clipboard_clear()
             widget.clipboard_append(text)
-            widget.update()  # 중요: update() 호출로 클립보드 적용
-            
-            # 추가 검증: 복사된 내용 확인
-            try:
-                copied_text = widget.selection_get(selection="CLIPBOARD")
-                if copied_text == text:
-                    return True
-            except:
-                pass
-                
-            # 방법 2: 다른 방식으로 시도
-            try:
-                import subprocess
-                import sys
-                if sys.platform == "win32":
-                    # Windows cmd 사용
-                    subprocess.run(['cmd', '/c', f'echo {text} | clip'], shell=True, check=True)
-                    return True
-            except:
-                pass
-                
-            return False
-            
+            widget.update_idletasks()  # 클립보드 적용 (전체 update()는 불필요한 재배치 유발)
+            return True
+        except tk.TclError as e:
+            print(f"⚠️ Tk 클립보드 복사 실패, Win32 API로 재시도: {e}")
+        
+        # 방법 2: Win32 클립보드 API 직접 사용 (셸/외부 프로세스 없이)
+        try:
+            return _win32_set_clipboard(text)
         except Exception as e:
             print(f"❌ 클립보드 복사 실패: {e}")
             return False
@@ -1159,11 +1546,7 @@ class DeviceTab:
             values = tree.item(selected_item, 'values')
             
             # 컬럼 인덱스 찾기
-            column_index = None
-            for col in tree['columns']:
-                if col == column_name:
-                    column_index = tree['columns'].index(col)
-                    break
+            column_index = tree._col_index.get(column_name)
             
             if column_index is not None and column_index < len(values):
                 value = str(values[column_index])
@@ -1187,9 +1570,8 @@ class DeviceTab:
             values = tree.item(selected_item, 'values')
             
             # address와 value 컬럼 찾기
-            columns = tree['columns']
-            address_idx = columns.index('address') if 'address' in columns else None
-            value_idx = columns.index('value') if 'value' in columns else None
+            address_idx = tree._col_index.get('address')
+            value_idx = tree._col_index.get('value')
             
             if address_idx is not None and value_idx is not None:
                 address = values[address_idx] if address_idx < len(values) else "N/A"
@@ -1215,10 +1597,9 @@ class DeviceTab:
             selected_item = tree.selection()[0]
             values = tree.item(selected_item, 'values')
             
-            columns = tree['columns']
-            address_idx = columns.index('address') if 'address' in columns else None
-            value_idx = columns.index('value') if 'value' in columns else None
-            param_idx = columns.index('parameter') if 'parameter' in columns else None
+            address_idx = tree._col_index.get('address')
+            value_idx = tree._col_index.get('value')
+            param_idx = tree._col_index.get('parameter')
             
             if address_idx is not None and value_idx is not None:
                 address = values[address_idx] if address_idx < len(values) else "N/A"
@@ -1228,30 +1609,21 @@ class DeviceTab:
                 # 비트마스크 데이터 특별 처리
                 hex_info = ""
                 try:
-                    # 비트마스크 형태인지 확인 (활성비트: 형태 포함)
-                    if "활성비트:" in str(value_str):
-                        # "1000 (활성비트:3) [Bit 3, Bit 5, Bit 6...]" 형태에서 숫자 추출
-                        import re
-                        match = re.match(r'^(\d+)', str(value_str))
-                        if match:
-                            decimal_val = int(match.group(1))
-                            hex_val = f"0x{decimal_val:04X}"
-                            binary_val = f"{decimal_val:016b}"
-                            
-                            # 활성 비트 정보 추출
-                            active_match = re.search(r'활성비트:(\d+)', str(value_str))
-                            active_count = active_match.group(1) if active_match else "0"
-                            
-                            hex_info = f" | RAW_DECIMAL:{decimal_val} | HEX:{hex_val} | Binary:{binary_val} | ActiveBits:{active_count}"
-                        else:
-                            hex_info = f" | BitMask_Data:{value_str}"
+                    # 값 형태 판별 (한 번의 정규식 매칭)
+                    value_text = str(value_str)
+                    match = _VALUE_RE.match(value_text)
                     
-                    # 일반 숫자 값 처리
-                    elif str(value_str).replace(' (정상)', '').isdigit():
-                        decimal_val = int(str(value_str).replace(' (정상)', ''))
-                        hex_val = f"0x{decimal_val:04X}"
-                        binary_val = f"{decimal_val:016b}"
-                        hex_info = f" | HEX:{hex_val} | Binary:{binary_val}"
+                    if match:
+                        decimal_val = int(match.group('num'))
+                        active_count = match.group('active')
+                        if active_count is not None:
+                            # 비트마스크 데이터: "1000 (활성비트:3) [Bit 3, Bit 5, Bit 6...]"
+                            hex_info = f" | RAW_DECIMAL:{decimal_val} | HEX:0x{decimal_val:04X} | Binary:{decimal_val:016b} | ActiveBits:{active_count}"
+                        else:
+                            # 일반 숫자 값: "123" 또는 "123 (정상)"
+                            hex_info = f" | HEX:0x{decimal_val:04X} | Binary:{decimal_val:016b}"
+                    elif "활성비트:" in value_text:
+                        hex_info = f" | BitMask_Data:{value_str}"
                     
                     # 주소 정보 추가
                     if str(address).replace('0x', '').isalnum():
@@ -1282,6 +1654,12 @@ class DeviceTab:
 class BMSTab(DeviceTab):
     """BMS 탭 클래스"""
     
+    # 메모리 맵 섹션 (데이터 표시용 / 주소 -> 레지스터 이름 검색용, 제어 레지스터 우선)
+    _BMS_SECTIONS = ('data_registers', 'module_voltages', 'status_registers',
+                     'module_status_registers', 'module_temperatures', 'cell_voltages')
+    _BMS_REGISTER_SECTIONS = ('control_registers',) + _BMS_SECTIONS
+    _UNKNOWN_INFO = {'address': '-', 'addr_display': '-', 'unit': '', 'description': '알 수 없는 데이터'}  # 인덱스에 없는 키 (읽기 전용)
+    
     def create_widgets(self):
         """BMS 탭 위젯 생성"""
         # 메인 프레임
@@ -1298,26 +1676,18 @@ class BMSTab(DeviceTab):
         self.connection_label = ttk.Label(info_frame, text="연결 상태: 확인중", style='Status.TLabel')
         self.connection_label.grid(row=0, column=2, padx=(20, 0), sticky=tk.W)
         
+        # 제어 명령 결과 상태 줄
+        ttk.Label(info_frame, textvariable=self.status_var, style='Status.TLabel').grid(row=0, column=3, padx=(20, 0), sticky=tk.W)
+        
         # 데이터 표시 영역
         data_frame = ttk.LabelFrame(main_frame, text="실시간 데이터", padding="10")
         data_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
         
         # 스크롤 가능한 데이터 트리뷰
-        columns = ('address', 'parameter', 'value', 'unit', 'description')
-        self.data_tree = self.create_scrollable_treeview(data_frame, columns)
+        self.data_tree = self.create_scrollable_treeview(data_frame, _DATA_COLUMN_IDS)
         
         # 컬럼 설정
-        self.data_tree.heading('address', text='주소')
-        self.data_tree.heading('parameter', text='파라미터')
-        self.data_tree.heading('value', text='값')
-        self.data_tree.heading('unit', text='단위')
-        self.data_tree.heading('description', text='설명')
-        
-        self.data_tree.column('address', width=80)
-        self.data_tree.column('parameter', width=200)
-        self.data_tree.column('value', width=150)
-        self.data_tree.column('unit', width=80)
-        self.data_tree.column('description', width=400)
+        self.setup_data_columns(self.data_tree)
         
         # 스크롤 가능한 제어 패널
         control_frame = self.create_scrollable_control_frame(main_frame, "BMS 제어")
@@ -1385,46 +1755,6 @@ class BMSTab(DeviceTab):
         except Exception as e:
             messagebox.showerror("오류", f"에러 리셋 중 오류: {e}")
     
-    def _subscribe_to_control_response(self, response_topic: str, request_id: str):
-        """제어 명령 응답 구독"""
-        try:
-            mqtt_client = self.parent.master.mqtt_client
-            if mqtt_client:
-                # 응답 콜백 등록
-                def on_control_response(topic, payload):
-                    try:
-                        response_data = json.loads(payload)
-                        if response_data.get("request_id") == request_id:
-                            success = response_data.get("success", False)
-                            message = response_data.get("message", "")
-                            
-                            if success:
-                                messagebox.showinfo("제어 성공", f"명령이 성공적으로 실행되었습니다.\n{message}")
-                            else:
-                                messagebox.showerror("제어 실패", f"명령 실행에 실패했습니다.\n{message}")
-                                
-                            # 일회성 구독 해제
-                            mqtt_client.unsubscribe(response_topic)
-                    except Exception as e:
-                        print(f"제어 응답 처리 오류: {e}")
-                
-                # 임시 응답 구독 (5초 후 자동 해제)
-                mqtt_client.subscribe(response_topic, on_control_response)
-                
-                # 5초 후 구독 해제 스케줄링
-                def unsubscribe_after_timeout():
-                    time.sleep(5)
-                    try:
-                        mqtt_client.unsubscribe(response_topic)
-                    except:
-                        pass
-                
-                import threading
-                threading.Thread(target=unsubscribe_after_timeout, daemon=True).start()
-                
-        except Exception as e:
-            print(f"제어 응답 구독 오류: {e}")
-
     def set_ip_address(self):
         """IP 주소 설정"""
         ip_str = self.ip_entry.get().strip()
@@ -1433,103 +1763,62 @@ class BMSTab(DeviceTab):
             return
         
         try:
-            # IP 주소 파싱 (A.B.C.D)
-            parts = ip_str.split('.')
-            if len(parts) != 4:
+            # IP 주소 파싱 (A.B.C.D) 후 A.B와 C.D를 16비트 값으로 분리
+            try:
+                packed = socket.inet_pton(socket.AF_INET, ip_str)
+            except OSError:
                 raise ValueError("잘못된 IP 형식")
-            
-            a, b, c, d = [int(x) for x in parts]
-            if not all(0 <= x <= 255 for x in [a, b, c, d]):
-                raise ValueError("IP 주소 범위 초과")
-            
-            # A.B와 C.D로 분리하여 16비트 값으로 변환
-            ab_value = (a << 8) | b
-            cd_value = (c << 8) | d
+            ab_value, cd_value = struct.unpack('>HH', packed)
             
             result = messagebox.askyesno("확인", f"IP 주소를 {ip_str}로 설정하시겠습니까?\n(설정 후 장비가 재시작됩니다)")
             if result:
-                self.write_modbus_register(203, ab_value, f"IP A.B 설정 (0x{ab_value:04X})")
-                self.write_modbus_register(204, cd_value, f"IP C.D 설정 (0x{cd_value:04X})")
-                self.write_modbus_register(205, 0xAA55, "RBMS 재시작")
+                # IP A.B, IP C.D, RBMS 재시작을 하나의 제어 메시지로 순서대로 전송
+                self.write_modbus_registers(
+                    [(203, ab_value), (204, cd_value), (205, 0xAA55)],
+                    f"IP 주소 설정 ({ip_str}) 및 RBMS 재시작"
+                )
                 messagebox.showinfo("정보", f"IP 주소 설정 완료: {ip_str}\n장비가 재시작됩니다.")
                 
         except ValueError as e:
             messagebox.showerror("오류", f"IP 주소 형식이 잘못되었습니다: {e}")
 
     def write_modbus_register(self, address, value, description):
-        """Modbus 레지스터 쓰기 - 임시 MQTT 연결을 통한 백그라운드 서버 제어"""
+        """Modbus 레지스터 쓰기 - 공용 MQTT 클라이언트를 통한 백그라운드 서버 제어"""
         try:
-            # 통합 모드에서는 임시 MQTT 연결을 통해 백그라운드 서버에 제어 명령 전송
+            # 통합 모드에서는 공용 MQTT 클라이언트로 백그라운드 서버에 제어 명령 전송
             if self.integrated_mode and self.main_window:
-                # 제어 명령 페이로드 생성
-                command_data = {
-                    "action": "write_register",
-                    "address": address,
-                    "value": value,
-                    "description": description,
-                    "timestamp": datetime.now().isoformat(),
-                    "gui_request_id": f"{self.device_name}_{address}_{int(time.time() * 1000000)}"
-                }
-                
-                # 임시 MQTT 연결을 통한 제어 명령 전송
-                control_topic = f"pms/control/{self.device_name}/command"
-                
-                # 비동기 임시 MQTT 전송 실행
-                def send_command():
-                    import asyncio
-                    try:
-                        # 새 이벤트 루프에서 실행
-                        loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop)
-                        if self.main_window and hasattr(self.main_window, 'send_mqtt_control_command_temp'):
-                            success = loop.run_until_complete(
-                                self.main_window.send_mqtt_control_command_temp(control_topic, command_data)
-                            )
-                        else:
-                            success = False
-                        loop.close()
-                        
-                        if success:
-                            messagebox.showinfo("제어 명령", f"{description} 명령을 백그라운드 서버로 전송했습니다.\n주소: {address}, 값: 0x{value:04X}")
-                        else:
-                            messagebox.showerror("오류", "MQTT 제어 명령 전송에 실패했습니다.")
-                    except Exception as e:
-                        messagebox.showerror("오류", f"제어 명령 전송 중 오류: {e}")
-                
-                # 별도 스레드에서 실행 (GUI 블로킹 방지)
-                import threading
-                thread = threading.Thread(target=send_command, daemon=True)
-                thread.start()
-                
+                # 짧은 시간 안의 연속 쓰기는 하나의 제어 메시지로 묶어 전송
+                self.queue_modbus_write(address, value, description)
             else:
                 # 독립 모드에서는 직접 핸들러 접근 (기존 방식)
                 if self.device_handler and hasattr(self.device_handler, 'write_register'):
                     self._execute_async_write(self.device_handler, address, value, description)
                 else:
-                    messagebox.showinfo("독립모드", f"{description} 명령 전송 (시뮬레이션)\n주소: {address}, 값: 0x{value:04X}")
+                    self.show_command_status(f"{description} 명령 전송 (독립모드 시뮬레이션, 주소: {address}, 값: 0x{value:04X})")
         except Exception as e:
             messagebox.showerror("오류", f"{description} 실행 중 오류: {e}")
     
     def _execute_async_write(self, handler, address, value, description):
         """비동기 쓰기 작업 실행"""
         try:
-            # 메인 루프에서 실행되는 비동기 작업
-            main_window = self.parent.master
-            if hasattr(main_window, 'loop') and main_window.loop:
+            # 메인 윈도우의 공용 이벤트 루프에서 실행되는 비동기 작업
+            main_window = self.main_window
+            if main_window is not None and main_window.loop:
                 # 레지스터 이름 찾기 (주소 -> 레지스터 이름 매핑)
                 register_name = self._find_register_name_by_address(address)
                 if register_name:
+                    # 완료 후 GUI 스레드에서 결과 표시 (Tk 스레드에서 future 대기 금지)
+                    def on_done(future):
+                        try:
+                            if future.result():
+                                self.show_command_status(f"{description} 명령 전송 성공 (주소: {address}, 값: {value})")
+                            else:
+                                messagebox.showerror("실패", f"{description} 명령 전송에 실패했습니다.")
+                        except Exception as e:
+                            messagebox.showerror("오류", f"비동기 쓰기 실행 중 오류: {e}")
+                    
                     # 비동기 쓰기 작업 스케줄링
-                    future = asyncio.run_coroutine_threadsafe(
-                        handler.write_register(register_name, value), 
-                        main_window.loop
-                    )
-                    # 결과 확인 (타임아웃 설정)
-                    result = future.result(timeout=5)
-                    if result:
-                        messagebox.showinfo("성공", f"{description} 명령이 성공적으로 전송되었습니다.\n주소: {address}, 값: {value}")
-                    else:
-                        messagebox.showerror("실패", f"{description} 명령 전송에 실패했습니다.")
+                    main_window.run_async(handler.write_register(register_name, value), on_done)
                 else:
                     messagebox.showerror("오류", f"주소 {address}에 해당하는 레지스터를 찾을 수 없습니다.")
             else:
@@ -1538,28 +1827,9 @@ class BMSTab(DeviceTab):
             messagebox.showerror("오류", f"비동기 쓰기 실행 중 오류: {e}")
     
     def _find_register_name_by_address(self, address):
-        """주소로부터 레지스터 이름 찾기"""
+        """주소로부터 레지스터 이름 찾기 (맵 로드 시 1회 생성한 주소 인덱스 사용)"""
         try:
-            # BMS 메모리 맵에서 주소로 레지스터 이름 찾기
-            memory_map = self._get_bms_memory_map()
-            
-            # 제어 레지스터에서 검색
-            control_registers = memory_map.get('control_registers', {})
-            for register_name, register_info in control_registers.items():
-                if register_info.get('address') == address:
-                    return register_name
-            
-            # 다른 섹션에서도 검색
-            sections = ['data_registers', 'module_voltages', 'status_registers', 
-                       'module_status_registers', 'module_temperatures', 'cell_voltages']
-            
-            for section in sections:
-                section_data = memory_map.get(section, {})
-                for register_name, register_info in section_data.items():
-                    if register_info.get('address') == address:
-                        return register_name
-            
-            return None
+            return _memory_map_address_index('bms_map.json', self._BMS_REGISTER_SECTIONS).get(address)
         except Exception as e:
             print(f"레지스터 이름 검색 오류: {e}")
             return None
@@ -1567,7 +1837,7 @@ class BMSTab(DeviceTab):
     def update_data(self):
         """BMS 데이터 업데이트"""
         # 통합 모드에서는 데이터 매니저에서 데이터 가져오기
-        if hasattr(self, 'integrated_mode') and self.integrated_mode and data_manager is not None:
+        if self.integrated_mode and data_manager is not None:
             device_status = data_manager.get_device_status(self.device_name)
             device_data = data_manager.get_device_data(self.device_name)
             
@@ -1585,42 +1855,40 @@ class BMSTab(DeviceTab):
             else:
                 self.connection_label.config(text="연결 상태: 확인중", style='Status.TLabel')
             
-            # 실시간 데이터 표시
-            self.update_data_display(device_data)
+            # 실시간 데이터 표시 (숨겨진 탭이거나 새 데이터가 없으면 트리뷰 갱신 생략)
+            if self.visible and self._needs_render(device_data):
+                self.update_data_display(device_data)
         else:
             # 통합 모드가 아니거나 data_manager가 None인 경우 디버깅 정보 출력
-            if hasattr(self, 'integrated_mode') and self.integrated_mode and data_manager is None:
+            if self.integrated_mode and data_manager is None:
                 print(f"⚠️ {self.device_name} BMS 탭: data_manager가 None - 통합 모드 실행 필요")
                 self.connection_label.config(text="연결 상태: data_manager 없음", style='Disconnected.TLabel')
                 return
             
             # 기존 로직 (독립 모드)
             if not self.device_handler:
-                if hasattr(self, 'connection_label'):
-                    self.connection_label.config(text="연결 상태: 핸들러 없음", style='Disconnected.TLabel')
+                self.connection_label.config(text="연결 상태: 핸들러 없음", style='Disconnected.TLabel')
                 return
             
             try:
                 # 연결 상태 업데이트
-                if hasattr(self, 'connection_label'):
-                    if self.device_handler and hasattr(self.device_handler, 'connected') and self.device_handler.connected:
-                        self.connection_label.config(text="연결 상태: 연결됨", style='Connected.TLabel')
-                    else:
-                        self.connection_label.config(text="연결 상태: 연결안됨", style='Disconnected.TLabel')
+                if self._handler_has_connected and self.device_handler.connected:
+                    self.connection_label.config(text="연결 상태: 연결됨", style='Connected.TLabel')
+                else:
+                    self.connection_label.config(text="연결 상태: 연결안됨", style='Disconnected.TLabel')
                 
-                # 실제 데이터 읽기 시도
-                self.update_real_data()
+                # 실제 데이터 읽기 시도 (숨겨진 탭은 갱신 생략)
+                if self.visible:
+                    self.update_real_data()
                 
             except Exception as e:
                 print(f"BMS 데이터 업데이트 오류: {e}")
-                if hasattr(self, 'connection_label'):
-                    self.connection_label.config(text="연결 상태: 오류", style='Disconnected.TLabel')
+                self.connection_label.config(text="연결 상태: 오류", style='Disconnected.TLabel')
     
     def update_data_display(self, device_data):
         """데이터 표시 영역 업데이트"""
-        # 기존 데이터 클리어
-        for item in self.data_tree.get_children():
-            self.data_tree.delete(item)
+        # 표시할 행 수집 후 한 번에 반영
+        rows = []
         
         if device_data:
             try:
@@ -1629,168 +1897,111 @@ class BMSTab(DeviceTab):
                 if timestamp:
                     if isinstance(timestamp, str):
                         try:
-                            timestamp = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+                            timestamp = self._parse_timestamp(timestamp)
                         except:
                             timestamp = datetime.now()
                     
-                    age_seconds = (datetime.now() - timestamp).total_seconds()
+                    age_seconds = self._data_age_seconds(device_data, timestamp)
                     if age_seconds > 300:  # 5분 초과
-                        self.data_tree.insert('', tk.END, values=(
+                        rows.append((
                             '-', 'status', '데이터 오래됨', '', f'{age_seconds:.0f}초 전 데이터'
                         ))
+                        self.render_rows(rows)
                         return
                 
                 # 실제 데이터 표시
                 data = device_data.get('data', {})
                 
                 # 장비 정보 표시
-                self.data_tree.insert('', tk.END, values=(
+                rows.append((
                     '-', 'device_name', data.get('device_name', 'N/A'), '', '장비 이름'
                 ))
-                self.data_tree.insert('', tk.END, values=(
+                rows.append((
                     '-', 'device_type', data.get('device_type', 'N/A'), '', '장비 타입'
                 ))
-                self.data_tree.insert('', tk.END, values=(
+                rows.append((
                     '-', 'ip_address', data.get('ip_address', 'N/A'), '', 'IP 주소'
                 ))
-                self.data_tree.insert('', tk.END, values=(
+                rows.append((
                     '-', 'timestamp', timestamp.strftime('%H:%M:%S') if timestamp else 'N/A', '', '업데이트 시간'
                 ))
                 
                 # 실제 센서 데이터가 있다면 표시
                 sensor_data = data.get('data', {})
                 if sensor_data:
-                    # BMS 메모리 맵 정보 가져오기 시도
-                    memory_map = self._get_bms_memory_map()
+                    # BMS 메모리 맵 키 인덱스 (갱신마다 1회 조회)
+                    key_index = self._get_bms_key_index()
                     
                     for key, value in sensor_data.items():
                         # 메모리 맵에서 주소와 단위 정보 찾기
-                        addr_info = self._find_address_info(key, memory_map)
-                        address = addr_info.get('address', '-')
+                        addr_info = key_index.get(key, self._UNKNOWN_INFO)
+                        addr_display = addr_info['addr_display']
                         unit = addr_info.get('unit', '')
                         description = addr_info.get('description', '센서 데이터')
                         
-                        # 16진수 주소 표시 (예: 0x0000)
-                        addr_display = f"0x{address:04X}" if isinstance(address, int) else str(address)
-                        
                         # 🔧 비트마스크 데이터 특별 처리
                         if isinstance(value, dict) and value.get('type') == 'bitmask':
-                            # 비트마스크 데이터는 특별한 형태로 표시
-                            raw_value = value.get('value', 0)
+                            # 비트마스크 데이터는 핸들러가 만든 표시 문자열 사용
+                            display_value = value.get('display')
                             active_bits = value.get('active_bits', [])
-                            total_active = len(active_bits)
                             
-                            if total_active > 0:
+                            if display_value is None:
+                                # 표시 문자열이 없는 데이터 (이전 형식) 는 직접 포맷
+                                raw_value = value.get('value', 0)
+                                total_active = len(active_bits)
+                                if total_active > 0:
+                                    display_value = f"{raw_value} (활성비트:{total_active}) [{', '.join([bit.split(':')[0] for bit in active_bits[:3]])}{'...' if total_active > 3 else ''}]"
+                                else:
+                                    display_value = f"{raw_value} (정상)"
+                            
+                            if active_bits:
                                 # 활성 비트가 있으면 상세 정보 표시
-                                display_value = f"{raw_value} (활성비트:{total_active}) [{', '.join([bit.split(':')[0] for bit in active_bits[:3]])}{'...' if total_active > 3 else ''}]"
                                 description = f"{description} | {value.get('interpretation', '')}"
-                            else:
-                                # 활성 비트가 없으면 단순 표시
-                                display_value = f"{raw_value} (정상)"
-                                
 
                         else:
                             # 일반 데이터는 기존 방식
                             display_value = str(value)
                         
-                        self.data_tree.insert('', tk.END, values=(
+                        rows.append((
                             addr_display, key, display_value, unit, description
                         ))
                 else:
-                    self.data_tree.insert('', tk.END, values=(
+                    rows.append((
                         '-', 'info', '센서 데이터 로드 중', '', '잠시 기다려주세요'
                     ))
                     
             except Exception as e:
-                self.data_tree.insert('', tk.END, values=(
+                rows.append((
                     '-', 'error', '데이터 파싱 오류', '', str(e)
                 ))
         else:
-            self.data_tree.insert('', tk.END, values=(
+            rows.append((
                 '-', 'status', '데이터 없음', '', '장비에서 데이터를 읽어오는 중입니다'
             ))
+        
+        self.render_rows(rows)
     
     def _get_bms_memory_map(self):
-        """BMS 메모리 맵 가져오기"""
+        """BMS 메모리 맵 가져오기 (파일 변경 시에만 다시 파싱)"""
         try:
-            import json
-            import os
-            
-            # BMS 맵 파일 경로
-            config_dir = os.path.join(os.path.dirname(__file__), '../../config')
-            bms_map_path = os.path.join(config_dir, 'bms_map.json')
-            
-            if os.path.exists(bms_map_path):
-                with open(bms_map_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            else:
-                print(f"BMS 맵 파일을 찾을 수 없습니다: {bms_map_path}")
-                return {}
+            return _load_memory_map('bms_map.json')
+        except FileNotFoundError as e:
+            print(f"BMS 맵 파일을 찾을 수 없습니다: {e.filename}")
+            return {}
         except Exception as e:
             print(f"BMS 메모리 맵 로드 오류: {e}")
             return {}
     
-    def _find_address_info(self, data_key, memory_map):
-        """데이터 키에 해당하는 주소 정보 찾기"""
+    def _get_bms_key_index(self):
+        """데이터 키 -> 주소 정보 인덱스 가져오기 (맵 로드 시 1회 생성)"""
         try:
-            # 모든 섹션에서 검색
-            sections = ['data_registers', 'module_voltages', 'status_registers', 
-                       'module_status_registers', 'module_temperatures', 'cell_voltages']
-            
-            for section in sections:
-                section_data = memory_map.get(section, {})
-                if data_key in section_data:
-                    return section_data[data_key]
-            
-            # 못 찾은 경우 기본값 반환
-            return {'address': '-', 'unit': '', 'description': '알 수 없는 데이터'}
-            
-        except Exception as e:
-            print(f"주소 정보 검색 오류: {e}")
-            return {'address': '-', 'unit': '', 'description': '오류'}
-    
-    def update_real_data(self):
-        """실제 장비 데이터 업데이트"""
-        if not self.device_handler:
-            return
-        
-        # 기존 데이터 클리어
-        for item in self.data_tree.get_children():
-            self.data_tree.delete(item)
-        
-        try:
-            # 장비 핸들러의 상태 정보 표시
-            status_info = self.device_handler.get_status()
-            
-            self.data_tree.insert('', tk.END, values=(
-                '-', 'device_name', status_info['name'], '', '장비 이름'
-            ))
-            self.data_tree.insert('', tk.END, values=(
-                '-', 'device_type', status_info['type'], '', '장비 타입'
-            ))
-            self.data_tree.insert('', tk.END, values=(
-                '-', 'ip_address', status_info['ip'], '', 'IP 주소'
-            ))
-            self.data_tree.insert('', tk.END, values=(
-                '-', 'port', str(status_info['port']), '', 'Modbus 포트'
-            ))
-            self.data_tree.insert('', tk.END, values=(
-                '-', 'connected', '예' if status_info['connected'] else '아니오', '', '연결 상태'
-            ))
-            
-            if status_info['last_successful_read']:
-                self.data_tree.insert('', tk.END, values=(
-                    '-', 'last_read', status_info['last_successful_read'], '', '마지막 읽기 시간'
-                ))
-            
-            self.data_tree.insert('', tk.END, values=(
-                '-', 'poll_interval', f"{status_info['poll_interval']}", 's', '폴링 주기'
-            ))
-            
+            return _memory_map_key_index('bms_map.json', self._BMS_SECTIONS)
+        except FileNotFoundError as e:
+            print(f"BMS 맵 파일을 찾을 수 없습니다: {e.filename}")
+            return {}
         except Exception as e:
-            self.data_tree.insert('', tk.END, values=(
-                '-', 'error', str(e), '', '데이터 읽기 오류'
-            ))
+            print(f"주소 정보 인덱스 생성 오류: {e}")
+            return {}
     
     def update_simulation_data(self):
         """이 메소드는 더 이상 사용하지 않습니다 - 실제 데이터만 사용"""
@@ -1833,6 +2044,10 @@ class BMSTab(DeviceTab):
 class DCDCTab(DeviceTab):
     """DCDC 탭 클래스"""
     
+    # 메모리 맵 섹션 (데이터 표시 / 주소 -> 레지스터 이름 검색 공용)
+    _DCDC_SECTIONS = ('parameter_registers', 'metering_registers', 'control_registers')
+    _UNKNOWN_INFO = {'address': '-', 'addr_display': '-', 'unit': '', 'description': '알 수 없는 DCDC 데이터'}  # 인덱스에 없는 키 (읽기 전용)
+    
     def create_widgets(self):
         """DCDC 탭 위젯 생성"""
         # 메인 프레임
@@ -1849,26 +2064,18 @@ class DCDCTab(DeviceTab):
         self.connection_label = ttk.Label(info_frame, text="연결 상태: 확인중", style='Status.TLabel')
         self.connection_label.grid(row=0, column=2, padx=(20, 0), sticky=tk.W)
         
+        # 제어 명령 결과 상태 줄
+        ttk.Label(info_frame, textvariable=self.status_var, style='Status.TLabel').grid(row=0, column=3, padx=(20, 0), sticky=tk.W)
+        
         # 데이터 표시 영역
         data_frame = ttk.LabelFrame(main_frame, text="실시간 데이터", padding="10")
         data_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
         
         # 스크롤 가능한 데이터 트리뷰
-        columns = ('address', 'parameter', 'value', 'unit', 'description')
-        self.data_tree = self.create_scrollable_treeview(data_frame, columns)
+        self.data_tree = self.create_scrollable_treeview(data_frame, _DATA_COLUMN_IDS)
         
         # 컬럼 설정
-        self.data_tree.heading('address', text='주소')
-        self.data_tree.heading('parameter', text='파라미터')
-        self.data_tree.heading('value', text='값')
-        self.data_tree.heading('unit', text='단위')
-        self.data_tree.heading('description', text='설명')
-        
-        self.data_tree.column('address', width=80)
-        self.data_tree.column('parameter', width=200)
-        self.data_tree.column('value', width=150)
-        self.data_tree.column('unit', width=80)
-        self.data_tree.column('description', width=400)
+        self.setup_data_columns(self.data_tree)
         
         # 스크롤 가능한 제어 패널
         control_frame = self.create_scrollable_control_frame(main_frame, "DCDC 제어")
@@ -1935,79 +2142,42 @@ class DCDCTab(DeviceTab):
             messagebox.showerror("오류", f"발전제한전력 값이 잘못되었습니다: {e}")
     
     def write_modbus_register(self, address, value, description):
-        """Modbus 레지스터 쓰기 - 임시 MQTT 연결을 통한 백그라운드 서버 제어"""
+        """Modbus 레지스터 쓰기 - 공용 MQTT 클라이언트를 통한 백그라운드 서버 제어"""
         try:
-            # 통합 모드에서는 임시 MQTT 연결을 통해 백그라운드 서버에 제어 명령 전송
+            # 통합 모드에서는 공용 MQTT 클라이언트로 백그라운드 서버에 제어 명령 전송
             if self.integrated_mode and self.main_window:
-                # 제어 명령 페이로드 생성
-                command_data = {
-                    "action": "write_register",
-                    "address": address,
-                    "value": value,
-                    "description": description,
-                    "timestamp": datetime.now().isoformat(),
-                    "gui_request_id": f"{self.device_name}_{address}_{int(time.time() * 1000000)}"
-                }
-                
-                # 임시 MQTT 연결을 통한 제어 명령 전송
-                control_topic = f"pms/control/{self.device_name}/command"
-                
-                # 비동기 임시 MQTT 전송 실행
-                def send_command():
-                    import asyncio
-                    try:
-                        # 새 이벤트 루프에서 실행
-                        loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop)
-                        if self.main_window and hasattr(self.main_window, 'send_mqtt_control_command_temp'):
-                            success = loop.run_until_complete(
-                                self.main_window.send_mqtt_control_command_temp(control_topic, command_data)
-                            )
-                        else:
-                            success = False
-                        loop.close()
-                        
-                        if success:
-                            messagebox.showinfo("제어 명령", f"{description} 명령을 백그라운드 서버로 전송했습니다.\n주소: {address}, 값: 0x{value:04X}")
-                        else:
-                            messagebox.showerror("오류", "MQTT 제어 명령 전송에 실패했습니다.")
-                    except Exception as e:
-                        messagebox.showerror("오류", f"제어 명령 전송 중 오류: {e}")
-                
-                # 별도 스레드에서 실행 (GUI 블로킹 방지)
-                import threading
-                thread = threading.Thread(target=send_command, daemon=True)
-                thread.start()
-                
+                # 짧은 시간 안의 연속 쓰기는 하나의 제어 메시지로 묶어 전송
+                self.queue_modbus_write(address, value, description)
             else:
                 # 독립 모드에서는 직접 핸들러 접근 (기존 방식)
                 if self.device_handler and hasattr(self.device_handler, 'write_register'):
                     self._execute_async_write(self.device_handler, address, value, description)
                 else:
-                    messagebox.showinfo("독립모드", f"{description} 명령 전송 (시뮬레이션)\n주소: {address}, 값: 0x{value:04X}")
+                    self.show_command_status(f"{description} 명령 전송 (독립모드 시뮬레이션, 주소: {address}, 값: 0x{value:04X})")
         except Exception as e:
             messagebox.showerror("오류", f"{description} 실행 중 오류: {e}")
     
     def _execute_async_write(self, handler, address, value, description):
         """비동기 쓰기 작업 실행"""
         try:
-            # 메인 루프에서 실행되는 비동기 작업
-            main_window = self.parent.master
-            if hasattr(main_window, 'loop') and main_window.loop:
+            # 메인 윈도우의 공용 이벤트 루프에서 실행되는 비동기 작업
+            main_window = self.main_window
+            if main_window is not None and main_window.loop:
                 # 레지스터 이름 찾기 (주소 -> 레지스터 이름 매핑)
                 register_name = self._find_dcdc_register_name_by_address(address)
                 if register_name:
+                    # 완료 후 GUI 스레드에서 결과 표시 (Tk 스레드에서 future 대기 금지)
+                    def on_done(future):
+                        try:
+                            if future.result():
+                                self.show_command_status(f"{description} 명령 전송 성공 (주소: {address}, 값: {value})")
+                            else:
+                                messagebox.showerror("실패", f"{description} 명령 전송에 실패했습니다.")
+                        except Exception as e:
+                            messagebox.showerror("오류", f"비동기 쓰기 실행 중 오류: {e}")
+                    
                     # 비동기 쓰기 작업 스케줄링
-                    future = asyncio.run_coroutine_threadsafe(
-                        handler.write_register(register_name, value), 
-                        main_window.loop
-                    )
-                    # 결과 확인 (타임아웃 설정)
-                    result = future.result(timeout=5)
-                    if result:
-                        messagebox.showinfo("성공", f"{description} 명령이 성공적으로 전송되었습니다.\n주소: {address}, 값: {value}")
-                    else:
-                        messagebox.showerror("실패", f"{description} 명령 전송에 실패했습니다.")
+                    main_window.run_async(handler.write_register(register_name, value), on_done)
                 else:
                     messagebox.showerror("오류", f"주소 {address}에 해당하는 레지스터를 찾을 수 없습니다.")
             else:
@@ -2016,21 +2186,9 @@ class DCDCTab(DeviceTab):
             messagebox.showerror("오류", f"비동기 쓰기 실행 중 오류: {e}")
     
     def _find_dcdc_register_name_by_address(self, address):
-        """주소로부터 DCDC 레지스터 이름 찾기"""
+        """주소로부터 DCDC 레지스터 이름 찾기 (맵 로드 시 1회 생성한 주소 인덱스 사용)"""
         try:
-            # DCDC 메모리 맵에서 주소로 레지스터 이름 찾기
-            memory_map = self._get_dcdc_memory_map()
-            
-            # 모든 섹션에서 검색
-            sections = ['parameter_registers', 'metering_registers', 'control_registers']
-            
-            for section in sections:
-                section_data = memory_map.get(section, {})
-                for register_name, register_info in section_data.items():
-                    if register_info.get('address') == address:
-                        return register_name
-            
-            return None
+            return _memory_map_address_index('dcdc_map.json', self._DCDC_SECTIONS).get(address)
         except Exception as e:
             print(f"DCDC 레지스터 이름 검색 오류: {e}")
             return None
@@ -2038,7 +2196,7 @@ class DCDCTab(DeviceTab):
     def update_data(self):
         """DCDC 데이터 업데이트"""
         # 통합 모드에서는 데이터 매니저에서 데이터 가져오기
-        if hasattr(self, 'integrated_mode') and self.integrated_mode and data_manager is not None:
+        if self.integrated_mode and data_manager is not None:
             device_status = data_manager.get_device_status(self.device_name)
             device_data = data_manager.get_device_data(self.device_name)
             
@@ -2056,8 +2214,9 @@ class DCDCTab(DeviceTab):
             else:
                 self.connection_label.config(text="연결 상태: 확인중", style='Status.TLabel')
             
-            # 실시간 데이터 표시
-            self.update_data_display(device_data)
+            # 실시간 데이터 표시 (숨겨진 탭이거나 새 데이터가 없으면 트리뷰 갱신 생략)
+            if self.visible and self._needs_render(device_data):
+                self.update_data_display(device_data)
         else:
             # 기존 로직 (독립 모드)
             if not self.device_handler:
@@ -2071,8 +2230,9 @@ class DCDCTab(DeviceTab):
                 else:
                     self.connection_label.config(text="연결 상태: 연결안됨", style='Disconnected.TLabel')
                 
-                # 실제 데이터 읽기 시도
-                self.update_real_data()
+                # 실제 데이터 읽기 시도 (숨겨진 탭은 갱신 생략)
+                if self.visible:
+                    self.update_real_data()
                 
             except Exception as e:
                 print(f"DCDC 데이터 업데이트 오류: {e}")
@@ -2080,9 +2240,8 @@ class DCDCTab(DeviceTab):
     
     def update_data_display(self, device_data):
         """데이터 표시 영역 업데이트"""
-        # 기존 데이터 클리어
-        for item in self.data_tree.get_children():
-            self.data_tree.delete(item)
+        # 표시할 행 수집 후 한 번에 반영
+        rows = []
         
         if device_data:
             try:
@@ -2091,147 +2250,88 @@ class DCDCTab(DeviceTab):
                 if timestamp:
                     if isinstance(timestamp, str):
                         try:
-                            timestamp = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+                            timestamp = self._parse_timestamp(timestamp)
                         except:
                             timestamp = datetime.now()
                     
-                    age_seconds = (datetime.now() - timestamp).total_seconds()
+                    age_seconds = self._data_age_seconds(device_data, timestamp)
                     if age_seconds > 300:  # 5분 초과
-                        self.data_tree.insert('', tk.END, values=(
+                        rows.append((
                             '-', 'status', '데이터 오래됨', '', f'{age_seconds:.0f}초 전 데이터'
                         ))
+                        self.render_rows(rows)
                         return
                 
                 # 실제 데이터 표시
                 data = device_data.get('data', {})
                 
                 # 장비 정보 표시
-                self.data_tree.insert('', tk.END, values=(
+                rows.append((
                     '-', 'device_name', data.get('device_name', 'N/A'), '', '장비 이름'
                 ))
-                self.data_tree.insert('', tk.END, values=(
+                rows.append((
                     '-', 'device_type', data.get('device_type', 'N/A'), '', '장비 타입'
                 ))
-                self.data_tree.insert('', tk.END, values=(
+                rows.append((
                     '-', 'ip_address', data.get('ip_address', 'N/A'), '', 'IP 주소'
                 ))
-                self.data_tree.insert('', tk.END, values=(
+                rows.append((
                     '-', 'timestamp', timestamp.strftime('%H:%M:%S') if timestamp else 'N/A', '', '업데이트 시간'
                 ))
                 
                 # DCDC 특화 센서 데이터
                 sensor_data = data.get('data', {})
                 if sensor_data:
-                    # DCDC 메모리 맵 정보 가져오기 시도
-                    memory_map = self._get_dcdc_memory_map()
+                    # DCDC 메모리 맵 키 인덱스 (갱신마다 1회 조회)
+                    key_index = self._get_dcdc_key_index()
                     
                     for key, value in sensor_data.items():
                         # 메모리 맵에서 주소와 단위 정보 찾기
-                        addr_info = self._find_dcdc_address_info(key, memory_map)
-                        address = addr_info.get('address', '-')
+                        addr_info = key_index.get(key, self._UNKNOWN_INFO)
+                        addr_display = addr_info['addr_display']
                         unit = addr_info.get('unit', '')
                         description = addr_info.get('description', 'DCDC 센서 데이터')
                         
-                        # 16진수 주소 표시 (예: 0x0000)
-                        addr_display = f"0x{address:04X}" if isinstance(address, int) else str(address)
-                        
-                        self.data_tree.insert('', tk.END, values=(
+                        rows.append((
                             addr_display, key, str(value), unit, description
                         ))
                 else:
-                    self.data_tree.insert('', tk.END, values=(
+                    rows.append((
                         '-', 'info', 'DCDC 데이터 로드 중', '', '잠시 기다려주세요'
                     ))
                     
             except Exception as e:
-                self.data_tree.insert('', tk.END, values=(
+                rows.append((
                     '-', 'error', '데이터 파싱 오류', '', str(e)
                 ))
         else:
-            self.data_tree.insert('', tk.END, values=(
+            rows.append((
                 '-', 'status', '데이터 없음', '', 'DCDC에서 데이터를 읽어오는 중입니다'
             ))
+        
+        self.render_rows(rows)
     
     def _get_dcdc_memory_map(self):
-        """DCDC 메모리 맵 가져오기"""
+        """DCDC 메모리 맵 가져오기 (파일 변경 시에만 다시 파싱)"""
         try:
-            import json
-            import os
-            
-            # DCDC 맵 파일 경로
-            config_dir = os.path.join(os.path.dirname(__file__), '../../config')
-            dcdc_map_path = os.path.join(config_dir, 'dcdc_map.json')
-            
-            if os.path.exists(dcdc_map_path):
-                with open(dcdc_map_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            else:
-                print(f"DCDC 맵 파일을 찾을 수 없습니다: {dcdc_map_path}")
-                return {}
+            return _load_memory_map('dcdc_map.json')
+        except FileNotFoundError as e:
+            print(f"DCDC 맵 파일을 찾을 수 없습니다: {e.filename}")
+            return {}
         except Exception as e:
             print(f"DCDC 메모리 맵 로드 오류: {e}")
             return {}
     
-    def _find_dcdc_address_info(self, data_key, memory_map):
-        """데이터 키에 해당하는 주소 정보 찾기"""
-        try:
-            # 모든 섹션에서 검색
-            sections = ['parameter_registers', 'metering_registers', 'control_registers']
-            
-            for section in sections:
-                section_data = memory_map.get(section, {})
-                if data_key in section_data:
-                    return section_data[data_key]
-            
-            # 못 찾은 경우 기본값 반환
-            return {'address': '-', 'unit': '', 'description': '알 수 없는 DCDC 데이터'}
-            
-        except Exception as e:
-            print(f"DCDC 주소 정보 검색 오류: {e}")
-            return {'address': '-', 'unit': '', 'description': '오류'}
-    
-    def update_real_data(self):
-        """실제 장비 데이터 업데이트"""
-        if not self.device_handler:
-            return
-        
-        # 기존 데이터 클리어
-        for item in self.data_tree.get_children():
-            self.data_tree.delete(item)
-        
+    def _get_dcdc_key_index(self):
+        """데이터 키 -> 주소 정보 인덱스 가져오기 (맵 로드 시 1회 생성)"""
         try:
-            # 장비 핸들러의 상태 정보 표시
-            status_info = self.device_handler.get_status()
-            
-            self.data_tree.insert('', tk.END, values=(
-                '-', 'device_name', status_info['name'], '', '장비 이름'
-            ))
-            self.data_tree.insert('', tk.END, values=(
-                '-', 'device_type', status_info['type'], '', '장비 타입'
-            ))
-            self.data_tree.insert('', tk.END, values=(
-                '-', 'ip_address', status_info['ip'], '', 'IP 주소'
-            ))
-            self.data_tree.insert('', tk.END, values=(
-                '-', 'port', str(status_info['port']), '', 'Modbus 포트'
-            ))
-            self.data_tree.insert('', tk.END, values=(
-                '-', 'connected', '예' if status_info['connected'] else '아니오', '', '연결 상태'
-            ))
-            
-            if status_info['last_successful_read']:
-                self.data_tree.insert('', tk.END, values=(
-                    '-', 'last_read', status_info['last_successful_read'], '', '마지막 읽기 시간'
-                ))
-            
-            self.data_tree.insert('', tk.END, values=(
-                '-', 'poll_interval', f"{status_info['poll_interval']}", 's', '폴링 주기'
-            ))
-            
+            return _memory_map_key_index('dcdc_map.json', self._DCDC_SECTIONS)
+        except FileNotFoundError as e:
+            print(f"DCDC 맵 파일을 찾을 수 없습니다: {e.filename}")
+            return {}
         except Exception as e:
-            self.data_tree.insert('', tk.END, values=(
-                '-', 'error', str(e), '', '데이터 읽기 오류'
-            ))
+            print(f"DCDC 주소 정보 인덱스 생성 오류: {e}")
+            return {}
     
     def read_data(self):
         """데이터 읽기"""
@@ -2267,38 +2367,53 @@ class DCDCTab(DeviceTab):
 class PCSTab(DeviceTab):
     """PCS 탭 클래스"""
     
+    # 메모리 맵 섹션 (데이터 표시 / 주소 -> 레지스터 이름 검색 공용)
+    _PCS_SECTIONS = ('parameter_registers', 'metering_registers', 'ups_registers', 'control_registers')
+    _UNKNOWN_INFO = {'address': '-', 'addr_display': '-', 'unit': '', 'description': '알 수 없는 PCS 데이터'}  # 인덱스에 없는 키 (읽기 전용)
+    
     def __init__(self, parent, device_config: Dict[str, Any], handlers: List, main_window=None):
         """PCSTab 초기화"""
-        super().__init__(parent, device_config, handlers, main_window)
+        self.logger = logging.getLogger(self.__class__.__name__)
         
-        # 운전 모드 관련 변수들 초기화
-        self.current_operation_mode = tk.StringVar(value="manual")
+        # GUI 컴포넌트에 DB 값 반영을 위한 플래그 (create_widgets에서 True로 설정)
+        self.gui_components_created = False
         
-        # 임계값 변수들
-        self.soc_high_threshold = tk.DoubleVar(value=85.0)
-        self.soc_low_threshold = tk.DoubleVar(value=50.0) 
-        self.soc_charge_stop_threshold = tk.DoubleVar(value=80.0)
-        self.dcdc_standby_time = tk.IntVar(value=5)
-        self.charging_power = tk.DoubleVar(value=30.0)
+        # create_widgets 이후 생성되는 속성 (hasattr 대신 None 비교로 생성 여부 확인)
+        self.soc_high_threshold = None  # 운전 모드 변수 (initialize_operation_variables에서 생성)
+        self.current_mode_label = None  # 운전 모드 제어 패널 (처음 표시될 때 생성)
+        
+        # 초기 설정 로드 / DB 모니터링 중복 실행 방지 플래그
+        self._initial_config_loaded = False
+        self._db_monitoring_started = False
+        
+        # 임계값 자동 저장 상태 (변수는 initialize_operation_variables에서 생성 후 trace 연결)
+        self._threshold_vars: Dict[str, tk.Variable] = {}
+        self._threshold_var_keys: Dict[str, str] = {}
+        self._pending_changes: Dict[str, Any] = {}
+        self._save_after_id = None
+        self._autosave_suppressed = False  # DB 값 반영 중에는 자동 저장하지 않음
+        
+        # 운전 모드 변수, DB 설정 로더, 초기 설정 로드는 create_widgets -> initialize_operation_variables에서 1회 수행
+        super().__init__(parent, device_config, handlers, main_window)
         
-        # DB 설정 로더 (main_window에서 가져오기)
-        self.db_config_loader = None
-        if main_window and hasattr(main_window, 'db_config_loader'):
-            self.db_config_loader = main_window.db_config_loader
+        # MQTT 메시지에 포함할 설치 위치 (메인 윈도우에서 1회 조회한 값 재사용)
+        self._device_location = main_window._device_location if main_window else 'Unknown'
+        
+        # 운전 모드 제어 메시지 공통 필드 템플릿 (전송 시 명령별 필드와 timestamp만 덮어씀)
+        self._msg_template = {
+            "location": self._device_location,
+            "source": "gui_pcs_control_panel",
+            "timestamp": None
+        }
         
         # DB 실시간 모니터링을 위한 변수들
         self.last_db_update_time = None
         self.db_monitor_active = True
-        
-        # 초기 설정 로드 (GUI 컴포넌트 생성 전에)
-        self.load_initial_config()
+        self._db_monitor_stop = threading.Event()  # 모니터링 대기 중 즉시 중지용 (재사용)
         
         # DB 변경사항 모니터링 시작 (10초마다)
         if self.db_config_loader:
             self.start_db_monitoring()
-        
-        # GUI 컴포넌트에 DB 값 반영을 위한 플래그
-        self.gui_components_created = False
     
     def create_widgets(self):
         """PCS 탭 위젯 생성"""
@@ -2316,6 +2431,9 @@ class PCSTab(DeviceTab):
         self.connection_label = ttk.Label(info_frame, text="연결 상태: 확인중", style='Status.TLabel')
         self.connection_label.grid(row=0, column=2, padx=(20, 0), sticky=tk.W)
         
+        # 제어 명령 결과 상태 줄
+        ttk.Label(info_frame, textvariable=self.status_var, style='Status.TLabel').grid(row=0, column=3, padx=(20, 0), sticky=tk.W)
+        
         # 메인 컨텐츠 영역을 좌우로 분할
         content_frame = ttk.Frame(main_frame)
         content_frame.pack(fill=tk.BOTH, expand=True)
@@ -2329,21 +2447,10 @@ class PCSTab(DeviceTab):
         data_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
         
         # 스크롤 가능한 데이터 트리뷰
-        columns = ('address', 'parameter', 'value', 'unit', 'description')
-        self.data_tree = self.create_scrollable_treeview(data_frame, columns)
+        self.data_tree = self.create_scrollable_treeview(data_frame, _DATA_COLUMN_IDS)
         
         # 컬럼 설정
-        self.data_tree.heading('address', text='주소')
-        self.data_tree.heading('parameter', text='파라미터')
-        self.data_tree.heading('value', text='값')
-        self.data_tree.heading('unit', text='단위')
-        self.data_tree.heading('description', text='설명')
-        
-        self.data_tree.column('address', width=80)
-        self.data_tree.column('parameter', width=200)
-        self.data_tree.column('value', width=150)
-        self.data_tree.column('unit', width=80)
-        self.data_tree.column('description', width=300)
+        self.setup_data_columns(self.data_tree, {'description': 300})
         
         # 스크롤 가능한 제어 패널
         control_frame = self.create_scrollable_control_frame(left_frame, "PCS 제어")
@@ -2388,47 +2495,31 @@ class PCSTab(DeviceTab):
         right_frame.pack(side=tk.RIGHT, fill=tk.Y, padx=(10, 0))
         
         # 운전 모드 관련 변수들이 초기화되지 않은 경우 초기화
-        if not hasattr(self, 'soc_high_threshold'):
+        if self.soc_high_threshold is None:
             self.initialize_operation_variables()
-        self.create_operation_control_panel(right_frame)
+        
+        # 운전 모드 제어 패널은 PCS 탭이 처음 표시될 때 생성 (시작 시 위젯 생성 비용 절감)
+        self._op_panel_built = False
+        self._op_panel_frame = right_frame
+        self._op_panel_bind_id = self.parent.bind("<Map>", self._ensure_op_panel, add="+")
         
         # GUI 컴포넌트 생성 완료 플래그 설정
         self.gui_components_created = True
         
         # GUI 컴포넌트가 생성된 후 DB 값들을 다시 반영
         self.update_gui_from_db_values()
+    
+    def _ensure_op_panel(self, event=None):
+        """운전 모드 제어 패널을 처음 표시될 때 한 번만 생성"""
+        if self._op_panel_built:
+            return
         
-        # 🔧 Variable 바인딩 강화 - GUI 생성 후 Variable 값들을 다시 설정
-        try:
-            print("🔄 GUI 생성 완료 후 Variable 값 재설정 시작...")
-            
-            # DB에서 다시 로드하여 Variable에 설정 (바인딩 강화)
-            if self.db_config_loader:
-                import asyncio
-                try:
-                    loop = asyncio.get_event_loop()
-                except RuntimeError:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                
-                config = loop.run_until_complete(self.db_config_loader.load_auto_mode_config())
-                if config:
-                    # Variable 값들을 다시 설정 (GUI 바인딩 강화)
-                    self.soc_high_threshold.set(config.get('soc_high_threshold', 85.0))
-                    self.soc_low_threshold.set(config.get('soc_low_threshold', 50.0))
-                    self.soc_charge_stop_threshold.set(config.get('soc_charge_stop_threshold', 80.0))
-                    self.dcdc_standby_time.set(config.get('dcdc_standby_time', 5))
-                    self.charging_power.set(config.get('charging_power', 30.0))
-                    
-                    print("✅ GUI 생성 후 Variable 재설정 완료")
-                    print(f"   📊 재설정된 값들: SOC상한={self.soc_high_threshold.get()}, SOC하한={self.soc_low_threshold.get()}, 충전정지={self.soc_charge_stop_threshold.get()}, DCDC대기={self.dcdc_standby_time.get()}, 충전전력={self.charging_power.get()}")
-                    
-                    # tkinter update 강제 실행으로 바인딩 적용
-                    self.parent.update_idletasks()
-                    print("🔄 tkinter GUI 업데이트 완료")
-                    
-        except Exception as e:
-            print(f"❌ GUI 생성 후 Variable 재설정 중 오류: {e}")
+        self._op_panel_built = True
+        self.parent.unbind("<Map>", self._op_panel_bind_id)
+        self.create_operation_control_panel(self._op_panel_frame)
+        
+        # 패널 생성 후 현재 운전 모드 라벨 반영
+        self.update_gui_from_db_values()
     
     def initialize_operation_variables(self):
         """운전 모드 관련 변수들 초기화"""
@@ -2442,47 +2533,67 @@ class PCSTab(DeviceTab):
         self.dcdc_standby_time = tk.IntVar(value=5)
         self.charging_power = tk.DoubleVar(value=30.0)
         
+        # 임계값 변경 시 자동 저장 (연속 변경은 모아서 한 번에 저장/전송)
+        self._threshold_vars = {
+            'soc_high_threshold': self.soc_high_threshold,
+            'soc_low_threshold': self.soc_low_threshold,
+            'soc_charge_stop_threshold': self.soc_charge_stop_threshold,
+            'dcdc_standby_time': self.dcdc_standby_time,
+            'charging_power': self.charging_power
+        }
+        self._threshold_var_keys = {str(var): key for key, var in self._threshold_vars.items()}
+        for var in self._threshold_vars.values():
+            var.trace_add("write", self._schedule_save)
+        
         # DB 설정 로더 (main_window에서 가져오기)
-        self.db_config_loader = None
-        if self.main_window and hasattr(self.main_window, 'db_config_loader'):
-            self.db_config_loader = self.main_window.db_config_loader
+        self.db_config_loader = self.main_window.db_config_loader if self.main_window else None
         
         # 초기 설정 로드 (DB에서 운전 모드도 함께 로드됨)
         self.load_initial_config()
     
     def load_initial_config(self):
-        """초기 설정 로드 (DB에서)"""
+        """초기 설정 로드 (DB에서, 탭 생성을 막지 않도록 공용 이벤트 루프에서 조회)"""
+        # 이미 로드에 성공했으면 DB 재조회 생략
+        if self._initial_config_loaded:
+            return
+        
         if self.db_config_loader:
-            try:
-                # 비동기 함수를 동기적으로 실행
-                import asyncio
+            # 조회 완료 후 GUI 스레드에서 변수 반영
+            def on_loaded(future):
                 try:
-                    loop = asyncio.get_event_loop()
-                except RuntimeError:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                
-                config = loop.run_until_complete(self.db_config_loader.load_auto_mode_config())
-                if config:
-                    self.soc_high_threshold.set(config.get('soc_high_threshold', 85.0))
-                    self.soc_low_threshold.set(config.get('soc_low_threshold', 50.0))
-                    self.soc_charge_stop_threshold.set(config.get('soc_charge_stop_threshold', 80.0))
-                    self.dcdc_standby_time.set(config.get('dcdc_standby_time', 5))
-                    self.charging_power.set(config.get('charging_power', 30.0))
-                    
-                    # 🔧 현재 운전 모드도 DB에서 로드하여 반영
-                    auto_mode_enabled = config.get('auto_mode_enabled', False)
-                    if auto_mode_enabled:
-                        self.current_operation_mode.set("auto")
+                    config = future.result()
+                    if config:
+                        self._initial_config_loaded = True
+                        self._autosave_suppressed = True
+                        try:
+                            self.soc_high_threshold.set(config.get('soc_high_threshold', 85.0))
+                            self.soc_low_threshold.set(config.get('soc_low_threshold', 50.0))
+                            self.soc_charge_stop_threshold.set(config.get('soc_charge_stop_threshold', 80.0))
+                            self.dcdc_standby_time.set(config.get('dcdc_standby_time', 5))
+                            self.charging_power.set(config.get('charging_power', 30.0))
+                        finally:
+                            self._autosave_suppressed = False
+                        
+                        # 🔧 현재 운전 모드도 DB에서 로드하여 반영
+                        auto_mode_enabled = config.get('auto_mode_enabled', False)
+                        if auto_mode_enabled:
+                            self.current_operation_mode.set("auto")
+                        else:
+                            self.current_operation_mode.set("manual")
+                        
+                        # 운전 모드 라벨 등 GUI 컴포넌트에 반영
+                        self.update_gui_from_db_values()
+                        
+                        self.logger.debug("✅ DB에서 초기 설정 로드 완료 (운전 모드: %s)", '자동' if auto_mode_enabled else '수동')
                     else:
-                        self.current_operation_mode.set("manual")
-                    
-                    print("✅ DB에서 초기 설정 로드 완료")
-                    print(f"   📊 로드된 운전 모드: {'자동' if auto_mode_enabled else '수동'}")
-                else:
-                    print("⚠️ DB에서 설정을 찾을 수 없음, 기본값 사용")
+                        self.logger.warning("⚠️ DB에서 설정을 찾을 수 없음, 기본값 사용")
+                except Exception as e:
+                    self.logger.error("❌ DB 설정 로드 실패: %s", e)
+            
+            try:
+                self.main_window.run_async(self.db_config_loader.load_auto_mode_config(), on_loaded)
             except Exception as e:
-                print(f"❌ DB 설정 로드 실패: {e}")
+                self.logger.error("❌ DB 설정 로드 실패: %s", e)
     
     def update_gui_from_db_values(self):
         """GUI 컴포넌트가 생성된 후 DB에서 불러온 값들을 GUI에 반영"""
@@ -2491,56 +2602,27 @@ class PCSTab(DeviceTab):
             
         try:
             # 현재 운전 모드 라벨 업데이트 (DB에서 불러온 모드 반영)
-            if hasattr(self, 'current_mode_label'):
+            if self.current_mode_label is not None:
                 current_mode = self.current_operation_mode.get()
                 if current_mode == "auto":
                     self.current_mode_label.config(text="자동 모드", foreground='green')
-                    print("   🎛️ GUI 모드 라벨: 자동 모드로 업데이트")
+                    self.logger.debug("🎛️ GUI 모드 라벨: 자동 모드로 업데이트")
                 else:
                     self.current_mode_label.config(text="수동 모드", foreground='blue')
-                    print("   🎛️ GUI 모드 라벨: 수동 모드로 업데이트")
+                    self.logger.debug("🎛️ GUI 모드 라벨: 수동 모드로 업데이트")
             
-            # 🔧 Entry 위젯에 DB 값을 직접 설정 (바인딩 문제 해결)
-            try:
-                # Entry 위젯이 생성되었는지 확인 후 직접 값 설정
-                if hasattr(self, 'soc_high_entry') and hasattr(self, 'soc_low_entry'):
-                    entry_updates = [
-                        (self.soc_high_entry, self.soc_high_threshold, "SOC 상한"),
-                        (self.soc_low_entry, self.soc_low_threshold, "SOC 하한"),
-                        (self.soc_charge_stop_entry, self.soc_charge_stop_threshold, "SOC 충전 정지"),
-                        (self.dcdc_standby_entry, self.dcdc_standby_time, "DCDC 대기시간"),
-                        (self.charging_power_entry, self.charging_power, "충전 전력")
-                    ]
-                    
-                    for entry, variable, name in entry_updates:
-                        if entry and variable:
-                            try:
-                                # Entry 내용 클리어하고 새 값 삽입
-                                entry.delete(0, tk.END)
-                                entry.insert(0, str(variable.get()))
-                                print(f"   📝 {name} Entry 직접 업데이트: {variable.get()}")
-                            except Exception as e:
-                                print(f"   ❌ {name} Entry 업데이트 오류: {e}")
-                    
-                    print("   🔄 모든 Entry 위젯 직접 값 설정 완료")
-                else:
-                    print("   ⚠️ Entry 위젯들이 아직 생성되지 않음")
-                    
-            except Exception as e:
-                print(f"   ❌ Entry 직접 업데이트 중 오류: {e}")
-            
-            # 임계값들이 DB에서 불러온 값으로 설정되었는지 확인 및 로그 출력
-            print(f"🔧 PCS 탭 DB → GUI 값 반영 완료:")
-            print(f"   📊 SOC 상한: {self.soc_high_threshold.get()}%")
-            print(f"   📊 SOC 하한: {self.soc_low_threshold.get()}%") 
-            print(f"   📊 충전 정지: {self.soc_charge_stop_threshold.get()}%")
-            print(f"   📊 DCDC 대기: {self.dcdc_standby_time.get()}분")
-            print(f"   📊 충전 전력: {self.charging_power.get()}kW")
-            print(f"   🎛️ 운전 모드: {self.current_operation_mode.get()}")
-            print(f"   ✅ PCS 탭 GUI 컴포넌트 DB 값 반영 완료")
+            # 임계값 Entry는 변수 trace로 표시가 갱신되어 별도 갱신 불필요
+            
+            # 반영된 값 로그 (디버그 레벨일 때만 Variable 조회)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "🔧 PCS 탭 DB → GUI 값 반영 완료: SOC 상한=%s%%, SOC 하한=%s%%, 충전 정지=%s%%, DCDC 대기=%s분, 충전 전력=%skW, 운전 모드=%s",
+                    self.soc_high_threshold.get(), self.soc_low_threshold.get(), self.soc_charge_stop_threshold.get(),
+                    self.dcdc_standby_time.get(), self.charging_power.get(), self.current_operation_mode.get()
+                )
                     
         except Exception as e:
-            print(f"❌ GUI DB 값 반영 중 오류: {e}")
+            self.logger.error("❌ GUI DB 값 반영 중 오류: %s", e)
     
     def create_operation_control_panel(self, parent):
         """운전 모드 제어 패널 생성 (PCS 탭 우측에 배치)"""
@@ -2610,20 +2692,6 @@ class PCSTab(DeviceTab):
                                        command=self.stop_auto_mode, style='ManualMode.TButton')
         self.auto_stop_btn.pack(fill=tk.X, ipady=2)
     
-    def create_threshold_input(self, parent, label_text, variable, unit, row, col):
-        """임계값 입력 필드 생성 (그리드 배치용)"""
-        # 라벨
-        label = ttk.Label(parent, text=label_text, width=16, anchor='w')
-        label.grid(row=row, column=col, sticky="w", padx=(0, 5), pady=2)
-        
-        # 입력 필드
-        entry = ttk.Entry(parent, textvariable=variable, width=8, justify='center')
-        entry.grid(row=row, column=col+1, padx=(0, 5), pady=2)
-        
-        # 단위
-        unit_label = ttk.Label(parent, text=unit, width=3, anchor='w')
-        unit_label.grid(row=row, column=col+2, sticky="w", padx=(0, 20), pady=2)
-    
     def create_threshold_input_vertical(self, parent, label_text, variable, unit, row):
         """임계값 입력 필드 생성 (세로 배치용)"""
         # 컨테이너 프레임
@@ -2638,371 +2706,296 @@ class PCSTab(DeviceTab):
         input_frame = ttk.Frame(container)
         input_frame.pack(fill=tk.X, pady=(2, 0))
         
-        entry = ttk.Entry(input_frame, textvariable=variable, width=10, justify='center')
+        # 입력 필드 (키 입력은 validatecommand로만 검사, 변수에는 확정 시에만 반영)
+        if self.main_window:
+            entry = ttk.Entry(input_frame, width=10, justify='center',
+                              validate='key', validatecommand=self.main_window._numeric_vcmd)
+        else:
+            entry = ttk.Entry(input_frame, width=10, justify='center')
+        entry.insert(0, str(variable.get()))
         entry.pack(side=tk.LEFT, padx=(0, 5))
         
+        def commit(event=None):
+            try:
+                value = float(entry.get())
+                if isinstance(variable, tk.IntVar):
+                    value = int(value)
+            except ValueError:
+                # 확정할 수 없는 값이면 현재 변수 값으로 되돌림
+                refresh()
+                return
+            if value != variable.get():
+                variable.set(value)
+        
+        def refresh(*args):
+            entry.delete(0, tk.END)
+            entry.insert(0, str(variable.get()))
+        
+        entry.bind("<Return>", commit)
+        entry.bind("<FocusOut>", commit)
+        # DB 불러오기 등 외부에서 변수가 바뀌면 표시 갱신
+        variable.trace_add("write", refresh)
+        
         unit_label = ttk.Label(input_frame, text=unit, font=('Arial', 8))
         unit_label.pack(side=tk.LEFT)
         
         # Entry 위젯 참조 반환
         return entry
     
-
-    
     def save_config_to_db(self):
         """DB에 설정 저장"""
         if not self.db_config_loader:
             messagebox.showwarning("경고", "DB 연결이 설정되지 않았습니다.")
             return
         
+        # 수동 저장 시 대기 중인 자동 저장은 취소 (현재 값 전체를 저장하므로 모인 변경 내역도 폐기)
+        self._cancel_pending_save()
+        self._pending_changes.clear()
+        
         try:
-            # 설정값 수집 (현재 운전 모드 포함)
-            config_data = {
-                'soc_high_threshold': self.soc_high_threshold.get(),
-                'soc_low_threshold': self.soc_low_threshold.get(),
-                'soc_charge_stop_threshold': self.soc_charge_stop_threshold.get(),
-                'dcdc_standby_time': self.dcdc_standby_time.get(),
-                'charging_power': self.charging_power.get(),
-                'auto_mode_enabled': self.current_operation_mode.get() == 'auto'
-            }
+            # 설정값 수집 (현재 운전 모드 포함, Variable당 1회만 조회하고 검증/저장/전송은 이 스냅샷 사용)
+            config_data = self._collect_config_values()
             
-            print(f"💾 저장할 설정값:")
-            print(f"   📊 SOC 상한: {config_data['soc_high_threshold']}%")
-            print(f"   📊 SOC 하한: {config_data['soc_low_threshold']}%")
-            print(f"   📊 충전 정지: {config_data['soc_charge_stop_threshold']}%")
-            print(f"   📊 DCDC 대기: {config_data['dcdc_standby_time']}분")
-            print(f"   📊 충전 전력: {config_data['charging_power']}kW")
-            print(f"   🎛️ 자동 모드: {'활성화' if config_data['auto_mode_enabled'] else '비활성화'}")
+            self.logger.debug("💾 저장할 설정값: %s", config_data)
             
             # 설정값 검증
             if not self.validate_config_values(config_data):
                 return
             
-            def save_async():
-                import asyncio
+            # DB 저장 + MQTT 전송 완료 후 GUI 스레드에서 결과 표시
+            def on_saved(future):
                 try:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    
-                    # 1단계: DB 저장 먼저 수행
-                    if self.db_config_loader is not None:
-                        db_success = loop.run_until_complete(self.db_config_loader.save_auto_mode_config(config_data))
-                    else:
-                        db_success = False
-                    
-                    loop.close()
-                    
-                    if db_success:
-                        print("✅ DB 저장 성공 - MQTT 전송 시작")
-                        
-                        # 2단계: DB 저장 성공 후 MQTT로 임계값 설정 전송
-                        def send_mqtt_after_db_save():
-                            try:
-                                self.send_threshold_config_mqtt(config_data)
-                                # GUI 업데이트는 메인 스레드에서 실행
-                                self.parent.after(0, lambda: messagebox.showinfo("성공", "설정이 DB에 저장되고 시스템에 적용되었습니다."))
-                            except Exception as mqtt_e:
-                                print(f"❌ MQTT 전송 중 오류: {mqtt_e}")
-                                self.parent.after(0, lambda: messagebox.showwarning("부분 성공", f"DB 저장은 성공했지만 MQTT 전송 실패: {mqtt_e}"))
-                        
-                        # MQTT 전송을 별도 스레드에서 실행
-                        import threading
-                        mqtt_thread = threading.Thread(target=send_mqtt_after_db_save, daemon=True)
-                        mqtt_thread.start()
-                        
+                    db_success, mqtt_success = future.result()
+                    if not db_success:
+                        self.logger.error("❌ DB 저장 실패")
+                        messagebox.showerror("오류", "DB 저장에 실패했습니다.")
+                    elif mqtt_success:
+                        self.show_command_status("설정이 DB에 저장되고 시스템에 적용되었습니다")
                     else:
-                        print("❌ DB 저장 실패")
-                        # GUI 업데이트는 메인 스레드에서 실행
-                        self.parent.after(0, lambda: messagebox.showerror("오류", "DB 저장에 실패했습니다."))
+                        self.logger.error("❌ 임계값 설정 MQTT 전송 실패")
+                        messagebox.showwarning("부분 성공", "DB 저장은 성공했지만 MQTT 전송에 실패했습니다.")
                         
                 except Exception as e:
-                    print(f"❌ DB 저장 중 오류: {e}")
-                    # GUI 업데이트는 메인 스레드에서 실행
-                    self.parent.after(0, lambda: messagebox.showerror("오류", f"DB 저장 중 오류: {e}"))
+                    self.logger.error("❌ DB 저장 중 오류: %s", e)
+                    messagebox.showerror("오류", f"DB 저장 중 오류: {e}")
             
-            # 별도 스레드에서 실행
-            import threading
-            thread = threading.Thread(target=save_async, daemon=True)
-            thread.start()
+            # 메인 윈도우의 공용 이벤트 루프에서 저장과 전송을 한 작업으로 실행 (GUI 블로킹 방지)
+            self.main_window.run_async(self._save_and_publish_config(config_data), on_saved)
             
         except Exception as e:
             messagebox.showerror("오류", f"설정 저장 중 오류: {e}")
     
-    def validate_config_values(self, config_data):
-        """설정값 검증"""
+    def _collect_config_values(self) -> Dict[str, Any]:
+        """현재 임계값과 운전 모드 수집"""
+        config_data = {key: var.get() for key, var in self._threshold_vars.items()}
+        config_data['auto_mode_enabled'] = self.current_operation_mode.get() == 'auto'
+        return config_data
+    
+    def _schedule_save(self, var_name, index, mode):
+        """임계값 변경 기록 후 자동 저장 예약 (400ms 내 연속 변경은 한 번에 저장)"""
+        if self._autosave_suppressed or not self.db_config_loader:
+            return
+        
+        key = self._threshold_var_keys.get(var_name)
+        if key is not None:
+            try:
+                self._pending_changes[key] = self._threshold_vars[key].get()
+            except (tk.TclError, ValueError):
+                # 입력 중인 값이 아직 숫자가 아님 - 다음 변경에서 기록
+                return
+        
+        self._cancel_pending_save()
+        self._save_after_id = self.parent.after(400, self._flush_changes)
+    
+    def _cancel_pending_save(self):
+        """대기 중인 자동 저장 타이머 취소 (모인 변경 내역은 유지)"""
+        if self._save_after_id is not None:
+            self.parent.after_cancel(self._save_after_id)
+            self._save_after_id = None
+    
+    def _flush_changes(self):
+        """모인 임계값 변경을 전체 설정 하나로 저장 (DB 저장 후 MQTT 1회 전송)"""
+        self._save_after_id = None
+        if not self._pending_changes:
+            return
+        
+        changed = list(self._pending_changes)
+        self._pending_changes.clear()
+        
+        try:
+            config_data = self._collect_config_values()
+        except (tk.TclError, ValueError):
+            # 입력 중인 값이 숫자가 아니면 다음 변경 때 다시 시도
+            return
+        
+        # 자동 저장 중에는 대화상자 대신 로그와 상태 표시줄로 알림 (저장되지 않은 변경이 조용히 사라지지 않도록)
+        def reject(title, message):
+            self.logger.warning("⚠️ 임계값 자동 저장 취소: %s", message)
+            self.show_command_status(f"임계값 자동 저장 안 됨 - {message}")
+        
+        if not self.validate_config_values(config_data, fail=reject):
+            return
+        
+        def on_saved(future):
+            try:
+                db_success, mqtt_success = future.result()
+                if not db_success:
+                    self.logger.error("❌ 임계값 자동 저장 실패")
+                    self.show_command_status("임계값 자동 저장 실패")
+                elif mqtt_success:
+                    self.logger.debug("✅ 임계값 자동 저장 완료 (변경: %s)", ', '.join(changed))
+                    self.show_command_status("임계값이 자동 저장되고 시스템에 적용되었습니다")
+                else:
+                    self.logger.error("❌ 임계값 자동 저장 후 MQTT 전송 실패")
+                    self.show_command_status("임계값 DB 저장 완료 (MQTT 전송 실패)")
+            except Exception as e:
+                self.logger.error("❌ 임계값 자동 저장 중 오류: %s", e)
+                self.show_command_status(f"임계값 자동 저장 중 오류: {e}")
+        
+        self.main_window.run_async(self._save_and_publish_config(config_data), on_saved)
+    
+    def validate_config_values(self, config_data, fail=None):
+        """설정값 검증 (PMSMainWindow._VALIDATORS 규칙 사용)
+        
+        Args:
+            config_data: 검증할 설정값
+            fail: 실패 시 호출할 함수 (title, message) - 없으면 오류 대화상자 표시
+        """
+        if fail is None:
+            fail = messagebox.showerror
+        
         try:
-            # SOC 값들이 0-100 범위인지 확인
-            for key in ['soc_high_threshold', 'soc_low_threshold', 'soc_charge_stop_threshold']:
-                value = config_data[key]
-                if not (0 <= value <= 100):
-                    messagebox.showerror("입력 오류", f"{key}는 0-100 범위여야 합니다. (현재값: {value})")
+            for predicate, message in PMSMainWindow._VALIDATORS:
+                if not predicate(config_data):
+                    fail("입력 오류", message.format(**config_data))
                     return False
             
-            # SOC 임계값 논리 확인
-            if config_data['soc_low_threshold'] >= config_data['soc_high_threshold']:
-                messagebox.showerror("입력 오류", "SOC 하한 임계값은 상한 임계값보다 작아야 합니다.")
-                return False
-            
-            # DCDC 대기 시간과 충전 전력이 양수인지 확인
-            if config_data['dcdc_standby_time'] <= 0:
-                messagebox.showerror("입력 오류", "DCDC 대기 시간은 양수여야 합니다.")
-                return False
-                
-            if config_data['charging_power'] <= 0:
-                messagebox.showerror("입력 오류", "충전 전력은 양수여야 합니다.")
-                return False
-            
             return True
             
         except Exception as e:
-            messagebox.showerror("검증 오류", f"설정값 검증 중 오류: {e}")
+            fail("검증 오류", f"설정값 검증 중 오류: {e}")
             return False
     
+    async def _save_and_publish_config(self, config_data):
+        """DB 저장 후 성공 시 같은 작업에서 임계값 MQTT 전송
+        
+        Returns:
+            (DB 저장 성공 여부, MQTT 전송 성공 여부)
+        """
+        if not await self.db_config_loader.save_auto_mode_config(config_data):
+            return False, False
+        
+        self.logger.debug("✅ DB 저장 성공 - MQTT 전송 시작")
+        mqtt_message = self._build_threshold_message(config_data)
+        return True, await self.main_window.send_mqtt_control_command(TOPIC_THRESHOLD, mqtt_message)
+    
+    def _build_threshold_message(self, config_data):
+        """사용자 요구사항에 맞는 플랫 구조 임계값 MQTT 메시지 생성 (LOCATION 정보 포함)"""
+        mqtt_message = {
+            "soc_high_threshold": config_data.get('soc_high_threshold'),
+            "soc_low_threshold": config_data.get('soc_low_threshold'), 
+            "soc_charge_stop_threshold": config_data.get('soc_charge_stop_threshold'),
+            "dcdc_standby_time": config_data.get('dcdc_standby_time'),
+            "charging_power": config_data.get('charging_power'),
+            "location": self._device_location,
+            "timestamp": time.time_ns() // 1_000_000  # 밀리초 타임스탬프 (정수 연산)
+        }
+        
+        self.logger.debug("📤 MQTT 메시지 (플랫 구조): %s", mqtt_message)
+        return mqtt_message
+    
     def send_threshold_config_mqtt(self, config_data):
         """MQTT로 임계값 설정 전송"""
         try:
-            # 사용자 요구사항에 맞는 플랫 구조 MQTT 메시지 (LOCATION 정보 포함)
-            import time
-            device_location = self.main_window.config.get('database', {}).get('device_location', 'Unknown') if self.main_window else 'Unknown'
-            mqtt_message = {
-                "soc_high_threshold": config_data.get('soc_high_threshold'),
-                "soc_low_threshold": config_data.get('soc_low_threshold'), 
-                "soc_charge_stop_threshold": config_data.get('soc_charge_stop_threshold'),
-                "dcdc_standby_time": config_data.get('dcdc_standby_time'),
-                "charging_power": config_data.get('charging_power'),
-                "location": device_location,
-                "timestamp": int(time.time() * 1000)  # 밀리초 타임스탬프
-            }
-            
-            print(f"📤 MQTT 메시지 (플랫 구조):")
-            print(f"   📊 soc_high_threshold: {mqtt_message['soc_high_threshold']}")
-            print(f"   📊 soc_low_threshold: {mqtt_message['soc_low_threshold']}")
-            print(f"   📊 soc_charge_stop_threshold: {mqtt_message['soc_charge_stop_threshold']}")
-            print(f"   ⏱️ dcdc_standby_time: {mqtt_message['dcdc_standby_time']}")
-            print(f"   ⚡ charging_power: {mqtt_message['charging_power']}")
-            print(f"   🕐 timestamp: {mqtt_message['timestamp']}")
+            mqtt_message = self._build_threshold_message(config_data)
             
             # 임계값 설정 토픽
-            threshold_topic = "pms/control/threshold_config"
+            threshold_topic = TOPIC_THRESHOLD
             
-            # 비동기 MQTT 전송
-            def send_mqtt():
-                import asyncio
+            # 전송 완료 후 GUI 스레드에서 결과 출력
+            def on_sent(future):
                 try:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    if self.main_window and hasattr(self.main_window, 'send_mqtt_control_command_temp'):
-                        success = loop.run_until_complete(
-                            self.main_window.send_mqtt_control_command_temp(threshold_topic, mqtt_message)
-                        )
-                    else:
-                        success = False
-                    loop.close()
-                    
-                    if success:
-                        print(f"✅ 임계값 설정 MQTT 전송 완료: {threshold_topic}")
-                        print(f"📝 전송된 메시지: {mqtt_message}")
+                    if future.result():
+                        self.logger.debug("✅ 임계값 설정 MQTT 전송 완료: %s", threshold_topic)
                     else:
-                        print(f"❌ 임계값 설정 MQTT 전송 실패")
+                        self.logger.error("❌ 임계값 설정 MQTT 전송 실패")
                         
                 except Exception as e:
-                    print(f"❌ MQTT 전송 중 오류: {e}")
-                    import traceback
-                    print(f"📍 오류 상세: {traceback.format_exc()}")
+                    self.logger.error("❌ MQTT 전송 중 오류: %s", e)
             
-            # 별도 스레드에서 실행
-            import threading
-            thread = threading.Thread(target=send_mqtt, daemon=True)
-            thread.start()
+            # 메인 윈도우의 공용 이벤트 루프에서 전송
+            self.main_window.run_async(
+                self.main_window.send_mqtt_control_command(threshold_topic, mqtt_message), on_sent
+            )
             
         except Exception as e:
-            print(f"❌ MQTT 메시지 구성 중 오류: {e}")
-            import traceback
-            print(f"📍 오류 상세: {traceback.format_exc()}")
+            self.logger.exception("❌ MQTT 메시지 구성 중 오류: %s", e)
     
-    def set_manual_mode(self):
-        """수동 운전 모드 설정"""
+    def _send_mode_command(self, topic, payload, label, success_text, on_success=None):
+        """운전 모드 제어 메시지 전송 (성공은 상태 줄, 실패만 메시지 박스로 표시)
+        
+        Args:
+            topic: MQTT 토픽
+            payload: 명령별 필드 (_msg_template의 공통 필드와 timestamp는 자동 추가)
+            label: 오류 메시지에 사용할 명령 이름 (예: "수동 모드 설정")
+            success_text: 전송 성공 시 상태 줄에 표시할 메시지
+            on_success: 전송 성공 시 GUI 스레드에서 호출할 함수
+        """
         try:
             # MQTT 메시지 구성 (LOCATION 정보 포함)
-            device_location = self.main_window.config.get('database', {}).get('device_location', 'Unknown') if self.main_window else 'Unknown'
-            message = {
-                "mode": "basic",
-                "location": device_location,
-                "timestamp": datetime.now().isoformat(),
-                "source": "gui_pcs_control_panel"
-            }
+            message = {**self._msg_template, **payload, "timestamp": datetime.now().isoformat()}
             
-            # 운전 모드 변경 토픽
-            mode_topic = "pms/control/operation_mode"
-            
-            # 비동기 MQTT 전송
-            def send_mode_change():
-                import asyncio
+            # 전송 완료 후 GUI 스레드에서 결과 반영
+            def on_sent(future):
                 try:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    if self.main_window and hasattr(self.main_window, 'send_mqtt_control_command_temp'):
-                        success = loop.run_until_complete(
-                            self.main_window.send_mqtt_control_command_temp(mode_topic, message)
-                        )
-                    else:
-                        success = False
-                    loop.close()
-                    
-                    if success:
-                        self.current_operation_mode.set("manual")
-                        self.current_mode_label.config(text="수동 모드", foreground='blue')
-                        messagebox.showinfo("모드 변경", "수동 운전 모드로 변경되었습니다.")
+                    if future.result():
+                        if on_success is not None:
+                            on_success()
+                        self.show_command_status(success_text)
                     else:
-                        messagebox.showerror("오류", "수동 모드 설정 MQTT 전송에 실패했습니다.")
+                        messagebox.showerror("오류", f"{label} MQTT 전송에 실패했습니다.")
                         
                 except Exception as e:
-                    messagebox.showerror("오류", f"수동 모드 설정 중 오류: {e}")
+                    messagebox.showerror("오류", f"{label} 중 오류: {e}")
             
-            # 별도 스레드에서 실행
-            import threading
-            thread = threading.Thread(target=send_mode_change, daemon=True)
-            thread.start()
+            # 메인 윈도우의 공용 이벤트 루프에서 전송 (GUI 블로킹 방지)
+            self.main_window.run_async(
+                self.main_window.send_mqtt_control_command(topic, message), on_sent
+            )
             
         except Exception as e:
-            messagebox.showerror("오류", f"수동 모드 설정 실패: {e}")
+            messagebox.showerror("오류", f"{label} 실패: {e}")
+    
+    def _apply_operation_mode(self, mode):
+        """운전 모드 변수와 모드 라벨 반영"""
+        self.current_operation_mode.set(mode)
+        if self.current_mode_label is not None:
+            if mode == "auto":
+                self.current_mode_label.config(text="자동 모드", foreground='green')
+            else:
+                self.current_mode_label.config(text="수동 모드", foreground='blue')
+    
+    def set_manual_mode(self):
+        """수동 운전 모드 설정"""
+        self._send_mode_command(TOPIC_MODE, {"mode": "basic"}, "수동 모드 설정",
+                                "수동 운전 모드로 변경되었습니다",
+                                on_success=lambda: self._apply_operation_mode("manual"))
     
     def set_auto_mode(self):
         """자동 운전 모드 설정"""
-        try:
-            # MQTT 메시지 구성 (LOCATION 정보 포함)
-            device_location = self.main_window.config.get('database', {}).get('device_location', 'Unknown') if self.main_window else 'Unknown'
-            message = {
-                "mode": "auto",
-                "location": device_location,
-                "timestamp": datetime.now().isoformat(),
-                "source": "gui_pcs_control_panel"
-            }
-            
-            # 운전 모드 변경 토픽
-            mode_topic = "pms/control/operation_mode"
-            
-            # 비동기 MQTT 전송
-            def send_mode_change():
-                import asyncio
-                try:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    if self.main_window and hasattr(self.main_window, 'send_mqtt_control_command_temp'):
-                        success = loop.run_until_complete(
-                            self.main_window.send_mqtt_control_command_temp(mode_topic, message)
-                        )
-                    else:
-                        success = False
-                    loop.close()
-                    
-                    if success:
-                        self.current_operation_mode.set("auto")
-                        self.current_mode_label.config(text="자동 모드", foreground='green')
-                        messagebox.showinfo("모드 변경", "자동 운전 모드로 변경되었습니다.")
-                    else:
-                        messagebox.showerror("오류", "자동 모드 설정 MQTT 전송에 실패했습니다.")
-                        
-                except Exception as e:
-                    messagebox.showerror("오류", f"자동 모드 설정 중 오류: {e}")
-            
-            # 별도 스레드에서 실행
-            import threading
-            thread = threading.Thread(target=send_mode_change, daemon=True)
-            thread.start()
-            
-        except Exception as e:
-            messagebox.showerror("오류", f"자동 모드 설정 실패: {e}")
+        self._send_mode_command(TOPIC_MODE, {"mode": "auto"}, "자동 모드 설정",
+                                "자동 운전 모드로 변경되었습니다",
+                                on_success=lambda: self._apply_operation_mode("auto"))
     
     def start_auto_mode(self):
         """자동 모드 시작"""
-        try:
-            # MQTT 메시지 구성 (LOCATION 정보 포함)
-            device_location = self.main_window.config.get('database', {}).get('device_location', 'Unknown') if self.main_window else 'Unknown'
-            message = {
-                "command": "auto_start",
-                "location": device_location,
-                "timestamp": datetime.now().isoformat(),
-                "source": "gui_pcs_control_panel"
-            }
-            
-            # 자동 모드 시작 토픽
-            start_topic = "pms/control/auto_mode/start"
-            
-            # 비동기 MQTT 전송
-            def send_auto_start():
-                import asyncio
-                try:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    if self.main_window and hasattr(self.main_window, 'send_mqtt_control_command_temp'):
-                        success = loop.run_until_complete(
-                            self.main_window.send_mqtt_control_command_temp(start_topic, message)
-                        )
-                    else:
-                        success = False
-                    loop.close()
-                    
-                    if success:
-                        messagebox.showinfo("자동 모드", "자동 운전 모드가 시작되었습니다.")
-                    else:
-                        messagebox.showerror("오류", "자동 모드 시작 MQTT 전송에 실패했습니다.")
-                        
-                except Exception as e:
-                    messagebox.showerror("오류", f"자동 모드 시작 중 오류: {e}")
-            
-            # 별도 스레드에서 실행
-            import threading
-            thread = threading.Thread(target=send_auto_start, daemon=True)
-            thread.start()
-            
-        except Exception as e:
-            messagebox.showerror("오류", f"자동 모드 시작 실패: {e}")
+        self._send_mode_command(TOPIC_AUTO_START, {"command": "auto_start"}, "자동 모드 시작",
+                                "자동 운전 모드가 시작되었습니다")
     
     def stop_auto_mode(self):
         """자동 모드 정지"""
-        try:
-            # MQTT 메시지 구성 (LOCATION 정보 포함)
-            device_location = self.main_window.config.get('database', {}).get('device_location', 'Unknown') if self.main_window else 'Unknown'
-            message = {
-                "command": "auto_stop",
-                "location": device_location,
-                "timestamp": datetime.now().isoformat(),
-                "source": "gui_pcs_control_panel"
-            }
-            
-            # 자동 모드 정지 토픽
-            stop_topic = "pms/control/auto_mode/stop"
-            
-            # 비동기 MQTT 전송
-            def send_auto_stop():
-                import asyncio
-                try:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    if self.main_window and hasattr(self.main_window, 'send_mqtt_control_command_temp'):
-                        success = loop.run_until_complete(
-                            self.main_window.send_mqtt_control_command_temp(stop_topic, message)
-                        )
-                    else:
-                        success = False
-                    loop.close()
-                    
-                    if success:
-                        messagebox.showinfo("자동 모드", "자동 운전 모드가 정지되었습니다.")
-                    else:
-                        messagebox.showerror("오류", "자동 모드 정지 MQTT 전송에 실패했습니다.")
-                        
-                except Exception as e:
-                    messagebox.showerror("오류", f"자동 모드 정지 중 오류: {e}")
-            
-            # 별도 스레드에서 실행
-            import threading
-            thread = threading.Thread(target=send_auto_stop, daemon=True)
-            thread.start()
-            
-        except Exception as e:
-            messagebox.showerror("오류", f"자동 모드 정지 실패: {e}")
+        self._send_mode_command(TOPIC_AUTO_STOP, {"command": "auto_stop"}, "자동 모드 정지",
+                                "자동 운전 모드가 정지되었습니다")
     
     def pcs_start(self):
         """PCS 시작 (pcs_map.json 설정 사용)"""
@@ -3047,8 +3040,9 @@ class PCSTab(DeviceTab):
         """비상 정지"""
         result = messagebox.askyesno("확인", f"{self.device_name} 비상 정지를 실행하시겠습니까?")
         if result:
-            # 비상 정지 명령 (주소 20에 값 85 전송)
+            # 비상 정지 명령 (주소 20에 값 85 전송, 묶음 대기 없이 즉시 전송)
             self.write_modbus_register(20, 85, "비상 정지")
+            self.flush_modbus_writes()
 
 
 
@@ -3169,76 +3163,39 @@ class PCSTab(DeviceTab):
             messagebox.showerror("오류", f"BMS 제어 중 오류: {e}")
 
     def write_modbus_register(self, address, value, description):
-        """Modbus 레지스터 쓰기 - 임시 MQTT 연결을 통한 백그라운드 서버 제어"""
+        """Modbus 레지스터 쓰기 - 공용 MQTT 클라이언트를 통한 백그라운드 서버 제어"""
         try:
-            # 통합 모드에서는 임시 MQTT 연결을 통해 백그라운드 서버에 제어 명령 전송
+            # 통합 모드에서는 공용 MQTT 클라이언트로 백그라운드 서버에 제어 명령 전송
             if self.integrated_mode and self.main_window:
-                # 제어 명령 페이로드 생성
-                command_data = {
-                    "action": "write_register",
-                    "address": address,
-                    "value": value,
-                    "description": description,
-                    "timestamp": datetime.now().isoformat(),
-                    "gui_request_id": f"{self.device_name}_{address}_{int(time.time() * 1000000)}"
-                }
-                
-                # 임시 MQTT 연결을 통한 제어 명령 전송
-                control_topic = f"pms/control/{self.device_name}/command"
-                
-                # 비동기 임시 MQTT 전송 실행
-                def send_command():
-                    import asyncio
-                    try:
-                        # 새 이벤트 루프에서 실행
-                        loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop)
-                        if self.main_window and hasattr(self.main_window, 'send_mqtt_control_command_temp'):
-                            success = loop.run_until_complete(
-                                self.main_window.send_mqtt_control_command_temp(control_topic, command_data)
-                            )
-                        else:
-                            success = False
-                        loop.close()
-                        
-                        if success:
-                            messagebox.showinfo("제어 명령", f"{description} 명령을 백그라운드 서버로 전송했습니다.\n주소: {address}, 값: 0x{value:04X}")
-                        else:
-                            messagebox.showerror("오류", "MQTT 제어 명령 전송에 실패했습니다.")
-                    except Exception as e:
-                        messagebox.showerror("오류", f"제어 명령 전송 중 오류: {e}")
-                
-                # 별도 스레드에서 실행 (GUI 블로킹 방지)
-                import threading
-                thread = threading.Thread(target=send_command, daemon=True)
-                thread.start()
-                
+                # 짧은 시간 안의 연속 쓰기는 하나의 제어 메시지로 묶어 전송
+                self.queue_modbus_write(address, value, description)
             else:
                 # 독립 모드에서는 시뮬레이션
-                messagebox.showinfo("독립모드", f"{description} 명령 전송 (시뮬레이션)\n주소: {address}, 값: 0x{value:04X}")
+                self.show_command_status(f"{description} 명령 전송 (독립모드 시뮬레이션, 주소: {address}, 값: 0x{value:04X})")
         except Exception as e:
             messagebox.showerror("오류", f"{description} 실행 중 오류: {e}")
     
     def _execute_async_write(self, handler, address, value, description):
         """비동기 쓰기 작업 실행"""
         try:
-            # 메인 루프에서 실행되는 비동기 작업
-            main_window = self.parent.master
-            if hasattr(main_window, 'loop') and main_window.loop:
+            # 메인 윈도우의 공용 이벤트 루프에서 실행되는 비동기 작업
+            main_window = self.main_window
+            if main_window is not None and main_window.loop:
                 # 레지스터 이름 찾기 (주소 -> 레지스터 이름 매핑)
                 register_name = self._find_pcs_register_name_by_address(address)
                 if register_name:
+                    # 완료 후 GUI 스레드에서 결과 표시 (Tk 스레드에서 future 대기 금지)
+                    def on_done(future):
+                        try:
+                            if future.result():
+                                self.show_command_status(f"{description} 명령 전송 성공 (주소: {address}, 값: {value})")
+                            else:
+                                messagebox.showerror("실패", f"{description} 명령 전송에 실패했습니다.")
+                        except Exception as e:
+                            messagebox.showerror("오류", f"비동기 쓰기 실행 중 오류: {e}")
+                    
                     # 비동기 쓰기 작업 스케줄링
-                    future = asyncio.run_coroutine_threadsafe(
-                        handler.write_register(register_name, value), 
-                        main_window.loop
-                    )
-                    # 결과 확인 (타임아웃 설정)
-                    result = future.result(timeout=5)
-                    if result:
-                        messagebox.showinfo("성공", f"{description} 명령이 성공적으로 전송되었습니다.\n주소: {address}, 값: {value}")
-                    else:
-                        messagebox.showerror("실패", f"{description} 명령 전송에 실패했습니다.")
+                    main_window.run_async(handler.write_register(register_name, value), on_done)
                 else:
                     messagebox.showerror("오류", f"주소 {address}에 해당하는 레지스터를 찾을 수 없습니다.")
             else:
@@ -3247,21 +3204,9 @@ class PCSTab(DeviceTab):
             messagebox.showerror("오류", f"비동기 쓰기 실행 중 오류: {e}")
     
     def _find_pcs_register_name_by_address(self, address):
-        """주소로부터 PCS 레지스터 이름 찾기"""
+        """주소로부터 PCS 레지스터 이름 찾기 (맵 로드 시 1회 생성한 주소 인덱스 사용)"""
         try:
-            # PCS 메모리 맵에서 주소로 레지스터 이름 찾기
-            memory_map = self._get_pcs_memory_map()
-            
-            # 모든 섹션에서 검색
-            sections = ['parameter_registers', 'metering_registers', 'ups_registers', 'control_registers']
-            
-            for section in sections:
-                section_data = memory_map.get(section, {})
-                for register_name, register_info in section_data.items():
-                    if register_info.get('address') == address:
-                        return register_name
-            
-            return None
+            return _memory_map_address_index('pcs_map.json', self._PCS_SECTIONS).get(address)
         except Exception as e:
             print(f"PCS 레지스터 이름 검색 오류: {e}")
             return None
@@ -3269,7 +3214,7 @@ class PCSTab(DeviceTab):
     def update_data(self):
         """PCS 데이터 업데이트"""
         # 통합 모드에서는 데이터 매니저에서 데이터 가져오기
-        if hasattr(self, 'integrated_mode') and self.integrated_mode and data_manager is not None:
+        if self.integrated_mode and data_manager is not None:
             device_status = data_manager.get_device_status(self.device_name)
             device_data = data_manager.get_device_data(self.device_name)
             
@@ -3287,8 +3232,9 @@ class PCSTab(DeviceTab):
             else:
                 self.connection_label.config(text="연결 상태: 확인중", style='Status.TLabel')
             
-            # 실시간 데이터 표시
-            self.update_data_display(device_data)
+            # 실시간 데이터 표시 (숨겨진 탭은 갱신 생략)
+            if self.visible:
+                self.update_data_display(device_data)
         else:
             # 기존 로직 (독립 모드)
             if not self.device_handler:
@@ -3302,8 +3248,9 @@ class PCSTab(DeviceTab):
                 else:
                     self.connection_label.config(text="연결 상태: 연결안됨", style='Disconnected.TLabel')
                 
-                # 실제 데이터 읽기 시도
-                self.update_real_data()
+                # 실제 데이터 읽기 시도 (숨겨진 탭은 갱신 생략)
+                if self.visible:
+                    self.update_real_data()
                 
             except Exception as e:
                 print(f"PCS 데이터 업데이트 오류: {e}")
@@ -3311,9 +3258,8 @@ class PCSTab(DeviceTab):
     
     def update_data_display(self, device_data):
         """데이터 표시 영역 업데이트"""
-        # 기존 데이터 클리어
-        for item in self.data_tree.get_children():
-            self.data_tree.delete(item)
+        # 표시할 행 수집 후 한 번에 반영
+        rows = []
         
         if device_data:
             try:
@@ -3322,104 +3268,86 @@ class PCSTab(DeviceTab):
                 if timestamp:
                     if isinstance(timestamp, str):
                         try:
-                            timestamp = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+                            timestamp = self._parse_timestamp(timestamp)
                         except:
                             timestamp = datetime.now()
                     
-                    age_seconds = (datetime.now() - timestamp).total_seconds()
+                    age_seconds = self._data_age_seconds(device_data, timestamp)
                     if age_seconds > 300:  # 5분 초과
-                        self.data_tree.insert('', tk.END, values=(
+                        rows.append((
                             '-', 'status', '데이터 오래됨', '', f'{age_seconds:.0f}초 전 데이터'
                         ))
+                        self.render_rows(rows)
                         return
                 
                 # 실제 데이터 표시
                 data = device_data.get('data', {})
                 
                 # 장비 정보 표시
-                self.data_tree.insert('', tk.END, values=(
+                rows.append((
                     '-', 'device_name', data.get('device_name', 'N/A'), '', '장비 이름'
                 ))
-                self.data_tree.insert('', tk.END, values=(
+                rows.append((
                     '-', 'device_type', data.get('device_type', 'N/A'), '', '장비 타입'
                 ))
-                self.data_tree.insert('', tk.END, values=(
+                rows.append((
                     '-', 'ip_address', data.get('ip_address', 'N/A'), '', 'IP 주소'
                 ))
-                self.data_tree.insert('', tk.END, values=(
+                rows.append((
                     '-', 'timestamp', timestamp.strftime('%H:%M:%S') if timestamp else 'N/A', '', '업데이트 시간'
                 ))
                 
                 # PCS 특화 센서 데이터
                 sensor_data = data.get('data', {})
                 if sensor_data:
-                    # PCS 메모리 맵 정보 가져오기 시도
-                    memory_map = self._get_pcs_memory_map()
+                    # PCS 메모리 맵 키 인덱스 (갱신마다 1회 조회)
+                    key_index = self._get_pcs_key_index()
                     
                     for key, value in sensor_data.items():
                         # 메모리 맵에서 주소와 단위 정보 찾기
-                        addr_info = self._find_pcs_address_info(key, memory_map)
-                        address = addr_info.get('address', '-')
+                        addr_info = key_index.get(key, self._UNKNOWN_INFO)
+                        addr_display = addr_info['addr_display']
                         unit = addr_info.get('unit', '')
                         description = addr_info.get('description', 'PCS 센서 데이터')
                         
-                        # 16진수 주소 표시 (예: 0x0000)
-                        addr_display = f"0x{address:04X}" if isinstance(address, int) else str(address)
-                        
-                        self.data_tree.insert('', tk.END, values=(
-                            addr_display, key, str(value), unit, description
-                        ))
+                        rows.append((addr_display, key, str(value), unit, description))
                 else:
-                    self.data_tree.insert('', tk.END, values=(
+                    rows.append((
                         '-', 'info', 'PCS 데이터 로드 중', '', '잠시 기다려주세요'
                     ))
                     
             except Exception as e:
-                self.data_tree.insert('', tk.END, values=(
+                rows.append((
                     '-', 'error', '데이터 파싱 오류', '', str(e)
                 ))
         else:
-            self.data_tree.insert('', tk.END, values=(
+            rows.append((
                 '-', 'status', '데이터 없음', '', 'PCS에서 데이터를 읽어오는 중입니다'
             ))
+        
+        self.render_rows(rows)
     
     def _get_pcs_memory_map(self):
-        """PCS 메모리 맵 가져오기"""
+        """PCS 메모리 맵 가져오기 (파일 변경 시에만 다시 파싱)"""
         try:
-            import json
-            import os
-            
-            # PCS 맵 파일 경로
-            config_dir = os.path.join(os.path.dirname(__file__), '../../config')
-            pcs_map_path = os.path.join(config_dir, 'pcs_map.json')
-            
-            if os.path.exists(pcs_map_path):
-                with open(pcs_map_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            else:
-                print(f"PCS 맵 파일을 찾을 수 없습니다: {pcs_map_path}")
-                return {}
+            return _load_memory_map('pcs_map.json')
+        except FileNotFoundError as e:
+            print(f"PCS 맵 파일을 찾을 수 없습니다: {e.filename}")
+            return {}
         except Exception as e:
             print(f"PCS 메모리 맵 로드 오류: {e}")
             return {}
     
-    def _find_pcs_address_info(self, data_key, memory_map):
-        """데이터 키에 해당하는 주소 정보 찾기"""
+    def _get_pcs_key_index(self):
+        """데이터 키 -> 주소 정보 인덱스 가져오기 (맵 로드 시 1회 생성)"""
         try:
-            # 모든 섹션에서 검색
-            sections = ['parameter_registers', 'metering_registers', 'ups_registers', 'control_registers']
-            
-            for section in sections:
-                section_data = memory_map.get(section, {})
-                if data_key in section_data:
-                    return section_data[data_key]
-            
-            # 못 찾은 경우 기본값 반환
-            return {'address': '-', 'unit': '', 'description': '알 수 없는 PCS 데이터'}
-            
+            return _memory_map_key_index('pcs_map.json', self._PCS_SECTIONS)
+        except FileNotFoundError as e:
+            print(f"PCS 맵 파일을 찾을 수 없습니다: {e.filename}")
+            return {}
         except Exception as e:
-            print(f"PCS 주소 정보 검색 오류: {e}")
-            return {'address': '-', 'unit': '', 'description': '오류'}
+            print(f"PCS 주소 정보 인덱스 생성 오류: {e}")
+            return {}
     
     def get_unit_for_param(self, param):
         """파라미터별 단위 반환 (기존 코드와 호환성 유지)"""
@@ -3440,49 +3368,6 @@ class PCSTab(DeviceTab):
         }
         return units.get(param, '')
     
-    def update_real_data(self):
-        """실제 장비 데이터 업데이트"""
-        if not self.device_handler:
-            return
-        
-        # 기존 데이터 클리어
-        for item in self.data_tree.get_children():
-            self.data_tree.delete(item)
-        
-        try:
-            # 장비 핸들러의 상태 정보 표시
-            status_info = self.device_handler.get_status()
-            
-            self.data_tree.insert('', tk.END, values=(
-                '-', 'device_name', status_info['name'], '', '장비 이름'
-            ))
-            self.data_tree.insert('', tk.END, values=(
-                '-', 'device_type', status_info['type'], '', '장비 타입'
-            ))
-            self.data_tree.insert('', tk.END, values=(
-                '-', 'ip_address', status_info['ip'], '', 'IP 주소'
-            ))
-            self.data_tree.insert('', tk.END, values=(
-                '-', 'port', str(status_info['port']), '', 'Modbus 포트'
-            ))
-            self.data_tree.insert('', tk.END, values=(
-                '-', 'connected', '예' if status_info['connected'] else '아니오', '', '연결 상태'
-            ))
-            
-            if status_info['last_successful_read']:
-                self.data_tree.insert('', tk.END, values=(
-                    '-', 'last_read', status_info['last_successful_read'], '', '마지막 읽기 시간'
-                ))
-            
-            self.data_tree.insert('', tk.END, values=(
-                '-', 'poll_interval', f"{status_info['poll_interval']}", 's', '폴링 주기'
-            ))
-            
-        except Exception as e:
-            self.data_tree.insert('', tk.END, values=(
-                '-', 'error', str(e), '', '데이터 읽기 오류'
-            ))
-    
     def read_data(self):
         """데이터 읽기"""
         messagebox.showinfo("정보", f"{self.device_name} PCS 데이터 읽기 요청")
@@ -3524,27 +3409,22 @@ class PCSTab(DeviceTab):
     def _execute_async_handler_method(self, handler_method, param, description):
         """핸들러 메소드 비동기 실행"""
         try:
-            # 메인 루프에서 실행되는 비동기 작업
-            main_window = self.parent.master
-            if hasattr(main_window, 'loop') and main_window.loop:
-                # 파라미터 여부에 따라 다르게 호출
-                if param is not None:
-                    future = asyncio.run_coroutine_threadsafe(
-                        handler_method(param), 
-                        main_window.loop
-                    )
-                else:
-                    future = asyncio.run_coroutine_threadsafe(
-                        handler_method(), 
-                        main_window.loop
-                    )
+            # 메인 윈도우의 공용 이벤트 루프에서 실행되는 비동기 작업
+            main_window = self.main_window
+            if main_window is not None and main_window.loop:
+                # 완료 후 GUI 스레드에서 결과 표시 (Tk 스레드에서 future 대기 금지)
+                def on_done(future):
+                    try:
+                        if future.result():
+                            self.show_command_status(f"{description} 명령 실행 성공")
+                        else:
+                            messagebox.showerror("실패", f"{description} 명령 실행에 실패했습니다.")
+                    except Exception as e:
+                        messagebox.showerror("오류", f"{description} 실행 중 오류: {e}")
                 
-                # 결과 확인 (타임아웃 설정)
-                result = future.result(timeout=5)
-                if result:
-                    messagebox.showinfo("성공", f"{description} 명령이 성공적으로 실행되었습니다.")
-                else:
-                    messagebox.showerror("실패", f"{description} 명령 실행에 실패했습니다.")
+                # 파라미터 여부에 따라 다르게 호출
+                coro = handler_method(param) if param is not None else handler_method()
+                main_window.run_async(coro, on_done)
             else:
                 messagebox.showwarning("경고", "비동기 루프가 실행되지 않았습니다.")
         except Exception as e:
@@ -3552,28 +3432,25 @@ class PCSTab(DeviceTab):
     
     def start_db_monitoring(self):
         """DB 변경사항 실시간 모니터링 시작"""
+        # 모니터링 스레드는 탭당 1개만 실행
+        if self._db_monitoring_started:
+            return
+        self._db_monitoring_started = True
+        
         def monitor_db_changes():
             """DB 변경사항을 주기적으로 체크하는 함수"""
-            import asyncio
-            import threading
-            import time
-            
             while self.db_monitor_active:
                 try:
-                    # 10초마다 DB 체크
-                    time.sleep(10)
-                    
-                    if not self.db_monitor_active:
+                    # 10초마다 DB 체크 (중지 요청 시 대기 중에도 즉시 종료)
+                    if self._db_monitor_stop.wait(10) or not self.db_monitor_active:
                         break
                     
                     # DB에서 최신 설정 가져오기
                     if not self.db_config_loader:
                         break
                     
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    config = loop.run_until_complete(self.db_config_loader.load_auto_mode_config())
-                    loop.close()
+                    # 메인 윈도우의 공용 이벤트 루프에서 조회 (모니터링 스레드에서만 대기)
+                    config = self.main_window.run_async(self.db_config_loader.load_auto_mode_config()).result(timeout=10)
                     
                     if config:
                         # DB 업데이트 시간 체크
@@ -3582,11 +3459,11 @@ class PCSTab(DeviceTab):
                             # 첫 번째 로드이거나 새로운 업데이트가 있는지 확인
                             if self.last_db_update_time is None:
                                 # 첫 번째 로드 - 변경사항으로 인식하지 않음
-                                print(f"ℹ️ DB 초기 설정 로드: {db_updated_at}")
+                                self.logger.debug("ℹ️ DB 초기 설정 로드: %s", db_updated_at)
                                 self.last_db_update_time = db_updated_at
                             elif db_updated_at > self.last_db_update_time:
                                 # 실제 변경사항 감지
-                                print(f"🔔 DB 변경사항 감지! 업데이트 시간: {db_updated_at}")
+                                self.logger.info("🔔 DB 변경사항 감지! 업데이트 시간: %s", db_updated_at)
                                 # 메인 스레드에서 GUI 업데이트 실행
                                 self.parent.after(0, lambda: self.update_gui_from_db_changes(config))
                                 self.last_db_update_time = db_updated_at
@@ -3595,76 +3472,58 @@ class PCSTab(DeviceTab):
                                 self.last_db_update_time = db_updated_at
                         
                 except Exception as e:
-                    print(f"⚠️ DB 모니터링 중 오류: {e}")
-                    time.sleep(5)  # 에러 시 5초 후 재시도
+                    self.logger.warning("⚠️ DB 모니터링 중 오류: %s", e)
+                    if self._db_monitor_stop.wait(5):  # 에러 시 5초 후 재시도
+                        break
             
-            print("🛑 DB 모니터링 종료")
+            self.logger.debug("🛑 DB 모니터링 종료")
         
         # DB 모니터링을 백그라운드 스레드에서 실행
-        import threading
         self.db_monitor_thread = threading.Thread(target=monitor_db_changes, daemon=True)
         self.db_monitor_thread.start()
-        print("🔔 DB 실시간 모니터링 시작 (10초 간격)")
+        self.logger.debug("🔔 DB 실시간 모니터링 시작 (10초 간격)")
     
     def update_gui_from_db_changes(self, config):
         """DB 변경사항을 GUI에 반영"""
         try:
-            print("🔄 DB 변경사항을 GUI에 반영 중...")
-            
-            # Variable 값들 업데이트
-            if config.get('soc_high_threshold') is not None:
-                self.soc_high_threshold.set(config['soc_high_threshold'])
-            if config.get('soc_low_threshold') is not None:
-                self.soc_low_threshold.set(config['soc_low_threshold'])
-            if config.get('soc_charge_stop_threshold') is not None:
-                self.soc_charge_stop_threshold.set(config['soc_charge_stop_threshold'])
-            if config.get('dcdc_standby_time') is not None:
-                self.dcdc_standby_time.set(config['dcdc_standby_time'])
-            if config.get('charging_power') is not None:
-                self.charging_power.set(config['charging_power'])
+            self.logger.debug("🔄 DB 변경사항을 GUI에 반영 중...")
+            
+            # Variable 값들 업데이트 (DB에서 온 값이므로 자동 저장하지 않음)
+            self._autosave_suppressed = True
+            try:
+                for key, var in self._threshold_vars.items():
+                    if config.get(key) is not None:
+                        var.set(config[key])
+            finally:
+                self._autosave_suppressed = False
             
             # 운전 모드 업데이트
             auto_mode_enabled = config.get('auto_mode_enabled', False)
             if auto_mode_enabled:
                 self.current_operation_mode.set("auto")
-                if hasattr(self, 'current_mode_label'):
+                if self.current_mode_label is not None:
                     self.current_mode_label.config(text="자동 모드", foreground='green')
             else:
                 self.current_operation_mode.set("manual")
-                if hasattr(self, 'current_mode_label'):
+                if self.current_mode_label is not None:
                     self.current_mode_label.config(text="수동 모드", foreground='blue')
             
-            # Entry 위젯들 직접 업데이트 (GUI가 생성된 경우)
-            if self.gui_components_created and hasattr(self, 'soc_high_entry'):
-                try:
-                    entry_updates = [
-                        (self.soc_high_entry, self.soc_high_threshold, "SOC 상한"),
-                        (self.soc_low_entry, self.soc_low_threshold, "SOC 하한"),
-                        (self.soc_charge_stop_entry, self.soc_charge_stop_threshold, "SOC 충전 정지"),
-                        (self.dcdc_standby_entry, self.dcdc_standby_time, "DCDC 대기시간"),
-                        (self.charging_power_entry, self.charging_power, "충전 전력")
-                    ]
-                    
-                    for entry, variable, name in entry_updates:
-                        if entry and variable:
-                            entry.delete(0, tk.END)
-                            entry.insert(0, str(variable.get()))
-                    
-                    print(f"✅ DB 변경사항 GUI 반영 완료")
-                    print(f"   📊 운전 모드: {'자동' if auto_mode_enabled else '수동'}")
-                    print(f"   📊 SOC 상한: {config.get('soc_high_threshold')}%")
-                    print(f"   📊 SOC 하한: {config.get('soc_low_threshold')}%")
-                    
-                except Exception as e:
-                    print(f"❌ Entry 위젯 업데이트 중 오류: {e}")
+            # 임계값 Entry는 변수 trace로 연결되어 있어 Variable.set()만으로 표시가 갱신됨
+            self.logger.debug("✅ DB 변경사항 GUI 반영 완료 (운전 모드: %s, SOC 상한: %s%%, SOC 하한: %s%%)",
+                              '자동' if auto_mode_enabled else '수동',
+                              config.get('soc_high_threshold'), config.get('soc_low_threshold'))
             
         except Exception as e:
-            print(f"❌ GUI DB 변경사항 반영 중 오류: {e}")
+            self.logger.error("❌ GUI DB 변경사항 반영 중 오류: %s", e)
     
     def stop_db_monitoring(self):
         """DB 모니터링 중지"""
         self.db_monitor_active = False
-        print("🛑 DB 모니터링 중지 요청")
+        self._db_monitor_stop.set()
+        self.logger.debug("🛑 DB 모니터링 중지 요청")
+
+
+PMSMainWindow._TAB_CLS = {'BMS': BMSTab, 'DCDC': DCDCTab, 'PCS': PCSTab}
 
 
 # 테스트 실행 코드